@@ -1,3 +1,5 @@
+import asyncio
+
 import discord
 from discord import Message
 from discord.ext import tasks
@@ -23,8 +25,9 @@ from src.bot.handlers import (
     EmailHandler,
     MailHandler,
 )
+from src.bot.handlers.mail import MAIL_PROVIDERS
 from src.utils.briefing_generator import generate_briefing
-from src.utils.email import check_new_mail
+from src.utils.email import check_new_mail, close_imap_sessions, close_smtp_sessions, has_credentials, watch_new_mail
 from datetime import datetime
 
 logger = setup_logger(__name__)
@@ -61,6 +64,9 @@ class PersonalAssistantBot(discord.Client):
 
         # State
         self.persona_setup = {}
+        self._mail_watchers: set[asyncio.Task] = set()
+        # Providers whose server lacks IMAP IDLE, checked by the check_mail loop
+        self._poll_providers: set[str] = set()
 
     async def setup_hook(self):
         """Called when the bot is starting up."""
@@ -78,8 +84,21 @@ class PersonalAssistantBot(discord.Client):
         self.check_briefing.start()
         logger.info("Briefing check loop started")
 
-        self.check_mail.start()
-        logger.info("Mail check loop started")
+        for provider in MAIL_PROVIDERS:
+            self._mail_watchers.add(asyncio.create_task(self._watch_mail(provider)))
+        logger.info("Mail IDLE watchers started")
+
+    async def close(self):
+        """Close open database, SMTP and IMAP connections before shutting down."""
+        for task in self._mail_watchers:
+            task.cancel()
+        # Let each watcher leave IDLE and log out before the connections below are closed
+        await asyncio.gather(*self._mail_watchers, return_exceptions=True)
+        self._mail_watchers.clear()
+        await self.db.close()
+        close_smtp_sessions()
+        close_imap_sessions()
+        await super().close()
 
     async def on_ready(self):
         logger.info(f"Bot is ready: {self.user}")
@@ -167,16 +186,36 @@ class PersonalAssistantBot(discord.Client):
     async def before_check_briefing(self):
         await self.wait_until_ready()
 
+    async def _watch_mail(self, provider: str):
+        """Notify on new mail via IMAP IDLE, or hand the provider to the polling loop."""
+        # An account that isn't configured has nothing to watch or poll
+        if not has_credentials(provider):
+            return
+        await self.wait_until_ready()
+        await watch_new_mail(provider, lambda: self._notify_new_mail((provider,)))
+        # watch_new_mail only returns when IDLE can't be used for this provider
+        logger.info(f"Falling back to mail polling for {provider}")
+        self._poll_providers.add(provider)
+        if not self.check_mail.is_running():
+            self.check_mail.start()
+
     @tasks.loop(minutes=30)
     async def check_mail(self):
-        """Check for new mail and notify enabled users."""
+        """Poll providers without IMAP IDLE support and notify enabled users."""
+        await self._notify_new_mail(tuple(self._poll_providers))
+
+    async def _notify_new_mail(self, providers: tuple[str, ...]):
+        """Check the given providers for new mail and DM users who enabled notifications."""
         try:
             enabled_users = await self.db.mail.get_all_enabled()
             if not enabled_users:
                 return
 
-            gmail_mails = await check_new_mail("gmail")
-            naver_mails = await check_new_mail("naver")
+            results = dict(zip(providers, await asyncio.gather(
+                *(check_new_mail(provider, new_only=True, store=self.db.mail) for provider in providers)
+            )))
+            gmail_mails = results.get("gmail", [])
+            naver_mails = results.get("naver", [])
 
             if not gmail_mails and not naver_mails:
                 return
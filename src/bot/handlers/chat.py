@@ -1,4 +1,10 @@
 import asyncio
+from itertools import islice
+
+try:
+    import hyperscan  # SIMD multi-pattern scanner (optional, x86 only)
+except ImportError:
+    hyperscan = None
 
 from discord import Message
 
@@ -16,12 +22,65 @@ from src.bot.tools.weather import WeatherTool
 from src.db import DB
 from src.llm.ollama_client import OllamaClient
 from src.utils.logger import setup_logger
-from src.utils.web import extract_urls, get_page_content
+from src.utils.regex import engine as _re
+from src.utils.web import extract_urls_iter, get_page_content
 
 logger = setup_logger(__name__)
 
 MAX_TOOL_ROUNDS = 3
 
+# The four tag-style tools fused into one alternation, so a plain reply is
+# scanned once instead of once per tool. The group names are the tool names;
+# each tool still parses its own captures.
+TOOL_CALL_TAGS = (
+    ("weather", WeatherTool.PATTERN),
+    ("exchange", ExchangeTool.PATTERN),
+    ("reminder", ReminderTool.PATTERN),
+    ("persona", PersonaTool.PATTERN),
+)
+TOOL_CALL_PATTERN = _re.compile("|".join(
+    f"(?P<{name}>{pattern.pattern})" for name, pattern in TOOL_CALL_TAGS
+))
+TOOL_CALL_NAMES = frozenset(TOOL_CALL_PATTERN.groupindex)
+
+
+def _build_tool_call_scanner():
+    """Compile the fused tags into a Hyperscan database, or None if unavailable."""
+    if hyperscan is None:
+        return None
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.pattern.encode() for _, pattern in TOOL_CALL_TAGS],
+            ids=list(range(len(TOOL_CALL_TAGS))),
+            elements=len(TOOL_CALL_TAGS),
+            flags=hyperscan.HS_FLAG_SINGLEMATCH,
+        )
+    except hyperscan.error as e:
+        logger.warning(f"Hyperscan unavailable, falling back to regex scan: {e}")
+        return None
+    return database
+
+
+_TOOL_CALL_SCANNER = _build_tool_call_scanner()
+
+
+def find_tool_calls(text: str) -> frozenset[str]:
+    """Return the names of the fused tools whose tag appears in the text."""
+    if _TOOL_CALL_SCANNER is None:
+        if TOOL_CALL_PATTERN.search(text) is None:
+            return frozenset()
+        return frozenset(name for name, pattern in TOOL_CALL_TAGS if pattern.search(text))
+
+    found = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        found.add(TOOL_CALL_TAGS[pattern_id][0])
+
+    # SINGLEMATCH reports each pattern at most once, so one pass yields the set
+    _TOOL_CALL_SCANNER.scan(text.encode(), match_event_handler=on_match)
+    return frozenset(found)
+
 
 class ChatHandler:
     """Handler for normal chat messages."""
@@ -45,7 +104,7 @@ class ChatHandler:
     async def handle(self, message: Message, user_id: str, user_content: str, persona: dict):
         """Handle normal chat with persona."""
         # If an email draft is pending, intercept confirm/cancel without going through LLM
-        email_tool = next((t for t in self.registry.tools if t.name == "email"), None)
+        email_tool = self.registry.get("email")
         if email_tool and user_id in email_tool._pending_drafts:
             lower = user_content.strip().lower()
             confirm_words = ("보내줘", "보내", "응", "확인", "네", "ㅇㅇ", "yes", "send")
@@ -55,9 +114,9 @@ class ChatHandler:
                 from src.utils.email import send_email
                 draft = email_tool._pending_drafts.pop(user_id)
                 logger.info(f"Email confirmed by user {user_id} (bypassing LLM)")
-                result = await send_email(draft["provider"], draft["to"], draft["subject"], draft["body"])
+                result = await send_email(draft.provider, draft.to, draft.subject, draft.body)
                 if result["success"]:
-                    response = f"✅ 이메일을 발송했습니다.\n- 수신: {draft['to']}\n- 제목: {draft['subject']}"
+                    response = f"✅ 이메일을 발송했습니다.\n- 수신: {draft.to}\n- 제목: {draft.subject}"
                 else:
                     response = f"❌ 이메일 발송 실패: {result['message']}"
                 await self.db.conversation.add_message(user_id, "user", user_content)
@@ -75,10 +134,9 @@ class ChatHandler:
 
         async with message.channel.typing():
             # Check for URLs and fetch content
-            urls = extract_urls(user_content)
             url_contents = []
 
-            for url in urls[:3]:
+            for url in islice(extract_urls_iter(user_content), 3):
                 content = await get_page_content(url)
                 if content:
                     if len(content) > 4000:
@@ -121,8 +179,13 @@ class ChatHandler:
                 tool_instructions=tool_instructions
             )
 
+            # Fused tools whose tag is absent cannot match, so skip their own scans
+            tagged = find_tool_calls(response)
+
             tool_result = None
             for tool in self.registry.tools:
+                if tool.name in TOOL_CALL_NAMES and tool.name not in tagged:
+                    continue
                 try:
                     raw = await tool.try_execute(response, context)
                 except Exception as e:
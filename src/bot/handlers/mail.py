@@ -1,5 +1,7 @@
 """Handler for /mail command."""
 
+import asyncio
+
 from discord import Message
 
 from src.db import DB
@@ -16,6 +18,15 @@ USAGE = (
     "- `/mail off` — 자동 알림 비활성화"
 )
 
+MAIL_PROVIDERS = ("gmail", "naver")
+
+
+def _mail_section(label: str, mails: list[dict]) -> str:
+    """Render one provider's mails as a labelled, numbered block."""
+    return "\n".join((label, *(
+        f"{i}. {m['from']} - {m['subject']} ({m['date']})" for i, m in enumerate(mails, 1)
+    )))
+
 
 class MailHandler:
     """Handler for /mail command."""
@@ -43,14 +54,18 @@ class MailHandler:
     async def _check_and_reply(self, message: Message, user_id: str):
         """Check unread mail for all providers and reply with results."""
         async with message.channel.typing():
+            # Providers are independent IMAP servers, so poll them concurrently
+            results = await asyncio.gather(
+                *(check_new_mail(provider) for provider in MAIL_PROVIDERS),
+                return_exceptions=True,
+            )
             sections = []
-            for provider in ("gmail", "naver"):
-                mails = await check_new_mail(provider)
+            for provider, mails in zip(MAIL_PROVIDERS, results):
+                if isinstance(mails, Exception):
+                    logger.warning(f"Mail check failed for {provider}: {mails}")
+                    continue
                 if mails:
-                    lines = [f"[{provider.upper()}]"]
-                    for i, m in enumerate(mails, 1):
-                        lines.append(f"{i}. {m['from']} - {m['subject']} ({m['date']})")
-                    sections.append("\n".join(lines))
+                    sections.append(_mail_section(f"[{provider.upper()}]", mails))
 
             if sections:
                 body = "\n\n".join(sections)
@@ -61,11 +76,9 @@ class MailHandler:
     @staticmethod
     def format_mail_notification(gmail_mails: list[dict], naver_mails: list[dict]) -> str:
         """Format mail notification message for DM."""
-        sections = []
-        for label, mails in (("[Gmail]", gmail_mails), ("[Naver]", naver_mails)):
-            if mails:
-                lines = [label]
-                for i, m in enumerate(mails, 1):
-                    lines.append(f"{i}. {m['from']} - {m['subject']} ({m['date']})")
-                sections.append("\n".join(lines))
+        sections = (
+            _mail_section(label, mails)
+            for label, mails in (("[Gmail]", gmail_mails), ("[Naver]", naver_mails))
+            if mails
+        )
         return "📬 새 메일이 도착했습니다!\n\n" + "\n\n".join(sections)
@@ -51,19 +51,31 @@ class Tool(ABC):
 class ToolRegistry:
     def __init__(self):
         self._tools: list[Tool] = []
+        self._by_name: dict[str, Tool] = {}
+        self._instructions_cache: str | None = None
 
     def register(self, tool: Tool):
         self._tools.append(tool)
+        # First registration wins, matching a front-to-back scan of tools
+        self._by_name.setdefault(tool.name, tool)
+        self._instructions_cache = None
+
+    def get(self, name: str) -> Tool | None:
+        """Look up a registered tool by name."""
+        return self._by_name.get(name)
 
     @property
-    def tools(self) -> list[Tool]:
-        return list(self._tools)
+    def tools(self) -> tuple[Tool, ...]:
+        return tuple(self._tools)
 
     def build_tool_instructions(self) -> str:
-        """Synthesize tool descriptions and rules into a system prompt string."""
+        """Synthesize tool descriptions and rules into a system prompt string.
+        Built once and reused until another tool is registered."""
+        if self._instructions_cache is not None:
+            return self._instructions_cache
         descriptions = "\n".join(t.description for t in self._tools)
         rules = "\n".join(t.usage_rules for t in self._tools if t.usage_rules)
-        return f"""
+        self._instructions_cache = f"""
 You have access to the following tools. When you need real-time information or to perform an action, use them by outputting the exact tag format.
 IMPORTANT: Output ONLY the tag with no other text when you use a tool.
 
@@ -75,3 +87,4 @@ Rules:
 {rules}
 - For translation requests ("번역해줘", "영어로", "translate this"), directly translate without using any tool tag. You have built-in multilingual capabilities.
 - Output ONLY the tool tag, nothing else. Do not add any explanation before or after the tag."""
+        return self._instructions_cache
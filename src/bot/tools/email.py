@@ -1,4 +1,5 @@
 import re
+from dataclasses import dataclass
 
 import src.config as config
 from src.bot.tools.base import Tool, ToolContext, ToolResult
@@ -7,16 +8,26 @@ from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-EMAIL_SEND_PATTERN = re.compile(r"\[EMAIL_SEND:([^\]]+)\]")
-EMAIL_CONFIRM_PATTERN = re.compile(r"\[EMAIL_CONFIRM\]")
-EMAIL_CANCEL_PATTERN = re.compile(r"\[EMAIL_CANCEL\]")
+# One alternation for all email tags; the named group says which tag matched
+EMAIL_TAG_PATTERN = re.compile(
+    r"\[EMAIL_(?:SEND:(?P<send>[^\]]+)|(?P<confirm>CONFIRM)|(?P<cancel>CANCEL))\]"
+)
+
+
+@dataclass(slots=True)
+class EmailDraft:
+    """An email waiting for the user's confirmation."""
+    provider: str
+    to: str
+    subject: str
+    body: str
 
 
 class EmailTool(Tool):
     """Tool for sending emails via SMTP with a 2-step confirmation flow."""
 
     def __init__(self):
-        self._pending_drafts: dict[str, dict] = {}
+        self._pending_drafts: dict[str, EmailDraft] = {}
 
     @property
     def name(self) -> str:
@@ -43,10 +54,19 @@ class EmailTool(Tool):
         )
 
     async def try_execute(self, response: str, context: ToolContext) -> "str | ToolResult | None":
+        # Every email tag starts with this literal; skip the regex scans when it's absent
+        if "[EMAIL_" not in response:
+            return None
+
+        # First match of each tag kind, from a single scan
+        found = {}
+        for match in EMAIL_TAG_PATTERN.finditer(response):
+            found.setdefault(match.lastgroup, match)
+
         # Try EMAIL_SEND
-        match = EMAIL_SEND_PATTERN.search(response)
+        match = found.get("send")
         if match:
-            raw = match.group(1)
+            raw = match.group("send")
             parts = raw.split("|", 3)
             if len(parts) < 4:
                 return ToolResult(
@@ -63,12 +83,9 @@ class EmailTool(Tool):
             if not provider:
                 provider = config.EMAIL_DEFAULT_PROVIDER
 
-            self._pending_drafts[context.user_id] = {
-                "provider": provider,
-                "to": to,
-                "subject": subject,
-                "body": body,
-            }
+            self._pending_drafts[context.user_id] = EmailDraft(
+                provider=provider, to=to, subject=subject, body=body
+            )
 
             logger.info(f"Email draft created for user {context.user_id} → {to}")
             preview = (
@@ -82,26 +99,24 @@ class EmailTool(Tool):
             return ToolResult(result=preview, stop_loop=True)
 
         # Try EMAIL_CONFIRM
-        match = EMAIL_CONFIRM_PATTERN.search(response)
-        if match:
+        if "confirm" in found:
             draft = self._pending_drafts.get(context.user_id)
             if not draft:
                 return "발송할 이메일 초안이 없습니다. 먼저 이메일 내용을 작성해주세요."
 
-            logger.info(f"Sending email for user {context.user_id} via {draft['provider']}")
+            logger.info(f"Sending email for user {context.user_id} via {draft.provider}")
             result = await send_email(
-                draft["provider"], draft["to"], draft["subject"], draft["body"]
+                draft.provider, draft.to, draft.subject, draft.body
             )
             del self._pending_drafts[context.user_id]
 
             if result["success"]:
-                return f"✅ 이메일을 발송했습니다.\n- 수신: {draft['to']}\n- 제목: {draft['subject']}"
+                return f"✅ 이메일을 발송했습니다.\n- 수신: {draft.to}\n- 제목: {draft.subject}"
             else:
                 return f"❌ 이메일 발송 실패: {result['message']}"
 
         # Try EMAIL_CANCEL
-        match = EMAIL_CANCEL_PATTERN.search(response)
-        if match:
+        if "cancel" in found:
             if context.user_id in self._pending_drafts:
                 del self._pending_drafts[context.user_id]
                 logger.info(f"Email draft cancelled for user {context.user_id}")
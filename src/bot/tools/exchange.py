@@ -1,9 +1,8 @@
-import re
-
 import aiohttp
 
 from src.bot.tools.base import Tool, ToolContext
 from src.utils.logger import setup_logger
+from src.utils.regex import engine as _re
 
 logger = setup_logger(__name__)
 
@@ -19,7 +18,7 @@ CURRENCY_NAMES = {
 
 
 class ExchangeTool(Tool):
-    PATTERN = re.compile(r"\[EXCHANGE:(.+?),(.+?),(.+?)\]")
+    PATTERN = _re.compile(r"\[EXCHANGE:(.+?),(.+?),(.+?)\]")
 
     @property
     def name(self) -> str:
@@ -1,5 +1,9 @@
+import fnmatch
+import os
 import re
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
 from src.bot.tools.base import Tool, ToolContext
@@ -9,10 +13,27 @@ logger = setup_logger(__name__)
 
 ALLOWED_ROOT = "/Volumes/ssd"
 
-FS_LS_PATTERN = re.compile(r"\[FS_LS:([^\]]+)\]")
-FS_READ_PATTERN = re.compile(r"\[FS_READ:([^\]]+)\]")
-FS_FIND_PATTERN = re.compile(r"\[FS_FIND:([^\]]+)\]")
-FS_INFO_PATTERN = re.compile(r"\[FS_INFO:([^\]]+)\]")
+# All FS tags in one pattern. The lookahead makes every match zero-width, so
+# finditer also reports tags that start inside another tag's argument.
+FS_TAG_PATTERN = re.compile(r"(?=\[FS_(LS|READ|FIND|INFO):([^\]]+)\])")
+
+
+@lru_cache(maxsize=4)
+def _resolve_root(root: str) -> Path:
+    """Resolve the allowed root once; keyed by value so a patched root still works."""
+    return Path(root).resolve()
+
+
+@lru_cache(maxsize=4)
+def _usage_rules(root: str) -> str:
+    """Render the usage rules once per allowed root."""
+    return (
+        f"- For filesystem, detect when the user asks about files or directories "
+        f"(\"파일 뭐 있어?\", \"폴더 보여줘\", \"읽어줘\", \"찾아줘\", \"정보 알려줘\"). "
+        f"All paths must start with {root}. "
+        f"If the user says 'workspace', use {root}/workspace. "
+        f"Never access paths outside {root}."
+    )
 
 
 class FileSystemTool(Tool):
@@ -25,7 +46,7 @@ class FileSystemTool(Tool):
     def description(self) -> str:
         return (
             "- FileSystem: When the user wants to browse, read, search, or inspect files/directories, use these tags:\n"
-            f"  - [FS_LS:<path>] - List directory contents (e.g. [FS_LS:/Volumes/ssd/workspace])\n"
+            "  - [FS_LS:<path>] - List directory contents (e.g. [FS_LS:/Volumes/ssd/workspace])\n"
             "  - [FS_READ:<path>] - Read file contents (e.g. [FS_READ:/Volumes/ssd/workspace/project/config.py])\n"
             "  - [FS_FIND:<pattern>] - Search files by glob pattern (e.g. [FS_FIND:*.pdf], [FS_FIND:config.py])\n"
             "  - [FS_INFO:<path>] - Get file or directory metadata (e.g. [FS_INFO:/Volumes/ssd/workspace/bot.log])"
@@ -33,18 +54,13 @@ class FileSystemTool(Tool):
 
     @property
     def usage_rules(self) -> str:
-        return (
-            f"- For filesystem, detect when the user asks about files or directories "
-            f"(\"파일 뭐 있어?\", \"폴더 보여줘\", \"읽어줘\", \"찾아줘\", \"정보 알려줘\"). "
-            f"All paths must start with {ALLOWED_ROOT}. "
-            f"If the user says 'workspace', use {ALLOWED_ROOT}/workspace. "
-            f"Never access paths outside {ALLOWED_ROOT}."
-        )
+        return _usage_rules(ALLOWED_ROOT)
 
     def _validate_path(self, path_str: str) -> Path | None:
         try:
             path = Path(path_str).expanduser().resolve()
-            if not str(path).startswith(ALLOWED_ROOT):
+            # Component-wise check, so /Volumes/ssd2 is not under /Volumes/ssd
+            if not path.is_relative_to(_resolve_root(ALLOWED_ROOT)):
                 return None
             return path
         except Exception:
@@ -64,7 +80,9 @@ class FileSystemTool(Tool):
         if not path.is_dir():
             return "디렉터리가 아니거나 존재하지 않음"
         try:
-            entries = sorted(path.iterdir())
+            # DirEntry caches the type from readdir, so is_dir() costs no extra stat
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda e: e.name)
             if not entries:
                 return f"{path} - 비어 있음"
             lines = [f"디렉터리: {path}\n"]
@@ -96,17 +114,35 @@ class FileSystemTool(Tool):
         except Exception as e:
             return f"읽기 실패: {str(e)}"
 
+    def _iter_matches(self, root: str, pattern: str):
+        """Yield (path, is_dir) for entries under root matching pattern, with rglob semantics."""
+        if "/" in pattern:
+            # Segments like "src/*.py" or "**/config.py" need rglob's per-part
+            # matching; it is lazy too, so the caller's islice still stops it early.
+            # ".." would climb out of root, so such patterns match nothing.
+            if ".." in pattern.split("/"):
+                return
+            for path in Path(root).rglob(pattern):
+                yield str(path), path.is_dir()
+            return
+        # fnmatch.filter matches each directory's name list in one call, and
+        # os.walk already knows which names are directories
+        for dirpath, dirnames, filenames in os.walk(root):
+            for name in fnmatch.filter(dirnames, pattern):
+                yield os.path.join(dirpath, name), True
+            for name in fnmatch.filter(filenames, pattern):
+                yield os.path.join(dirpath, name), False
+
     def _find_file(self, pattern: str) -> str:
         if not pattern:
             return "검색 패턴이 필요합니다."
-        root = Path(ALLOWED_ROOT)
         try:
-            matches = list(root.rglob(pattern))[:20]
+            matches = list(islice(self._iter_matches(ALLOWED_ROOT, pattern), 20))
             if not matches:
                 return f"{pattern} - 검색 결과 없음"
             lines = [f"검색: {pattern}\n"]
-            for m in matches:
-                kind = "[DIR]" if m.is_dir() else "[FILE]"
+            for m, is_dir in matches:
+                kind = "[DIR]" if is_dir else "[FILE]"
                 lines.append(f"{kind} {m}")
             if len(matches) == 20:
                 lines.append("...외 다수")
@@ -141,31 +177,36 @@ class FileSystemTool(Tool):
         return info
 
     async def try_execute(self, response: str, context: ToolContext) -> str | None:
+        # Every filesystem tag starts with this literal; skip the regex scans when it's absent
+        if "[FS_" not in response:
+            return None
+
+        # First argument of each tag kind, from a single scan
+        found = {}
+        for match in FS_TAG_PATTERN.finditer(response):
+            found.setdefault(match.group(1), match.group(2).strip())
+
         # Try FS_LS
-        match = FS_LS_PATTERN.search(response)
-        if match:
-            path_arg = match.group(1).strip()
+        if "LS" in found:
+            path_arg = found["LS"]
             logger.info(f"Tool called: [FS_LS:{path_arg}]")
             return self._list_dir(path_arg)
 
         # Try FS_READ
-        match = FS_READ_PATTERN.search(response)
-        if match:
-            path_arg = match.group(1).strip()
+        if "READ" in found:
+            path_arg = found["READ"]
             logger.info(f"Tool called: [FS_READ:{path_arg}]")
             return self._read_file(path_arg)
 
         # Try FS_FIND
-        match = FS_FIND_PATTERN.search(response)
-        if match:
-            pattern = match.group(1).strip()
+        if "FIND" in found:
+            pattern = found["FIND"]
             logger.info(f"Tool called: [FS_FIND:{pattern}]")
             return self._find_file(pattern)
 
         # Try FS_INFO
-        match = FS_INFO_PATTERN.search(response)
-        if match:
-            path_arg = match.group(1).strip()
+        if "INFO" in found:
+            path_arg = found["INFO"]
             logger.info(f"Tool called: [FS_INFO:{path_arg}]")
             return self._file_info(path_arg)
 
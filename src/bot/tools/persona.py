@@ -1,13 +1,12 @@
-import re
-
 from src.bot.tools.base import Tool, ToolContext
 from src.utils.logger import setup_logger
+from src.utils.regex import engine as _re
 
 logger = setup_logger(__name__)
 
 
 class PersonaTool(Tool):
-    PATTERN = re.compile(r"\[PERSONA:(.+?),(.+?),(.+?)\]")
+    PATTERN = _re.compile(r"\[PERSONA:(.+?),(.+?),(.+?)\]")
 
     @property
     def name(self) -> str:
@@ -1,14 +1,13 @@
-import re
-
 from src.bot.tools.base import Tool, ToolContext
 from src.utils.logger import setup_logger
+from src.utils.regex import engine as _re
 from src.utils.time_parser import parse_time, format_datetime
 
 logger = setup_logger(__name__)
 
 
 class ReminderTool(Tool):
-    PATTERN = re.compile(r"\[REMINDER:(.+?),(.+)\]")
+    PATTERN = _re.compile(r"\[REMINDER:(.+?),(.+)\]")
 
     @property
     def name(self) -> str:
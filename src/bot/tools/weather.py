@@ -1,14 +1,13 @@
-import re
-
 from src.bot.tools.base import Tool, ToolContext
 from src.utils.logger import setup_logger
+from src.utils.regex import engine as _re
 from src.utils.weather import get_weather
 
 logger = setup_logger(__name__)
 
 
 class WeatherTool(Tool):
-    PATTERN = re.compile(r"\[WEATHER:(.+?)\]")
+    PATTERN = _re.compile(r"\[WEATHER:([^\]\n]+)\]")
 
     @property
     def name(self) -> str:
@@ -22,3 +22,9 @@ class DB:
     async def init(self):
         """Initialize all database tables."""
         await self.base.init_db()
+
+    async def close(self):
+        """Close connections held open across calls."""
+        await self.conversation.close()
+        await self.memo.close()
+        await self.mail.close()
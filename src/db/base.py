@@ -1,10 +1,30 @@
 import aiosqlite
 from src.config import DB_PATH
+from src.db.pool import AioSqlitePool
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
+class PooledConnection:
+    """Mixin that borrows connections from a shared pool instead of opening one per call."""
+
+    db_path: str
+    _pool: AioSqlitePool | None = None
+
+    def _acquire(self):
+        """Borrow a pooled connection (the pool is created on first use)."""
+        if self._pool is None:
+            self._pool = AioSqlitePool(self.db_path)
+        return self._pool.acquire()
+
+    async def close(self):
+        """Close the pooled connections, if any were opened."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+
 class Database:
     """Base database class with connection management."""
 
@@ -15,7 +35,7 @@ class Database:
         """Initialize database and create all tables."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with aiosqlite.connect(self.db_path, uri=True) as db:
             # Conversations table
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS conversations (
@@ -27,7 +47,8 @@ class Database:
                 )
             """)
             await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_user_id ON conversations(user_id)
+                CREATE INDEX IF NOT EXISTS idx_conv_user_created
+                ON conversations(user_id, created_at DESC, id DESC)
             """)
 
             # Personas table
@@ -51,8 +72,33 @@ class Database:
                 )
             """)
             await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_memo_user_id ON memos(user_id)
+                CREATE INDEX IF NOT EXISTS idx_memo_user_created
+                ON memos(user_id, created_at DESC, id DESC)
+            """)
+
+            # Memo full-text index (trigram keeps LIKE-style substring matching for Korean)
+            cursor = await db.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memos_fts'"
+            )
+            fts_exists = await cursor.fetchone() is not None
+            await db.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS memos_fts USING fts5(
+                    content, content='memos', content_rowid='id', tokenize='trigram'
+                );
+                CREATE TRIGGER IF NOT EXISTS memos_ai AFTER INSERT ON memos BEGIN
+                    INSERT INTO memos_fts(rowid, content) VALUES (new.id, new.content);
+                END;
+                CREATE TRIGGER IF NOT EXISTS memos_ad AFTER DELETE ON memos BEGIN
+                    INSERT INTO memos_fts(memos_fts, rowid, content) VALUES ('delete', old.id, old.content);
+                END;
+                CREATE TRIGGER IF NOT EXISTS memos_au AFTER UPDATE ON memos BEGIN
+                    INSERT INTO memos_fts(memos_fts, rowid, content) VALUES ('delete', old.id, old.content);
+                    INSERT INTO memos_fts(rowid, content) VALUES (new.id, new.content);
+                END;
             """)
+            if not fts_exists:
+                # Migration: index memos written before the FTS table existed
+                await db.execute("INSERT INTO memos_fts(memos_fts) VALUES ('rebuild')")
 
             # Reminders table
             await db.execute("""
@@ -75,6 +121,10 @@ class Database:
             if "recurrence" not in columns:
                 await db.execute("ALTER TABLE reminders ADD COLUMN recurrence TEXT DEFAULT NULL")
 
+            # Migration: the (user_id, created_at, id) indexes above supersede these
+            await db.execute("DROP INDEX IF EXISTS idx_user_id")
+            await db.execute("DROP INDEX IF EXISTS idx_memo_user_id")
+
             # Briefing settings table
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS briefing_settings (
@@ -107,4 +157,15 @@ class Database:
                 )
             """)
 
+            # Last announced mail per mailbox, so new-mail checks survive restarts
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS mail_uid_anchors (
+                    provider TEXT NOT NULL,
+                    account TEXT NOT NULL,
+                    uidvalidity INTEGER NOT NULL,
+                    uidnext INTEGER NOT NULL,
+                    PRIMARY KEY (provider, account)
+                )
+            """)
+
             await db.commit()
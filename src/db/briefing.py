@@ -15,7 +15,7 @@ class BriefingDB:
 
     async def get_settings(self, user_id: str) -> dict | None:
         """Get briefing settings for a user."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with aiosqlite.connect(self.db_path, uri=True) as db:
             cursor = await db.execute(
                 """
                 SELECT enabled, time, city, last_sent FROM briefing_settings
@@ -49,7 +49,7 @@ class BriefingDB:
         # Update with provided kwargs
         current.update(kwargs)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with aiosqlite.connect(self.db_path, uri=True) as db:
             await db.execute(
                 """
                 INSERT OR REPLACE INTO briefing_settings
@@ -63,7 +63,7 @@ class BriefingDB:
 
     async def update_last_sent(self, user_id: str, last_sent: str):
         """Update the last_sent timestamp."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with aiosqlite.connect(self.db_path, uri=True) as db:
             await db.execute(
                 "UPDATE briefing_settings SET last_sent = ? WHERE user_id = ?",
                 (last_sent, user_id)
@@ -72,7 +72,7 @@ class BriefingDB:
 
     async def get_all_enabled(self) -> list[dict]:
         """Get all users with briefing enabled."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with aiosqlite.connect(self.db_path, uri=True) as db:
             cursor = await db.execute(
                 """
                 SELECT user_id, time, city, last_sent FROM briefing_settings
@@ -1,11 +1,11 @@
-import aiosqlite
 from src.config import DB_PATH, MAX_HISTORY_LENGTH
+from src.db.base import PooledConnection
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
-class ConversationDB:
+class ConversationDB(PooledConnection):
     """Database operations for conversation history."""
 
     def __init__(self):
@@ -13,16 +13,25 @@ class ConversationDB:
 
     async def add_message(self, user_id: str, role: str, content: str):
         """Add a message to the conversation history."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             await db.execute(
                 "INSERT INTO conversations (user_id, role, content) VALUES (?, ?, ?)",
                 (user_id, role, content)
             )
             await db.commit()
 
+    async def add_messages(self, user_id: str, messages: list[tuple[str, str]]):
+        """Add several (role, content) messages in a single transaction."""
+        async with self._acquire() as db:
+            await db.executemany(
+                "INSERT INTO conversations (user_id, role, content) VALUES (?, ?, ?)",
+                [(user_id, role, content) for role, content in messages]
+            )
+            await db.commit()
+
     async def get_history(self, user_id: str, limit: int = MAX_HISTORY_LENGTH) -> list[dict]:
         """Get conversation history for a user."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             cursor = await db.execute(
                 """
                 SELECT role, content FROM conversations
@@ -38,7 +47,7 @@ class ConversationDB:
 
     async def clear_history(self, user_id: str):
         """Clear conversation history for a user."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             await db.execute(
                 "DELETE FROM conversations WHERE user_id = ?",
                 (user_id,)
@@ -47,7 +56,7 @@ class ConversationDB:
 
     async def get_message_count(self, user_id: str) -> int:
         """Get total message count for a user."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             cursor = await db.execute(
                 "SELECT COUNT(*) FROM conversations WHERE user_id = ?",
                 (user_id,)
@@ -57,7 +66,7 @@ class ConversationDB:
 
     async def get_all_messages(self, user_id: str) -> list[dict]:
         """Get all messages for a user in chronological order (no limit)."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             cursor = await db.execute(
                 """
                 SELECT role, content FROM conversations
@@ -71,7 +80,7 @@ class ConversationDB:
 
     async def delete_old_messages(self, user_id: str, keep_count: int):
         """Delete old messages, keeping only the most recent keep_count messages."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             await db.execute(
                 """
                 DELETE FROM conversations
@@ -88,7 +97,7 @@ class ConversationDB:
 
     async def get_summary(self, user_id: str) -> str | None:
         """Get conversation summary for a user."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             cursor = await db.execute(
                 "SELECT summary FROM conversation_summaries WHERE user_id = ?",
                 (user_id,)
@@ -98,7 +107,7 @@ class ConversationDB:
 
     async def save_summary(self, user_id: str, summary: str, message_count: int):
         """Save or update conversation summary, accumulating message_count."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             await db.execute(
                 """
                 INSERT INTO conversation_summaries (user_id, summary, message_count, updated_at)
@@ -114,7 +123,7 @@ class ConversationDB:
 
     async def clear_summary(self, user_id: str):
         """Clear conversation summary for a user."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             await db.execute(
                 "DELETE FROM conversation_summaries WHERE user_id = ?",
                 (user_id,)
@@ -1,13 +1,13 @@
 """Database operations for mail notification settings."""
 
-import aiosqlite
 from src.config import DB_PATH
+from src.db.base import PooledConnection
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
-class MailDB:
+class MailDB(PooledConnection):
     """Database operations for mail notification settings."""
 
     def __init__(self):
@@ -15,7 +15,7 @@ class MailDB:
 
     async def get_settings(self, user_id: str) -> dict | None:
         """Get mail settings for a user."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             cursor = await db.execute(
                 "SELECT enabled, last_checked FROM mail_settings WHERE user_id = ?",
                 (user_id,)
@@ -27,7 +27,7 @@ class MailDB:
 
     async def set_enabled(self, user_id: str, enabled: bool):
         """Enable or disable mail notifications for a user."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             await db.execute(
                 """
                 INSERT INTO mail_settings (user_id, enabled)
@@ -40,7 +40,7 @@ class MailDB:
 
     async def update_last_checked(self, user_id: str, timestamp: str):
         """Update last_checked timestamp."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             await db.execute(
                 """
                 INSERT INTO mail_settings (user_id, last_checked)
@@ -53,9 +53,33 @@ class MailDB:
 
     async def get_all_enabled(self) -> list[dict]:
         """Get all users with mail notifications enabled."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             cursor = await db.execute(
                 "SELECT user_id, last_checked FROM mail_settings WHERE enabled = 1"
             )
             rows = await cursor.fetchall()
         return [{"user_id": row[0], "last_checked": row[1]} for row in rows]
+
+    async def get_uid_anchor(self, provider: str, account: str) -> tuple[int, int] | None:
+        """Get the (uidvalidity, uidnext) saved for a mailbox."""
+        async with self._acquire() as db:
+            cursor = await db.execute(
+                "SELECT uidvalidity, uidnext FROM mail_uid_anchors WHERE provider = ? AND account = ?",
+                (provider, account)
+            )
+            row = await cursor.fetchone()
+        return (row[0], row[1]) if row else None
+
+    async def set_uid_anchor(self, provider: str, account: str, uidvalidity: int, uidnext: int):
+        """Save the (uidvalidity, uidnext) for a mailbox."""
+        async with self._acquire() as db:
+            await db.execute(
+                """
+                INSERT INTO mail_uid_anchors (provider, account, uidvalidity, uidnext)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(provider, account) DO UPDATE SET
+                    uidvalidity = excluded.uidvalidity, uidnext = excluded.uidnext
+                """,
+                (provider, account, uidvalidity, uidnext)
+            )
+            await db.commit()
@@ -1,11 +1,14 @@
-import aiosqlite
 from src.config import DB_PATH
+from src.db.base import PooledConnection
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# The trigram index can only answer queries of at least three characters
+FTS_MIN_QUERY_LEN = 3
 
-class MemoDB:
+
+class MemoDB(PooledConnection):
     """Database operations for memos."""
 
     def __init__(self):
@@ -13,17 +16,27 @@ class MemoDB:
 
     async def add(self, user_id: str, content: str) -> int:
         """Add a memo and return its ID."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             cursor = await db.execute(
-                "INSERT INTO memos (user_id, content) VALUES (?, ?)",
+                "INSERT INTO memos (user_id, content) VALUES (?, ?) RETURNING id",
                 (user_id, content)
             )
+            row = await cursor.fetchone()
+            await db.commit()
+            return row[0]
+
+    async def add_many(self, user_id: str, contents: list[str]):
+        """Add several memos in a single transaction."""
+        async with self._acquire() as db:
+            await db.executemany(
+                "INSERT INTO memos (user_id, content) VALUES (?, ?)",
+                [(user_id, content) for content in contents]
+            )
             await db.commit()
-            return cursor.lastrowid
 
     async def get_all(self, user_id: str, limit: int = 20) -> list[dict]:
         """Get memos for a user."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             cursor = await db.execute(
                 """
                 SELECT id, content, created_at FROM memos
@@ -39,7 +52,7 @@ class MemoDB:
 
     async def delete(self, user_id: str, memo_id: int) -> bool:
         """Delete a memo. Returns True if deleted."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._acquire() as db:
             cursor = await db.execute(
                 "DELETE FROM memos WHERE id = ? AND user_id = ?",
                 (memo_id, user_id)
@@ -48,16 +61,29 @@ class MemoDB:
             return cursor.rowcount > 0
 
     async def search(self, user_id: str, query: str) -> list[dict]:
-        """Search memos by content."""
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                """
-                SELECT id, content, created_at FROM memos
-                WHERE user_id = ? AND content LIKE ?
-                ORDER BY created_at DESC, id DESC
-                """,
-                (user_id, f"%{query}%")
-            )
+        """Search memos by content (substring match)."""
+        async with self._acquire() as db:
+            if len(query) >= FTS_MIN_QUERY_LEN:
+                # Quoted as one FTS phrase so the query's own syntax is taken literally
+                cursor = await db.execute(
+                    """
+                    SELECT id, content, created_at FROM memos
+                    WHERE user_id = ? AND id IN (
+                        SELECT rowid FROM memos_fts WHERE memos_fts MATCH ?
+                    )
+                    ORDER BY created_at DESC, id DESC
+                    """,
+                    (user_id, '"' + query.replace('"', '""') + '"')
+                )
+            else:
+                cursor = await db.execute(
+                    """
+                    SELECT id, content, created_at FROM memos
+                    WHERE user_id = ? AND content LIKE ?
+                    ORDER BY created_at DESC, id DESC
+                    """,
+                    (user_id, f"%{query}%")
+                )
             rows = await cursor.fetchall()
 
         return [{"id": row[0], "content": row[1], "created_at": row[2]} for row in rows]
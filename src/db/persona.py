@@ -10,23 +10,34 @@ class PersonaDB:
 
     def __init__(self):
         self.db_path = DB_PATH
+        # user_id -> persona (None = known to have no persona); kept in sync by set/clear
+        self._cache: dict[str, dict | None] = {}
+
+    def invalidate(self, user_id: str):
+        """Drop the cached persona so the next get reads from the database."""
+        self._cache.pop(user_id, None)
 
     async def get(self, user_id: str) -> dict | None:
         """Get persona for a user."""
-        async with aiosqlite.connect(self.db_path) as db:
+        if user_id in self._cache:
+            cached = self._cache[user_id]
+            # Callers update the persona dict in place, so never hand out the cached one
+            return dict(cached) if cached is not None else None
+
+        async with aiosqlite.connect(self.db_path, uri=True) as db:
             cursor = await db.execute(
                 "SELECT name, role, tone FROM personas WHERE user_id = ?",
                 (user_id,)
             )
             row = await cursor.fetchone()
 
-        if row:
-            return {"name": row[0], "role": row[1], "tone": row[2]}
-        return None
+        persona = {"name": row[0], "role": row[1], "tone": row[2]} if row else None
+        self._cache[user_id] = persona
+        return dict(persona) if persona is not None else None
 
     async def set(self, user_id: str, name: str, role: str, tone: str):
         """Set or update persona for a user."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with aiosqlite.connect(self.db_path, uri=True) as db:
             await db.execute(
                 """
                 INSERT INTO personas (user_id, name, role, tone)
@@ -39,12 +50,14 @@ class PersonaDB:
                 (user_id, name, role, tone)
             )
             await db.commit()
+        self._cache[user_id] = {"name": name, "role": role, "tone": tone}
 
     async def clear(self, user_id: str):
         """Clear persona for a user."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with aiosqlite.connect(self.db_path, uri=True) as db:
             await db.execute(
                 "DELETE FROM personas WHERE user_id = ?",
                 (user_id,)
             )
             await db.commit()
+        self._cache[user_id] = None
@@ -0,0 +1,66 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import aiosqlite
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class AioSqlitePool:
+    """Small pool of aiosqlite connections, opened lazily up to `size`."""
+
+    def __init__(self, db_path, size: int = 4):
+        self.db_path = db_path
+        self.size = size
+        self._idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._connections: list[aiosqlite.Connection] = []
+        # Slots claimed so far, including connections still being opened
+        self._reserved = 0
+        self._closed = False
+
+    async def _open(self) -> aiosqlite.Connection:
+        """Open a connection with WAL journaling."""
+        conn = await aiosqlite.connect(self.db_path, uri=True)
+        await conn.execute("PRAGMA journal_mode=WAL")
+        await conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Borrow a connection; waits for one to be released if the pool is full."""
+        if self._closed:
+            raise RuntimeError("connection pool is closed")
+
+        if self._idle.empty() and self._reserved < self.size:
+            # Claim the slot before awaiting, so concurrent borrowers can't all open one
+            self._reserved += 1
+            try:
+                conn = await self._open()
+            except BaseException:
+                self._reserved -= 1
+                raise
+            self._connections.append(conn)
+        else:
+            conn = await self._idle.get()
+
+        try:
+            yield conn
+        finally:
+            if self._closed:
+                # The pool was closed while this connection was borrowed
+                self._connections.remove(conn)
+                await conn.close()
+            else:
+                # Don't hand a half-finished transaction to the next borrower
+                if conn.in_transaction:
+                    await conn.rollback()
+                self._idle.put_nowait(conn)
+
+    async def close(self):
+        """Close idle connections now; borrowed ones are closed when they are returned."""
+        self._closed = True
+        while not self._idle.empty():
+            conn = self._idle.get_nowait()
+            self._connections.remove(conn)
+            await conn.close()
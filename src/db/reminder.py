@@ -1,4 +1,5 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime
+from functools import lru_cache
 
 import aiosqlite
 from src.config import DB_PATH
@@ -12,6 +13,26 @@ RECURRENCE_LABELS = {
     "weekday": "평일",
 }
 
+# Korean day names indexed by weekday() (Mon=0), for "weekly:N" labels
+_DOW = ("월", "화", "수", "목", "금", "토", "일")
+
+_FMT = "%Y-%m-%d %H:%M:%S"
+
+# Days until the next occurrence, per recurrence kind, indexed by weekday() (Mon=0).
+# "weekday" skips the weekend: Fri -> Mon, Sat -> Mon. Unknown kinds repeat daily.
+_DAILY_STEPS = (1,) * 7
+_NEXT_DAYS = {
+    "daily": _DAILY_STEPS,
+    "weekday": (1, 1, 1, 1, 3, 2, 1),
+    "weekly:": (7,) * 7,
+}
+
+
+@lru_cache(maxsize=512)
+def _parse(ts: str) -> datetime:
+    """Parse a stored remind_at timestamp (cached; datetime is immutable)."""
+    return datetime.strptime(ts, _FMT)
+
 
 class ReminderDB:
     """Database operations for reminders."""
@@ -21,17 +42,18 @@ class ReminderDB:
 
     async def add(self, user_id: str, content: str, remind_at: str, recurrence: str | None = None) -> int:
         """Add a reminder and return its ID."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with aiosqlite.connect(self.db_path, uri=True) as db:
             cursor = await db.execute(
-                "INSERT INTO reminders (user_id, content, remind_at, recurrence) VALUES (?, ?, ?, ?)",
+                "INSERT INTO reminders (user_id, content, remind_at, recurrence) VALUES (?, ?, ?, ?) RETURNING id",
                 (user_id, content, remind_at, recurrence)
             )
+            row = await cursor.fetchone()
             await db.commit()
-            return cursor.lastrowid
+            return row[0]
 
     async def get_all(self, user_id: str) -> list[dict]:
         """Get active reminders for a user."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with aiosqlite.connect(self.db_path, uri=True) as db:
             cursor = await db.execute(
                 """
                 SELECT id, content, remind_at, recurrence FROM reminders
@@ -48,13 +70,14 @@ class ReminderDB:
         ]
 
     async def get_due(self) -> list[dict]:
-        """Get all reminders that are due now."""
-        async with aiosqlite.connect(self.db_path) as db:
+        """Get all reminders that are due now (local time, same clock that wrote remind_at)."""
+        async with aiosqlite.connect(self.db_path, uri=True) as db:
             cursor = await db.execute(
                 """
                 SELECT id, user_id, content, remind_at, recurrence FROM reminders
-                WHERE remind_at <= datetime('now', 'localtime')
-                """
+                WHERE remind_at <= ?
+                """,
+                (datetime.now().strftime(_FMT),)
             )
             rows = await cursor.fetchall()
 
@@ -65,7 +88,7 @@ class ReminderDB:
 
     async def reschedule(self, reminder_id: int, next_remind_at: str):
         """Reschedule a recurring reminder to the next occurrence."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with aiosqlite.connect(self.db_path, uri=True) as db:
             await db.execute(
                 "UPDATE reminders SET remind_at = ? WHERE id = ?",
                 (next_remind_at, reminder_id)
@@ -74,7 +97,7 @@ class ReminderDB:
 
     async def delete(self, user_id: str, reminder_id: int) -> bool:
         """Delete a reminder. Returns True if deleted."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with aiosqlite.connect(self.db_path, uri=True) as db:
             cursor = await db.execute(
                 "DELETE FROM reminders WHERE id = ? AND user_id = ?",
                 (reminder_id, user_id)
@@ -84,7 +107,7 @@ class ReminderDB:
 
     async def delete_by_id(self, reminder_id: int):
         """Delete a reminder by ID (used after sending notification)."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with aiosqlite.connect(self.db_path, uri=True) as db:
             await db.execute(
                 "DELETE FROM reminders WHERE id = ?",
                 (reminder_id,)
@@ -94,23 +117,14 @@ class ReminderDB:
     @staticmethod
     def calc_next(remind_at_str: str, recurrence: str) -> str:
         """Calculate the next occurrence for a recurring reminder."""
-        remind_at = datetime.strptime(remind_at_str, "%Y-%m-%d %H:%M:%S")
-
-        if recurrence == "daily":
-            next_at = remind_at + timedelta(days=1)
-
-        elif recurrence == "weekday":
-            next_at = remind_at + timedelta(days=1)
-            while next_at.weekday() >= 5:  # Skip Saturday(5), Sunday(6)
-                next_at += timedelta(days=1)
-
-        elif recurrence.startswith("weekly:"):
-            next_at = remind_at + timedelta(weeks=1)
+        remind_at = _parse(remind_at_str)
 
-        else:
-            next_at = remind_at + timedelta(days=1)
+        kind = "weekly:" if recurrence.startswith("weekly:") else recurrence
+        days = _NEXT_DAYS.get(kind, _DAILY_STEPS)[remind_at.weekday()]
 
-        return next_at.strftime("%Y-%m-%d %H:%M:%S")
+        # Step the date as an ordinal; the time of day carries over unchanged
+        next_date = date.fromordinal(remind_at.toordinal() + days)
+        return f"{next_date.isoformat()} {remind_at.time().isoformat()}"
 
     @staticmethod
     def recurrence_label(recurrence: str | None) -> str:
@@ -120,7 +134,5 @@ class ReminderDB:
         if recurrence in RECURRENCE_LABELS:
             return RECURRENCE_LABELS[recurrence]
         if recurrence.startswith("weekly:"):
-            day_num = int(recurrence.split(":")[1])
-            day_names = ["월", "화", "수", "목", "금", "토", "일"]
-            return f"매주 {day_names[day_num]}요일"
+            return f"매주 {_DOW[int(recurrence[7:])]}요일"
         return recurrence
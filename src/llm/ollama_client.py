@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import ollama
 from ollama import AsyncClient
 
@@ -7,39 +9,53 @@ from src.utils.logger import setup_logger
 logger = setup_logger(__name__)
 
 
-class OllamaClient:
-    def __init__(self, host: str = OLLAMA_HOST, model: str = OLLAMA_MODEL):
-        self.client = AsyncClient(host=host)
-        self.model = model
+@lru_cache(maxsize=64)
+def _render_system_prompt(
+    model: str,
+    persona: tuple[str, str, str] | None,
+    summary: str | None,
+    tool_instructions: str | None,
+) -> str:
+    """Render the system prompt; cached because the same persona and tools repeat every turn."""
+    tool_section = tool_instructions or ""
 
-    def build_system_prompt(self, persona: dict | None = None, summary: str | None = None, tool_instructions: str | None = None) -> str:
-        """Build system prompt with optional persona, conversation summary, and tool instructions."""
-        tool_section = tool_instructions or ""
-
-        summary_section = ""
-        if summary:
-            summary_section = f"""
+    summary_section = ""
+    if summary:
+        summary_section = f"""
 
 [이전 대화 요약]
 {summary}
 위 요약은 이전 대화의 핵심 내용입니다. 이 맥락을 참고하여 자연스럽게 대화를 이어가세요."""
 
-        if persona:
-            return f"""You are {persona['name']}, a personal AI assistant.
-Your role: {persona['role']}
-Your tone/style: {persona['tone']}
+    if persona:
+        name, role, tone = persona
+        return f"""You are {name}, a personal AI assistant.
+Your role: {role}
+Your tone/style: {tone}
 
-You are running locally on the user's Mac Mini via Ollama ({self.model}).
+You are running locally on the user's Mac Mini via Ollama ({model}).
 Always stay in character. Answer in the same language the user uses.
 Never claim to be Claude, ChatGPT, or any other AI.
 {tool_section}{summary_section}"""
-        else:
-            return f"""You are a personal AI assistant powered by {self.model}.
+    else:
+        return f"""You are a personal AI assistant powered by {model}.
 You are running locally on the user's Mac Mini via Ollama.
 Be concise, helpful, and friendly. Answer in the same language the user uses.
 Never claim to be Claude, ChatGPT, or any other AI.
 {tool_section}{summary_section}"""
 
+
+class OllamaClient:
+    def __init__(self, host: str = OLLAMA_HOST, model: str = OLLAMA_MODEL):
+        self.client = AsyncClient(host=host)
+        self.model = model
+
+    def build_system_prompt(self, persona: dict | None = None, summary: str | None = None, tool_instructions: str | None = None) -> str:
+        """Build system prompt with optional persona, conversation summary, and tool instructions."""
+        # Only these persona fields reach the prompt, and they make a hashable cache key
+        fields = (persona["name"], persona["role"], persona["tone"]) if persona else None
+        return _render_system_prompt(self.model, fields, summary, tool_instructions)
+
     async def chat(self, messages: list[dict], persona: dict | None = None, summary: str | None = None, tool_instructions: str | None = None) -> str:
         """Send messages to Ollama and get a response."""
         system_prompt = self.build_system_prompt(persona, summary=summary, tool_instructions=tool_instructions)
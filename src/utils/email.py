@@ -2,10 +2,17 @@
 
 import asyncio
 import imaplib
+import re
+import select
 import smtplib
+import socket
+import ssl
+import time
+from collections.abc import Awaitable, Callable
 from email.header import decode_header
 from email.mime.text import MIMEText
 
+import src.config as config
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -20,48 +27,104 @@ IMAP_SETTINGS = {
     "naver": {"host": "imap.naver.com", "port": 993},
 }
 
+SMTP_TIMEOUT = 30
+
+
+def _credentials(provider: str) -> tuple[str, str]:
+    """Return the (user, password) configured for a provider."""
+    if provider == "naver":
+        return config.EMAIL_NAVER_USER, config.EMAIL_NAVER_PASSWORD
+    return config.EMAIL_GMAIL_USER, config.EMAIL_GMAIL_PASSWORD
+
+
+def has_credentials(provider: str) -> bool:
+    """Whether both a user and a password are configured for a provider."""
+    return all(_credentials(provider))
+
+
+# Logged-in SMTP sessions reused across sends, keyed by (provider, user).
+# Each key has a lock because an SMTP session handles one transaction at a time.
+_smtp_sessions: dict[tuple[str, str], smtplib.SMTP] = {}
+_smtp_locks: dict[tuple[str, str], asyncio.Lock] = {}
+
+
+def _drop_smtp_session(key: tuple[str, str]):
+    """Forget a cached session and close it, ignoring errors from a dead socket."""
+    smtp = _smtp_sessions.pop(key, None)
+    if smtp is not None:
+        try:
+            smtp.close()
+        except OSError:
+            pass
+
+
+def _get_smtp_session(key: tuple[str, str], settings: dict, user: str, password: str) -> smtplib.SMTP:
+    """Return a live, logged-in SMTP session, reconnecting if the cached one dropped."""
+    smtp = _smtp_sessions.get(key)
+    if smtp is not None:
+        try:
+            if smtp.noop()[0] == 250:
+                return smtp
+        except (smtplib.SMTPException, OSError):
+            pass
+        _drop_smtp_session(key)
+
+    smtp = smtplib.SMTP(settings["host"], settings["port"], timeout=SMTP_TIMEOUT)
+    try:
+        smtp.ehlo()
+        smtp.starttls()
+        smtp.login(user, password)
+    except BaseException:
+        smtp.close()
+        raise
+    _smtp_sessions[key] = smtp
+    return smtp
+
+
+def close_smtp_sessions():
+    """Close every cached SMTP session (call on shutdown)."""
+    for key in list(_smtp_sessions):
+        _drop_smtp_session(key)
+
 
 async def send_email(provider: str, to: str, subject: str, body: str) -> dict:
     """Send an email via SMTP. Returns {success: bool, message: str}."""
-    import src.config as config
-
     settings = SMTP_SETTINGS.get(provider)
     if settings is None:
         return {"success": False, "message": f"지원하지 않는 provider: {provider}. naver 또는 gmail을 사용하세요."}
 
-    if provider == "naver":
-        user = config.EMAIL_NAVER_USER
-        password = config.EMAIL_NAVER_PASSWORD
-    else:
-        user = config.EMAIL_GMAIL_USER
-        password = config.EMAIL_GMAIL_PASSWORD
+    user, password = _credentials(provider)
 
     if not user or not password:
         return {"success": False, "message": f"{provider} 계정 정보가 설정되지 않았습니다. .env 파일을 확인해주세요."}
 
+    key = (provider, user)
+
     def _send() -> dict:
         msg = MIMEText(body, "plain", "utf-8")
         msg["Subject"] = subject
         msg["From"] = user
         msg["To"] = to
         try:
-            with smtplib.SMTP(settings["host"], settings["port"]) as smtp:
-                smtp.ehlo()
-                smtp.starttls()
-                smtp.login(user, password)
-                smtp.sendmail(user, to, msg.as_string())
+            smtp = _get_smtp_session(key, settings, user, password)
+            smtp.sendmail(user, to, msg.as_string())
             return {"success": True, "message": f"{to}으로 이메일을 발송했습니다."}
         except smtplib.SMTPAuthenticationError:
             return {"success": False, "message": "인증 실패: 이메일 계정 또는 비밀번호를 확인해주세요."}
         except smtplib.SMTPRecipientsRefused:
+            # The session itself is still fine; keep it for the next send
             return {"success": False, "message": f"수신자 주소가 유효하지 않습니다: {to}"}
         except smtplib.SMTPException as e:
+            _drop_smtp_session(key)
             return {"success": False, "message": f"SMTP 오류: {str(e)}"}
         except OSError as e:
+            _drop_smtp_session(key)
             return {"success": False, "message": f"네트워크 오류: {str(e)}"}
 
     logger.info(f"Sending email via {provider} to {to} (subject: {subject[:30]})")
-    result = await asyncio.to_thread(_send)
+    lock = _smtp_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        result = await asyncio.to_thread(_send)
     if result["success"]:
         logger.info(f"Email sent successfully via {provider} to {to}")
     else:
@@ -69,8 +132,69 @@ async def send_email(provider: str, to: str, subject: str, body: str) -> dict:
     return result
 
 
+# Logged-in IMAP sessions reused across mail checks, keyed by (provider, user),
+# with the monotonic time of last use. One session per key keeps us well under
+# provider connection limits; idle ones are replaced before servers drop them.
+IMAP_IDLE_TTL = 270
+_imap_sessions: dict[tuple[str, str], tuple[imaplib.IMAP4_SSL, float]] = {}
+_imap_locks: dict[tuple[str, str], asyncio.Lock] = {}
+# (UIDVALIDITY, next UID to report) per (provider, user), so notifications only
+# ask the server for mail newer than what was already announced. UIDs are only
+# comparable within one UIDVALIDITY, so a changed value discards the anchor.
+_uid_anchors: dict[tuple[str, str], tuple[int, int]] = {}
+
+# Only the three headers we show, and PEEK so fetching doesn't mark mail \Seen
+HEADER_FETCH_SPEC = "(BODY.PEEK[HEADER.FIELDS (FROM SUBJECT DATE)])"
+
+
+def _drop_imap_session(key: tuple[str, str]):
+    """Forget a cached session and log it out, ignoring errors from a dead socket."""
+    entry = _imap_sessions.pop(key, None)
+    if entry is not None:
+        try:
+            entry[0].logout()
+        except (imaplib.IMAP4.error, OSError):
+            pass
+
+
+def _get_imap_session(key: tuple[str, str], settings: dict, user: str, password: str) -> imaplib.IMAP4_SSL:
+    """Return a live, logged-in IMAP session, reconnecting if the cached one is stale."""
+    entry = _imap_sessions.get(key)
+    if entry is not None:
+        imap, last_used = entry
+        if time.monotonic() - last_used < IMAP_IDLE_TTL:
+            try:
+                if imap.noop()[0] == "OK":
+                    _imap_sessions[key] = (imap, time.monotonic())
+                    return imap
+            except (imaplib.IMAP4.error, OSError):
+                pass
+        _drop_imap_session(key)
+
+    imap = imaplib.IMAP4_SSL(settings["host"], settings["port"])
+    try:
+        imap.login(user, password)
+    except BaseException:
+        try:
+            imap.shutdown()
+        except OSError:
+            pass
+        raise
+    _imap_sessions[key] = (imap, time.monotonic())
+    return imap
+
+
+def close_imap_sessions():
+    """Log out every cached IMAP session (call on shutdown)."""
+    for key in list(_imap_sessions):
+        _drop_imap_session(key)
+
+
 def _decode_header_value(value: str) -> str:
     """Decode MIME-encoded email header value."""
+    # Most headers carry no encoded-words; decode_header would just hand them back
+    if "=?" not in value:
+        return value
     parts = decode_header(value)
     decoded = []
     for part, charset in parts:
@@ -81,56 +205,230 @@ def _decode_header_value(value: str) -> str:
     return "".join(decoded)
 
 
-async def check_new_mail(provider: str) -> list[dict]:
-    """Check INBOX for unread mail via IMAP. Returns up to 10 recent unseen messages."""
-    import src.config as config
+# One header field, including any folded continuation lines
+_HEADER_FIELD_RE = re.compile(
+    rb"^(from|subject|date):[ \t]*(.*?)(?=\r?\n(?![ \t])|\Z)", re.I | re.M | re.S
+)
+_FOLD_RE = re.compile(rb"\r?\n(?=[ \t])")
+
+
+def _parse_header_fields(raw: bytes) -> dict:
+    """Pull From/Subject/Date out of a fetched header block, unfolding long lines."""
+    fields = {"from": "", "subject": "", "date": ""}
+    for name, value in _HEADER_FIELD_RE.findall(raw):
+        fields[name.decode().lower()] = _FOLD_RE.sub(b"", value).decode("utf-8", errors="replace").strip()
+    fields["from"] = _decode_header_value(fields["from"])
+    fields["subject"] = _decode_header_value(fields["subject"])
+    return fields
+
+
+def _uidvalidity(imap: imaplib.IMAP4_SSL) -> int:
+    """UIDVALIDITY reported by the last SELECT, or 0 if the server sent none."""
+    _, data = imap.response("UIDVALIDITY")
+    return int(data[0]) if data and data[0] else 0
 
+
+def _sync_check_new_mail(
+    provider: str, settings: dict, user: str, password: str, new_only: bool = False
+) -> list[dict]:
+    """Run one whole IMAP poll (select, search, fetch) in the calling thread."""
+    key = (provider, user)
+    try:
+        imap = _get_imap_session(key, settings, user, password)
+        # Re-select so the UNSEEN search sees mail that arrived since last poll
+        imap.select("INBOX")
+        uidvalidity = _uidvalidity(imap)
+        anchor = _uid_anchors.get(key) if new_only else None
+        since_uid = anchor[1] if anchor is not None and anchor[0] == uidvalidity else None
+        if since_uid is None:
+            _, data = imap.uid("SEARCH", None, "UNSEEN")
+            uids = data[0].split()
+        else:
+            # Only mail past the last UID we reported. "N:*" still matches the
+            # newest message when N is beyond it, so filter the range again.
+            _, data = imap.uid("SEARCH", None, f"UID {since_uid}:* UNSEEN")
+            uids = [uid for uid in data[0].split() if int(uid) >= since_uid]
+        if not uids:
+            return []
+
+        # One FETCH for the whole id set instead of a round-trip per message
+        id_set = b",".join(uids[-10:])  # most recent 10
+        _, msg_data = imap.uid("FETCH", id_set, HEADER_FETCH_SPEC)
+        # Each message comes back as an (envelope, header bytes) tuple followed by b")"
+        mails = [_parse_header_fields(part[1]) for part in msg_data if isinstance(part, tuple)]
+        # Only advance once the mail was fetched, so a failed FETCH is retried next time
+        if new_only:
+            _uid_anchors[key] = (uidvalidity, max(int(uid) for uid in uids) + 1)
+        return mails
+    except imaplib.IMAP4.error as e:
+        _drop_imap_session(key)
+        logger.warning(f"IMAP error for {provider}: {e}")
+        return []
+    except OSError as e:
+        _drop_imap_session(key)
+        logger.warning(f"Network error checking mail for {provider}: {e}")
+        return []
+
+
+async def check_new_mail(provider: str, new_only: bool = False, store=None) -> list[dict]:
+    """Check INBOX for unread mail via IMAP. Returns up to 10 recent unseen messages.
+
+    With new_only, only unseen mail that arrived after the previous new_only
+    check is returned (the first such check returns all unseen mail). Passing
+    a MailDB as store keeps that position across restarts.
+    """
     settings = IMAP_SETTINGS.get(provider)
     if settings is None:
         logger.warning(f"Unsupported IMAP provider: {provider}")
         return []
 
-    if provider == "naver":
-        user = config.EMAIL_NAVER_USER
-        password = config.EMAIL_NAVER_PASSWORD
-    else:
-        user = config.EMAIL_GMAIL_USER
-        password = config.EMAIL_GMAIL_PASSWORD
+    user, password = _credentials(provider)
 
     if not user or not password:
         logger.warning(f"IMAP credentials not set for provider: {provider}")
         return []
 
-    def _check() -> list[dict]:
+    logger.info(f"Checking new mail via IMAP: provider={provider}")
+    key = (provider, user)
+    # The whole session runs in one worker-thread hop, not one per IMAP command
+    lock = _imap_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        persist = new_only and store is not None
+        if persist and key not in _uid_anchors:
+            saved = await store.get_uid_anchor(provider, user)
+            if saved is not None:
+                _uid_anchors[key] = saved
+        before = _uid_anchors.get(key)
+        mails = await asyncio.to_thread(_sync_check_new_mail, provider, settings, user, password, new_only)
+        if persist and (anchor := _uid_anchors.get(key)) != before:
+            await store.set_uid_anchor(provider, user, *anchor)
+        return mails
+
+
+# IMAP IDLE (RFC 2177) watchers hold their own connection per provider, since
+# an IDLE session can't run other commands. Servers may drop a client idle for
+# 30 minutes, so each IDLE is ended and re-issued before that.
+IDLE_REFRESH = 29 * 60
+IMAP_TIMEOUT = 30
+IDLE_RETRY_MIN = 60
+IDLE_RETRY_MAX = 30 * 60
+_idle_sessions: dict[str, "_IdleIMAP4_SSL"] = {}
+
+
+class _IdleIMAP4_SSL(imaplib.IMAP4_SSL):
+    """IMAP4_SSL with the IDLE command, which imaplib only gains in Python 3.14."""
+
+    def _has_buffered_input(self) -> bool:
+        """Whether a response line can be read without blocking.
+
+        readline() goes through self.file, a BufferedReader that may already hold
+        lines that arrived in the same TLS record as the IDLE continuation.
+        select() on the socket can't see those, so peek without blocking instead.
+        """
+        timeout = self.sock.gettimeout()
+        self.sock.setblocking(False)
         try:
-            with imaplib.IMAP4_SSL(settings["host"], settings["port"]) as imap:
-                imap.login(user, password)
-                imap.select("INBOX")
-                _, data = imap.search(None, "UNSEEN")
-                mail_ids = data[0].split()
-                if not mail_ids:
-                    return []
-
-                results = []
-                for mail_id in mail_ids[-10:]:  # most recent 10
-                    _, msg_data = imap.fetch(mail_id, "(BODY.PEEK[HEADER.FIELDS (FROM SUBJECT DATE)])")
-                    raw = msg_data[0][1].decode("utf-8", errors="replace")
-                    from_val = subject_val = date_val = ""
-                    for line in raw.splitlines():
-                        if line.lower().startswith("from:"):
-                            from_val = _decode_header_value(line[5:].strip())
-                        elif line.lower().startswith("subject:"):
-                            subject_val = _decode_header_value(line[8:].strip())
-                        elif line.lower().startswith("date:"):
-                            date_val = line[5:].strip()
-                    results.append({"from": from_val, "subject": subject_val, "date": date_val})
-                return results
-        except imaplib.IMAP4.error as e:
-            logger.warning(f"IMAP error for {provider}: {e}")
-            return []
-        except OSError as e:
-            logger.warning(f"Network error checking mail for {provider}: {e}")
-            return []
+            return bool(self.file.peek(1))
+        except (ssl.SSLWantReadError, BlockingIOError):
+            return False
+        finally:
+            self.sock.settimeout(timeout)
 
-    logger.info(f"Checking new mail via IMAP: provider={provider}")
-    return await asyncio.to_thread(_check)
+    def idle(self, timeout: float, wake: socket.socket | None = None) -> bool:
+        """Hold one IDLE until the server sends something, `wake` is readable or timeout passes.
+
+        Returns True if an untagged EXISTS (new message count) arrived.
+        """
+        tag = self._new_tag()
+        self.send(tag + b" IDLE\r\n")
+        new_mail = False
+        while not (line := self.readline()).startswith(b"+"):
+            if not line or line.startswith(tag):
+                raise self.error(f"IDLE rejected: {line!r}")
+            new_mail = new_mail or line.rstrip().upper().endswith(b"EXISTS")
+
+        if not new_mail and not self._has_buffered_input():
+            readers = [self.sock] if wake is None else [self.sock, wake]
+            select.select(readers, [], [], timeout)
+
+        self.send(b"DONE\r\n")
+        while not (line := self.readline()).startswith(tag):
+            if not line:
+                raise self.abort("connection closed during IDLE")
+            new_mail = new_mail or line.rstrip().upper().endswith(b"EXISTS")
+        if line[len(tag):].split()[:1] != [b"OK"]:
+            raise self.error(f"IDLE failed: {line!r}")
+        return new_mail
+
+
+def _sync_open_idle(settings: dict, user: str, password: str) -> _IdleIMAP4_SSL | None:
+    """Open and select INBOX on a connection for IDLE, or None if the server lacks IDLE."""
+    imap = _IdleIMAP4_SSL(settings["host"], settings["port"], timeout=IMAP_TIMEOUT)
+    try:
+        imap.login(user, password)
+        # Capabilities can change after login, so ask again instead of using the greeting's
+        _, data = imap.capability()
+        if b"IDLE" not in data[0].upper().split():
+            imap.logout()
+            return None
+        imap.select("INBOX")
+    except BaseException:
+        imap.shutdown()
+        raise
+    return imap
+
+
+def _logout_idle_session(provider: str):
+    """Log an IDLE connection out, dropping the socket if the server is unreachable."""
+    imap = _idle_sessions.pop(provider, None)
+    if imap is not None:
+        try:
+            imap.logout()
+        except (imaplib.IMAP4.error, OSError):
+            try:
+                imap.shutdown()
+            except OSError:
+                pass
+
+
+async def watch_new_mail(provider: str, on_new_mail: Callable[[], Awaitable[None]]):
+    """Await on_new_mail() each time new mail reaches the INBOX, via IMAP IDLE.
+
+    Runs until cancelled, reconnecting with backoff on errors. Returns straight
+    away if the provider has no credentials or its server lacks IDLE, so the
+    caller can poll instead.
+    """
+    settings = IMAP_SETTINGS.get(provider)
+    user, password = _credentials(provider)
+    if settings is None or not user or not password:
+        return
+
+    retry_delay = IDLE_RETRY_MIN
+    while True:
+        # A byte on wake_w ends the IDLE wait early, so the connection can be logged out
+        wake_r, wake_w = socket.socketpair()
+        idle = None
+        try:
+            imap = await asyncio.to_thread(_sync_open_idle, settings, user, password)
+            if imap is None:
+                logger.info(f"IMAP server for {provider} does not support IDLE")
+                return
+            _idle_sessions[provider] = imap
+            retry_delay = IDLE_RETRY_MIN
+            logger.info(f"IMAP IDLE started: provider={provider}")
+            while True:
+                idle = asyncio.ensure_future(asyncio.to_thread(imap.idle, IDLE_REFRESH, wake_r))
+                # Shielded so cancelling the watcher doesn't abandon the thread mid-IDLE
+                if await asyncio.shield(idle):
+                    await on_new_mail()
+        except (imaplib.IMAP4.error, OSError) as e:
+            logger.warning(f"IMAP IDLE error for {provider}, retrying in {retry_delay}s: {e}")
+        finally:
+            if idle is not None and not idle.done():
+                wake_w.send(b"\0")
+                await asyncio.gather(idle, return_exceptions=True)
+            await asyncio.to_thread(_logout_idle_session, provider)
+            wake_r.close()
+            wake_w.close()
+        await asyncio.sleep(retry_delay)
+        retry_delay = min(retry_delay * 2, IDLE_RETRY_MAX)
@@ -1,10 +1,50 @@
 """Centralized logging configuration for the bot."""
 
+import atexit
 import logging
+import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+# Loggers already configured by setup_logger, keyed by name
+_CONFIGURED: dict[str, logging.Logger] = {}
+
+# File records are enqueued and written by one background listener thread,
+# so logging from a coroutine never blocks the event loop on disk I/O
+_LOG_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+_listener: QueueListener | None = None
+
+
+def _get_listener() -> QueueListener:
+    """Start the shared file-writing listener on first use."""
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    # Use absolute path to project root unless BOT_LOG_FILE points elsewhere
+    base_dir = Path(__file__).resolve().parent.parent.parent
+    log_file = Path(os.getenv("BOT_LOG_FILE") or base_dir / "bot.log")
+    file_handler = RotatingFileHandler(
+        log_file,
+        maxBytes=5 * 1024 * 1024,  # 5MB
+        backupCount=3,
+        encoding='utf-8'
+    )
+    file_handler.setLevel(logging.DEBUG)
+    file_formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    file_handler.setFormatter(file_formatter)
+
+    _listener = QueueListener(_LOG_QUEUE, file_handler, respect_handler_level=True)
+    _listener.start()
+    # Drain whatever is still queued before the interpreter exits
+    atexit.register(_listener.stop)
+    return _listener
+
 
 def setup_logger(name: str = "personal_agent") -> logging.Logger:
     """Setup and return a configured logger.
@@ -15,10 +55,15 @@ def setup_logger(name: str = "personal_agent") -> logging.Logger:
     Returns:
         Configured logger instance
     """
+    # Every module calls this at import; skip getLogger's lock on repeat calls
+    if name in _CONFIGURED:
+        return _CONFIGURED[name]
+
     logger = logging.getLogger(name)
 
-    # Avoid duplicate handlers if called multiple times
+    # Avoid duplicate handlers if the logger was configured elsewhere
     if logger.handlers:
+        _CONFIGURED[name] = logger
         return logger
 
     logger.setLevel(logging.DEBUG)
@@ -32,26 +77,15 @@ def setup_logger(name: str = "personal_agent") -> logging.Logger:
     )
     console_handler.setFormatter(console_formatter)
 
-    # File handler - DEBUG and above with rotation
-    # Use absolute path to project root
-    base_dir = Path(__file__).resolve().parent.parent.parent
-    log_file = base_dir / "bot.log"
-    file_handler = RotatingFileHandler(
-        log_file,
-        maxBytes=5 * 1024 * 1024,  # 5MB
-        backupCount=3,
-        encoding='utf-8'
-    )
-    file_handler.setLevel(logging.DEBUG)
-    file_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    file_handler.setFormatter(file_formatter)
+    # File handler - DEBUG and above, written off-thread by the shared listener
+    _get_listener()
+    queue_handler = QueueHandler(_LOG_QUEUE)
+    queue_handler.setLevel(logging.DEBUG)
 
     logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(queue_handler)
 
+    _CONFIGURED[name] = logger
     return logger
 
 
@@ -0,0 +1,10 @@
+"""Regex engine for patterns run on model output and user messages."""
+
+try:
+    import re2 as engine  # linear-time matching (google-re2)
+except ImportError:
+    import re as engine
+
+# RE2's \s only covers ASCII whitespace, so the Unicode spaces (NBSP, U+2000-U+200B,
+# the full-width U+3000, ...) are listed too. For use inside a character class.
+WHITESPACE = r"\s" "\u00a0\u1680\u2000-\u200b\u2028\u2029\u202f\u205f\u3000\ufeff"
@@ -1,94 +1,102 @@
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
-def parse_time(time_str: str) -> datetime | None:
+# Every supported form in one alternation, so an input is matched in a single
+# pass instead of trying each pattern in turn. The outer group names tell
+# which form matched.
+TIME_PATTERN = re.compile(r"""
+    (?P<days>(?P<day_count>\d+)\s*일(?:\s*후)?)
+  | (?P<relative>(?=\d+\s*(?:시간|분))
+        (?:(?P<rel_hours>\d+)\s*시간)?
+        \s*(?:(?P<rel_minutes>\d+)\s*분)?
+        (?:\s*후)?)
+  | (?P<colon>(?P<colon_hour>\d{1,2}):(?P<colon_minute>\d{2}))
+  | (?P<korean>(?:(?P<period>오전|오후)\s*)?
+        (?P<hour>\d{1,2})시
+        (?:\s*(?P<minute>\d{1,2})분)?)
+""", re.VERBOSE)
+
+
+@lru_cache(maxsize=256)
+def _parse_time_spec(time_str: str) -> timedelta | tuple[int, int] | None:
+    """Parse a stripped time string into an offset or an (hour, minute) clock time.
+
+    Independent of the current time, so the same phrase is parsed only once.
+    """
+    match = TIME_PATTERN.fullmatch(time_str)
+    if match is None:
+        return None
+
+    kind = match.lastgroup
+
+    if kind == "days":
+        return timedelta(days=int(match["day_count"]))
+
+    if kind == "relative":
+        return timedelta(
+            hours=int(match["rel_hours"] or 0),
+            minutes=int(match["rel_minutes"] or 0),
+        )
+
+    if kind == "colon":
+        return int(match["colon_hour"]), int(match["colon_minute"])
+
+    hour = int(match["hour"])
+    period = match["period"]
+    if period == "오후" and hour != 12:
+        hour += 12
+    elif period == "오전" and hour == 12:
+        hour = 0
+    return hour, int(match["minute"] or 0)
+
+
+def parse_time(time_str: str, *, now: datetime | None = None) -> datetime | None:
     """
     Parse time string and return datetime.
 
     Supports:
     - Relative: "30분", "1시간", "2시간 30분", "1일"
     - Absolute: "14:00", "14시", "14시 30분", "오후 2시"
+
+    `now` is the reference time (defaults to datetime.now()).
     """
     time_str = time_str.strip()
-    now = datetime.now()
-
-    # Relative time patterns
-    # "30분", "30분 후"
-    match = re.match(r'^(\d+)\s*분(?:\s*후)?$', time_str)
-    if match:
-        minutes = int(match.group(1))
-        return now + timedelta(minutes=minutes)
-
-    # "1시간", "1시간 후"
-    match = re.match(r'^(\d+)\s*시간(?:\s*후)?$', time_str)
-    if match:
-        hours = int(match.group(1))
-        return now + timedelta(hours=hours)
-
-    # "1시간 30분"
-    match = re.match(r'^(\d+)\s*시간\s*(\d+)\s*분(?:\s*후)?$', time_str)
-    if match:
-        hours = int(match.group(1))
-        minutes = int(match.group(2))
-        return now + timedelta(hours=hours, minutes=minutes)
-
-    # "1일", "1일 후"
-    match = re.match(r'^(\d+)\s*일(?:\s*후)?$', time_str)
-    if match:
-        days = int(match.group(1))
-        return now + timedelta(days=days)
-
-    # Absolute time patterns
-    # "14:00", "14:30"
-    match = re.match(r'^(\d{1,2}):(\d{2})$', time_str)
-    if match:
-        hour = int(match.group(1))
-        minute = int(match.group(2))
-        target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-        if target <= now:
-            target += timedelta(days=1)
-        return target
-
-    # "14시", "14시 30분"
-    match = re.match(r'^(\d{1,2})시(?:\s*(\d{1,2})분)?$', time_str)
-    if match:
-        hour = int(match.group(1))
-        minute = int(match.group(2)) if match.group(2) else 0
-        target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-        if target <= now:
-            target += timedelta(days=1)
-        return target
-
-    # "오전 9시", "오후 2시", "오후 2시 30분"
-    match = re.match(r'^(오전|오후)\s*(\d{1,2})시(?:\s*(\d{1,2})분)?$', time_str)
-    if match:
-        period = match.group(1)
-        hour = int(match.group(2))
-        minute = int(match.group(3)) if match.group(3) else 0
-
-        if period == "오후" and hour != 12:
-            hour += 12
-        elif period == "오전" and hour == 12:
-            hour = 0
-
-        target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-        if target <= now:
-            target += timedelta(days=1)
-        return target
-
-    return None
+    # Every supported form starts with a digit or 오전/오후, so free text is
+    # rejected without a regex pass or a cache entry
+    if not time_str or not (time_str[0].isdigit() or time_str[0] == "오"):
+        return None
+
+    spec = _parse_time_spec(time_str)
+    if spec is None:
+        return None
+
+    if now is None:
+        now = datetime.now()
+    if isinstance(spec, timedelta):
+        return now + spec
+
+    hour, minute = spec
+    target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if target <= now:
+        target += timedelta(days=1)
+    return target
 
 
 def format_datetime(dt: datetime | str) -> str:
     """Format datetime for display."""
     if isinstance(dt, str):
         dt = datetime.fromisoformat(dt)
-    return dt.strftime("%m/%d %H:%M")
+    return f"{dt.month:02d}/{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+
+TIME_FORMAT_ERROR = "시간 형식이 올바르지 않습니다. 예: 08:00"
+TIME_RANGE_ERROR = "시간이 올바르지 않습니다. (시: 0-23, 분: 0-59)"
 
 
 def validate_time_format(time_str: str) -> tuple[bool, str | None]:
@@ -98,17 +106,12 @@ def validate_time_format(time_str: str) -> tuple[bool, str | None]:
     Returns:
         (is_valid, error_message): tuple where error_message is None if valid
     """
-    if ":" not in time_str or len(time_str.split(":")) != 2:
-        return False, "시간 형식이 올바르지 않습니다. 예: 08:00"
-
-    try:
-        h, m = time_str.split(":")
-        hour = int(h)
-        minute = int(m)
+    h, sep, m = time_str.partition(":")
+    # isdecimal() alone would also accept non-ASCII digits that int() parses
+    if not sep or not (h + m).isascii() or not h.isdecimal() or not m.isdecimal():
+        return False, TIME_FORMAT_ERROR
 
-        if not (0 <= hour <= 23 and 0 <= minute <= 59):
-            return False, "시간이 올바르지 않습니다. (시: 0-23, 분: 0-59)"
+    if not (int(h) <= 23 and int(m) <= 59):
+        return False, TIME_RANGE_ERROR
 
-        return True, None
-    except ValueError:
-        return False, "시간 형식이 올바르지 않습니다. 예: 08:00"
+    return True, None
@@ -1,3 +1,5 @@
+from bisect import bisect_left
+
 import aiohttp
 
 from src.utils.logger import setup_logger
@@ -66,6 +68,13 @@ WMO_CODES = {
     99: "강한 우박 동반 천둥번개 ⛈️",
 }
 
+# WMO codes are 0-99, so index a tuple directly instead of hashing into the dict
+_WMO_BY_CODE = tuple(WMO_CODES.get(code) for code in range(100))
+
+# Inclusive upper bound of each UV index level; anything above the last is 위험
+_UVI_UPPER_BOUNDS = (2, 5, 7, 10)
+_UVI_LEVELS = ("낮음", "보통", "높음", "매우 높음", "위험")
+
 
 async def get_coordinates(city: str) -> tuple[float, float, str] | None:
     """Get coordinates for a city using Open-Meteo Geocoding API."""
@@ -128,7 +137,12 @@ def _parse_weather(data: dict, city_name: str) -> dict:
     daily = data.get("daily", {})
 
     code = current.get("weather_code", 0)
-    description = WMO_CODES.get(code, f"알 수 없음 ({code})")
+    # JSON may carry the code as a float (e.g. 3.0); it still names the same entry
+    if isinstance(code, float) and code.is_integer():
+        code = int(code)
+    description = _WMO_BY_CODE[code] if isinstance(code, int) and 0 <= code < 100 else None
+    if description is None:
+        description = f"알 수 없음 ({code})"
 
     return {
         "city": city_name,
@@ -174,13 +188,4 @@ def format_weather(weather: dict) -> str:
 
 def _get_uvi_level(uvi: float) -> str:
     """Get UV index level description."""
-    if uvi <= 2:
-        return "낮음"
-    elif uvi <= 5:
-        return "보통"
-    elif uvi <= 7:
-        return "높음"
-    elif uvi <= 10:
-        return "매우 높음"
-    else:
-        return "위험"
+    return _UVI_LEVELS[bisect_left(_UVI_UPPER_BOUNDS, uvi)]
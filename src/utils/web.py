@@ -1,23 +1,53 @@
-import re
 import asyncio
+from typing import Iterator, Optional
+
 import aiohttp
 import trafilatura
-from typing import Optional
 from ddgs import DDGS
 
 from src.utils.logger import setup_logger
+from src.utils.regex import WHITESPACE, engine as _re
 
 logger = setup_logger(__name__)
 
 
-URL_PATTERN = re.compile(
-    r'https?://[^\s<>"{}|\\^`\[\]]+'
+# A URL ends at any whitespace, ASCII or not, whichever engine runs the pattern
+_URL_STOP = WHITESPACE + r'<>"{}|\\^`\[\]'
+
+# Sentence punctuation right after a link (e.g. "https://a.com.") is not
+# part of it, so the last character may not be one of .,;:!?'
+URL_PATTERN = _re.compile(
+    f"https?://[^{_URL_STOP}]*[^{_URL_STOP}.,;:!?']"
 )
+_TRAILING_PUNCTUATION = ".,;:!?'"
+
+
+def _strip_unbalanced_parens(url: str) -> str:
+    """Drop closing parens that close text around the link, e.g. "(https://a.com)".
+
+    A ")" with a matching "(" in the URL is kept, as in ".../wiki/Foo_(bar)".
+    """
+    while url.endswith(")") and url.count("(") < url.count(")"):
+        url = url[:-1].rstrip(_TRAILING_PUNCTUATION)
+    return url
+
+
+def extract_urls_iter(text: str) -> Iterator[str]:
+    """Yield unique URLs lazily, so a caller needing only the first few stops early."""
+    # Most chat messages have no URL; a substring check skips the regex for them
+    if "://" not in text:
+        return
+    seen = set()
+    for match in URL_PATTERN.finditer(text):
+        url = _strip_unbalanced_parens(match.group(0))
+        if url not in seen:
+            seen.add(url)
+            yield url
 
 
 def extract_urls(text: str) -> list[str]:
-    """Extract URLs from text."""
-    return URL_PATTERN.findall(text)
+    """Extract unique URLs from text, in order of first appearance."""
+    return list(extract_urls_iter(text))
 
 
 async def fetch_page(url: str, timeout: int = 10) -> Optional[str]:
@@ -1,98 +1,245 @@
 import asyncio
+import atexit
+import os
+import shutil
+import sys
 import tempfile
-from pathlib import Path
-from unittest.mock import patch
+import uuid
+
+# 테스트 로그가 저장소의 bot.log에 쌓이지 않도록 src 임포트 전에 임시 경로로 돌린다.
+# 로거의 atexit(리스너 정지)가 나중에 등록되어 먼저 실행되므로, 그 뒤에 디렉터리를 지운다.
+if "BOT_LOG_FILE" not in os.environ:
+    _log_dir = tempfile.mkdtemp(prefix="bot-test-log-")
+    atexit.register(shutil.rmtree, _log_dir, ignore_errors=True)
+    os.environ["BOT_LOG_FILE"] = os.path.join(_log_dir, "bot.log")
 
 import aiosqlite
 import pytest
 import pytest_asyncio
 
+from src.llm.ollama_client import OllamaClient
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import time_machine
+except ImportError:
+    time_machine = None
+
+FROZEN_NOW = "2026-02-13 09:00:00"
+
+
+# Mirrors the tables and indexes created by Database.init_db
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS conversations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id TEXT NOT NULL,
+        role TEXT NOT NULL,
+        content TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_conv_user_created
+    ON conversations(user_id, created_at DESC, id DESC);
+
+    CREATE TABLE IF NOT EXISTS personas (
+        user_id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        role TEXT NOT NULL,
+        tone TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS memos (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id TEXT NOT NULL,
+        content TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_memo_user_created
+    ON memos(user_id, created_at DESC, id DESC);
+
+    CREATE VIRTUAL TABLE IF NOT EXISTS memos_fts USING fts5(
+        content, content='memos', content_rowid='id', tokenize='trigram'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS memos_ai AFTER INSERT ON memos BEGIN
+        INSERT INTO memos_fts(rowid, content) VALUES (new.id, new.content);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS memos_ad AFTER DELETE ON memos BEGIN
+        INSERT INTO memos_fts(memos_fts, rowid, content) VALUES ('delete', old.id, old.content);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS memos_au AFTER UPDATE ON memos BEGIN
+        INSERT INTO memos_fts(memos_fts, rowid, content) VALUES ('delete', old.id, old.content);
+        INSERT INTO memos_fts(rowid, content) VALUES (new.id, new.content);
+    END;
+
+    CREATE TABLE IF NOT EXISTS reminders (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id TEXT NOT NULL,
+        content TEXT NOT NULL,
+        remind_at TIMESTAMP NOT NULL,
+        recurrence TEXT DEFAULT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_reminder_time ON reminders(remind_at);
+
+    CREATE TABLE IF NOT EXISTS briefing_settings (
+        user_id TEXT PRIMARY KEY,
+        enabled INTEGER NOT NULL DEFAULT 1,
+        time TEXT NOT NULL DEFAULT '08:00',
+        city TEXT NOT NULL DEFAULT '서울',
+        last_sent TEXT DEFAULT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS conversation_summaries (
+        user_id TEXT PRIMARY KEY,
+        summary TEXT NOT NULL,
+        message_count INTEGER NOT NULL DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS mail_settings (
+        user_id TEXT PRIMARY KEY,
+        enabled INTEGER DEFAULT 1,
+        last_checked TEXT
+    );
+
+    CREATE TABLE IF NOT EXISTS mail_uid_anchors (
+        provider TEXT NOT NULL,
+        account TEXT NOT NULL,
+        uidvalidity INTEGER NOT NULL,
+        uidnext INTEGER NOT NULL,
+        PRIMARY KEY (provider, account)
+    );
+"""
+
+
+class FakeIMAP:
+    """In-memory stand-in for imaplib.IMAP4_SSL serving fixed headers by UID.
+
+    Every command is recorded in `calls` as (name, *args) for assertions.
+    """
+
+    def __init__(self, headers: dict[int, bytes], uidvalidity: int = 1):
+        self.headers = headers
+        self.uidvalidity = uidvalidity
+        self.calls: list[tuple] = []
+
+    def _record(self, *call):
+        self.calls.append(call)
+        return "OK", [b""]
+
+    def login(self, user, password):
+        return self._record("login", user, password)
+
+    def select(self, mailbox="INBOX"):
+        self._record("select", mailbox)
+        return "OK", [str(len(self.headers)).encode()]
+
+    def noop(self):
+        return self._record("noop")
+
+    def response(self, code):
+        # Untagged data left by the last SELECT
+        if code == "UIDVALIDITY":
+            return code, [str(self.uidvalidity).encode()]
+        return code, [None]
+
+    def logout(self):
+        return self._record("logout")
+
+    def shutdown(self):
+        self._record("shutdown")
+
+    def uid(self, command, *args):
+        self.calls.append(("uid", command, *args))
+        if command == "SEARCH":
+            uids = sorted(self.headers)
+            criteria = args[-1]
+            if criteria.startswith("UID "):
+                # Like a real server, "N:*" still returns the newest UID when none reach N
+                since = int(criteria.split()[1].split(":")[0])
+                uids = [u for u in uids if u >= since] or uids[-1:]
+            return "OK", [b" ".join(str(u).encode() for u in uids)]
+        if command == "FETCH":
+            data = []
+            for uid in args[0].split(b","):
+                header = self.headers[int(uid)]
+                data.append((b"%s (UID %s BODY[HEADER] {%d}" % (uid, uid, len(header)), header))
+                data.append(b")")
+            return "OK", data
+        raise AssertionError(f"unexpected UID command: {command}")
+
+
+@pytest.fixture
+def fake_imap():
+    """Factory for FakeIMAP servers: fake_imap({uid: raw_header, ...})."""
+    return FakeIMAP
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop when available (not supported on Windows)."""
+    if uvloop is not None and sys.platform != "win32":
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest.fixture(autouse=True)
+def frozen_now():
+    """Freeze the wall clock at FROZEN_NOW for every test (when time-machine is installed).
+
+    Only wall-clock time is frozen; monotonic time keeps running, so asyncio
+    timers behave normally.
+    """
+    if time_machine is None:
+        yield None
+        return
+    with time_machine.travel(FROZEN_NOW, tick=False) as traveller:
+        yield traveller
+
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for the test session."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+def ollama_client():
+    """One OllamaClient for the whole run; build_system_prompt doesn't touch its state."""
+    return OllamaClient()
 
 
 @pytest_asyncio.fixture
-async def tmp_db(tmp_path):
-    """Create a temporary SQLite database with all tables initialized."""
-    db_path = tmp_path / "test.db"
-
-    async with aiosqlite.connect(db_path) as db:
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS conversations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id TEXT NOT NULL,
-                role TEXT NOT NULL,
-                content TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        await db.execute("""
-            CREATE INDEX IF NOT EXISTS idx_user_id ON conversations(user_id)
-        """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS personas (
-                user_id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                role TEXT NOT NULL,
-                tone TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS memos (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id TEXT NOT NULL,
-                content TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        await db.execute("""
-            CREATE INDEX IF NOT EXISTS idx_memo_user_id ON memos(user_id)
-        """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS reminders (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id TEXT NOT NULL,
-                content TEXT NOT NULL,
-                remind_at TIMESTAMP NOT NULL,
-                recurrence TEXT DEFAULT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        await db.execute("""
-            CREATE INDEX IF NOT EXISTS idx_reminder_time ON reminders(remind_at)
-        """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS briefing_settings (
-                user_id TEXT PRIMARY KEY,
-                enabled INTEGER NOT NULL DEFAULT 1,
-                time TEXT NOT NULL DEFAULT '08:00',
-                city TEXT NOT NULL DEFAULT '서울',
-                last_sent TEXT DEFAULT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS conversation_summaries (
-                user_id TEXT PRIMARY KEY,
-                summary TEXT NOT NULL,
-                message_count INTEGER NOT NULL DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS mail_settings (
-                user_id TEXT PRIMARY KEY,
-                enabled INTEGER DEFAULT 1,
-                last_checked TEXT
-            )
-        """)
+async def tmp_db():
+    """Create a private in-memory SQLite database with all tables initialized.
+
+    Uses a shared-cache URI so every connection the DB classes open sees the
+    same data; the fixture's own connection keeps the database alive until
+    the test finishes.
+    """
+    db_path = f"file:memdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
+
+    async with aiosqlite.connect(db_path, uri=True) as db:
+        await db.executescript(SCHEMA)
         await db.commit()
 
-    yield db_path
+        yield db_path
+
+
+@pytest_asyncio.fixture
+async def tmp_file_db(tmp_path):
+    """Create an on-disk WAL SQLite database with all tables initialized.
+
+    Shared-cache memory databases raise table-lock errors on concurrent writes
+    instead of waiting, so concurrency tests use a file like production does.
+    """
+    db_file = tmp_path / "bot.db"
+    async with aiosqlite.connect(db_file) as db:
+        await db.execute("PRAGMA journal_mode=WAL")
+        await db.executescript(SCHEMA)
+    return str(db_file)
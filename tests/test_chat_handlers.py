@@ -1,8 +1,8 @@
 """Tests for Tool classes (memo, search, briefing) and ChatHandler._maybe_compress()."""
+import copy
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-import pytest_asyncio
 
 from src.bot.handlers.chat import ChatHandler
 from src.bot.tools import ToolContext
@@ -13,16 +13,21 @@ from src.bot.tools.briefing import BriefingTool
 
 USER_ID = "test_user_123"
 
+# 22 references to one dict — _maybe_compress only reads and slices the list
+_DUMMY_MSGS = [{"role": "user", "content": ""}] * 22
+
+
+# Prebuilt mock skeleton; each test gets its own deep copy.
+# copy.copy() would share the child AsyncMocks (and their call records) between tests.
+_DB_TEMPLATE = MagicMock()
+_DB_TEMPLATE.memo = AsyncMock()
+_DB_TEMPLATE.conversation = AsyncMock()
+
 
 @pytest.fixture
 def mock_db():
-    """Mock DB with async memo, conversation, persona, reminder sub-mocks."""
-    db = MagicMock()
-    db.memo = AsyncMock()
-    db.conversation = AsyncMock()
-    db.persona = AsyncMock()
-    db.reminder = AsyncMock()
-    return db
+    """Mock DB with async memo and conversation sub-mocks."""
+    return copy.deepcopy(_DB_TEMPLATE)
 
 
 @pytest.fixture
@@ -40,12 +45,13 @@ def briefing_tool():
     return BriefingTool()
 
 
-def make_context(db):
-    return ToolContext(user_id=USER_ID, db=db, persona={})
+@pytest.fixture
+def context(mock_db):
+    return ToolContext(user_id=USER_ID, db=mock_db, persona={})
 
 
-@pytest_asyncio.fixture
-async def chat_handler(mock_db):
+@pytest.fixture
+def chat_handler(mock_db):
     """Create ChatHandler with mocked dependencies (for _maybe_compress tests)."""
     mock_llm = MagicMock()
     handler = ChatHandler(mock_db, mock_llm)
@@ -56,9 +62,8 @@ async def chat_handler(mock_db):
 
 class TestTryMemoSave:
     @pytest.mark.asyncio
-    async def test_save_memo(self, memo_tool, mock_db):
+    async def test_save_memo(self, memo_tool, mock_db, context):
         mock_db.memo.add = AsyncMock(return_value=1)
-        context = make_context(mock_db)
 
         result = await memo_tool.try_execute("[MEMO_SAVE:우유 사기]", context)
 
@@ -69,9 +74,8 @@ class TestTryMemoSave:
         mock_db.memo.add.assert_called_once_with(USER_ID, "우유 사기")
 
     @pytest.mark.asyncio
-    async def test_save_memo_strips_whitespace(self, memo_tool, mock_db):
+    async def test_save_memo_strips_whitespace(self, memo_tool, mock_db, context):
         mock_db.memo.add = AsyncMock(return_value=5)
-        context = make_context(mock_db)
 
         result = await memo_tool.try_execute("[MEMO_SAVE:  내용에 공백  ]", context)
 
@@ -83,12 +87,11 @@ class TestTryMemoSave:
 
 class TestTryMemoList:
     @pytest.mark.asyncio
-    async def test_list_memos(self, memo_tool, mock_db):
+    async def test_list_memos(self, memo_tool, mock_db, context):
         mock_db.memo.get_all = AsyncMock(return_value=[
             {"id": 1, "content": "우유 사기", "created_at": "2026-02-13 10:00:00"},
             {"id": 2, "content": "회의 준비", "created_at": "2026-02-13 11:00:00"},
         ])
-        context = make_context(mock_db)
 
         result = await memo_tool.try_execute("[MEMO_LIST]", context)
 
@@ -100,9 +103,8 @@ class TestTryMemoList:
         assert "#2" in result
 
     @pytest.mark.asyncio
-    async def test_list_empty(self, memo_tool, mock_db):
+    async def test_list_empty(self, memo_tool, mock_db, context):
         mock_db.memo.get_all = AsyncMock(return_value=[])
-        context = make_context(mock_db)
 
         result = await memo_tool.try_execute("[MEMO_LIST]", context)
 
@@ -114,11 +116,10 @@ class TestTryMemoList:
 
 class TestTryMemoSearch:
     @pytest.mark.asyncio
-    async def test_search_found(self, memo_tool, mock_db):
+    async def test_search_found(self, memo_tool, mock_db, context):
         mock_db.memo.search = AsyncMock(return_value=[
             {"id": 1, "content": "우유 사기", "created_at": "2026-02-13 10:00:00"},
         ])
-        context = make_context(mock_db)
 
         result = await memo_tool.try_execute("[MEMO_SEARCH:우유]", context)
 
@@ -128,9 +129,8 @@ class TestTryMemoSearch:
         mock_db.memo.search.assert_called_once_with(USER_ID, "우유")
 
     @pytest.mark.asyncio
-    async def test_search_not_found(self, memo_tool, mock_db):
+    async def test_search_not_found(self, memo_tool, mock_db, context):
         mock_db.memo.search = AsyncMock(return_value=[])
-        context = make_context(mock_db)
 
         result = await memo_tool.try_execute("[MEMO_SEARCH:없는키워드]", context)
 
@@ -142,14 +142,13 @@ class TestTryMemoSearch:
 
 class TestTryMemoDel:
     @pytest.mark.asyncio
-    async def test_delete_by_position_success(self, memo_tool, mock_db):
+    async def test_delete_by_position_success(self, memo_tool, mock_db, context):
         """position=1 → 목록의 첫 번째 메모(DB id=10) 삭제"""
         mock_db.memo.get_all = AsyncMock(return_value=[
             {"id": 10, "content": "첫 번째 메모", "created_at": "2026-02-13 12:00:00"},
             {"id": 5, "content": "두 번째 메모", "created_at": "2026-02-13 11:00:00"},
         ])
         mock_db.memo.delete = AsyncMock(return_value=True)
-        context = make_context(mock_db)
 
         result = await memo_tool.try_execute("[MEMO_DEL:1]", context)
 
@@ -159,26 +158,24 @@ class TestTryMemoDel:
         mock_db.memo.delete.assert_called_once_with(USER_ID, 10)
 
     @pytest.mark.asyncio
-    async def test_delete_by_position_second(self, memo_tool, mock_db):
+    async def test_delete_by_position_second(self, memo_tool, mock_db, context):
         """position=2 → 목록의 두 번째 메모(DB id=5) 삭제"""
         mock_db.memo.get_all = AsyncMock(return_value=[
             {"id": 10, "content": "첫 번째", "created_at": "2026-02-13 12:00:00"},
             {"id": 5, "content": "두 번째", "created_at": "2026-02-13 11:00:00"},
         ])
         mock_db.memo.delete = AsyncMock(return_value=True)
-        context = make_context(mock_db)
 
         result = await memo_tool.try_execute("[MEMO_DEL:2]", context)
 
         mock_db.memo.delete.assert_called_once_with(USER_ID, 5)
 
     @pytest.mark.asyncio
-    async def test_delete_position_out_of_range(self, memo_tool, mock_db):
+    async def test_delete_position_out_of_range(self, memo_tool, mock_db, context):
         """범위 밖 position → 에러 메시지"""
         mock_db.memo.get_all = AsyncMock(return_value=[
             {"id": 1, "content": "유일한 메모", "created_at": "2026-02-13 12:00:00"},
         ])
-        context = make_context(mock_db)
 
         result = await memo_tool.try_execute("[MEMO_DEL:5]", context)
 
@@ -187,22 +184,20 @@ class TestTryMemoDel:
         assert "5번째" in result
 
     @pytest.mark.asyncio
-    async def test_delete_position_zero(self, memo_tool, mock_db):
+    async def test_delete_position_zero(self, memo_tool, mock_db, context):
         """position=0 → 범위 밖 에러"""
         mock_db.memo.get_all = AsyncMock(return_value=[
             {"id": 1, "content": "메모", "created_at": "2026-02-13 12:00:00"},
         ])
-        context = make_context(mock_db)
 
         result = await memo_tool.try_execute("[MEMO_DEL:0]", context)
 
         assert "찾을 수 없습니다" in result or "개만 있습니다" in result
 
     @pytest.mark.asyncio
-    async def test_delete_empty_list(self, memo_tool, mock_db):
+    async def test_delete_empty_list(self, memo_tool, mock_db, context):
         """메모가 없는 상태에서 삭제 시도"""
         mock_db.memo.get_all = AsyncMock(return_value=[])
-        context = make_context(mock_db)
 
         result = await memo_tool.try_execute("[MEMO_DEL:1]", context)
 
@@ -210,13 +205,12 @@ class TestTryMemoDel:
         assert "0개만 있습니다" in result
 
     @pytest.mark.asyncio
-    async def test_delete_db_failure(self, memo_tool, mock_db):
+    async def test_delete_db_failure(self, memo_tool, mock_db, context):
         """DB에서 삭제 실패 (delete가 False 반환)"""
         mock_db.memo.get_all = AsyncMock(return_value=[
             {"id": 10, "content": "메모", "created_at": "2026-02-13 12:00:00"},
         ])
         mock_db.memo.delete = AsyncMock(return_value=False)
-        context = make_context(mock_db)
 
         result = await memo_tool.try_execute("[MEMO_DEL:1]", context)
 
@@ -227,14 +221,12 @@ class TestTryMemoDel:
 
 class TestTryMemoNoMatch:
     @pytest.mark.asyncio
-    async def test_no_memo_pattern(self, memo_tool, mock_db):
-        context = make_context(mock_db)
+    async def test_no_memo_pattern(self, memo_tool, context):
         result = await memo_tool.try_execute("일반 텍스트 응답입니다.", context)
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_weather_pattern_not_detected(self, memo_tool, mock_db):
-        context = make_context(mock_db)
+    async def test_weather_pattern_not_detected(self, memo_tool, context):
         result = await memo_tool.try_execute("[WEATHER:서울]", context)
         assert result is None
 
@@ -245,12 +237,11 @@ class TestTrySearch:
     @pytest.mark.asyncio
     @patch("src.bot.tools.search.web_search")
     @patch("src.bot.tools.search.format_search_results")
-    async def test_search_success(self, mock_format, mock_search, search_tool, mock_db):
+    async def test_search_success(self, mock_format, mock_search, search_tool, context):
         mock_search.return_value = [
             {"title": "비트코인", "body": "현재 시세...", "href": "https://example.com"},
         ]
         mock_format.return_value = "1. **비트코인**\n   현재 시세...\n   링크: https://example.com"
-        context = make_context(mock_db)
 
         result = await search_tool.try_execute("[SEARCH:비트코인 시세]", context)
 
@@ -261,9 +252,8 @@ class TestTrySearch:
 
     @pytest.mark.asyncio
     @patch("src.bot.tools.search.web_search")
-    async def test_search_no_results(self, mock_search, search_tool, mock_db):
+    async def test_search_no_results(self, mock_search, search_tool, context):
         mock_search.return_value = []
-        context = make_context(mock_db)
 
         result = await search_tool.try_execute("[SEARCH:아무것도없는쿼리]", context)
 
@@ -271,18 +261,16 @@ class TestTrySearch:
         assert "가져오지 못했습니다" in result
 
     @pytest.mark.asyncio
-    async def test_search_no_match(self, search_tool, mock_db):
-        context = make_context(mock_db)
+    async def test_search_no_match(self, search_tool, context):
         result = await search_tool.try_execute("검색 없이 일반 응답", context)
         assert result is None
 
     @pytest.mark.asyncio
     @patch("src.bot.tools.search.web_search")
     @patch("src.bot.tools.search.format_search_results")
-    async def test_search_strips_whitespace(self, mock_format, mock_search, search_tool, mock_db):
+    async def test_search_strips_whitespace(self, mock_format, mock_search, search_tool, context):
         mock_search.return_value = [{"title": "t", "body": "b", "href": "h"}]
         mock_format.return_value = "formatted"
-        context = make_context(mock_db)
 
         await search_tool.try_execute("[SEARCH:  공백 포함 쿼리  ]", context)
 
@@ -293,84 +281,74 @@ class TestTrySearch:
 
 class TestTryBriefingSet:
     @pytest.mark.asyncio
-    async def test_set_time_valid(self, briefing_tool, mock_db):
+    async def test_set_time_valid(self, briefing_tool, mock_db, context):
         mock_db.briefing = AsyncMock()
-        context = make_context(mock_db)
         result = await briefing_tool.try_execute("[BRIEFING_SET:time,07:00]", context)
         assert result is not None
         assert "07:00" in result
         mock_db.briefing.set_settings.assert_called_once_with(USER_ID, time="07:00")
 
     @pytest.mark.asyncio
-    async def test_set_time_invalid_format(self, briefing_tool, mock_db):
+    async def test_set_time_invalid_format(self, briefing_tool, mock_db, context):
         mock_db.briefing = AsyncMock()
-        context = make_context(mock_db)
         result = await briefing_tool.try_execute("[BRIEFING_SET:time,오전7시]", context)
         assert "형식" in result
         mock_db.briefing.set_settings.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_set_time_out_of_range(self, briefing_tool, mock_db):
+    async def test_set_time_out_of_range(self, briefing_tool, mock_db, context):
         """BUG-006 수정 확인: 25:99 같은 범위 밖 시간 거부"""
         mock_db.briefing = AsyncMock()
-        context = make_context(mock_db)
         result = await briefing_tool.try_execute("[BRIEFING_SET:time,25:99]", context)
         assert "올바르지 않습니다" in result
         mock_db.briefing.set_settings.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_set_time_boundary_valid(self, briefing_tool, mock_db):
+    async def test_set_time_boundary_valid(self, briefing_tool, mock_db, context):
         """23:59 — 최대 유효 시간"""
         mock_db.briefing = AsyncMock()
-        context = make_context(mock_db)
         result = await briefing_tool.try_execute("[BRIEFING_SET:time,23:59]", context)
         assert "23:59" in result
         mock_db.briefing.set_settings.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_set_time_boundary_zero(self, briefing_tool, mock_db):
+    async def test_set_time_boundary_zero(self, briefing_tool, mock_db, context):
         """00:00 — 최소 유효 시간"""
         mock_db.briefing = AsyncMock()
-        context = make_context(mock_db)
         result = await briefing_tool.try_execute("[BRIEFING_SET:time,00:00]", context)
         assert "00:00" in result
 
     @pytest.mark.asyncio
-    async def test_set_city(self, briefing_tool, mock_db):
+    async def test_set_city(self, briefing_tool, mock_db, context):
         mock_db.briefing = AsyncMock()
-        context = make_context(mock_db)
         result = await briefing_tool.try_execute("[BRIEFING_SET:city,부산]", context)
         assert "부산" in result
         mock_db.briefing.set_settings.assert_called_once_with(USER_ID, city="부산")
 
     @pytest.mark.asyncio
-    async def test_set_enabled_true(self, briefing_tool, mock_db):
+    async def test_set_enabled_true(self, briefing_tool, mock_db, context):
         mock_db.briefing = AsyncMock()
-        context = make_context(mock_db)
         result = await briefing_tool.try_execute("[BRIEFING_SET:enabled,true]", context)
         assert "활성화" in result
         mock_db.briefing.set_settings.assert_called_once_with(USER_ID, enabled=True)
 
     @pytest.mark.asyncio
-    async def test_set_enabled_false(self, briefing_tool, mock_db):
+    async def test_set_enabled_false(self, briefing_tool, mock_db, context):
         mock_db.briefing = AsyncMock()
-        context = make_context(mock_db)
         result = await briefing_tool.try_execute("[BRIEFING_SET:enabled,false]", context)
         assert "비활성화" in result
         mock_db.briefing.set_settings.assert_called_once_with(USER_ID, enabled=False)
 
     @pytest.mark.asyncio
-    async def test_set_enabled_off(self, briefing_tool, mock_db):
+    async def test_set_enabled_off(self, briefing_tool, mock_db, context):
         """'off' 문자열도 비활성화로 처리"""
         mock_db.briefing = AsyncMock()
-        context = make_context(mock_db)
         result = await briefing_tool.try_execute("[BRIEFING_SET:enabled,off]", context)
         assert "비활성화" in result
 
     @pytest.mark.asyncio
-    async def test_set_unknown_key(self, briefing_tool, mock_db):
+    async def test_set_unknown_key(self, briefing_tool, mock_db, context):
         mock_db.briefing = AsyncMock()
-        context = make_context(mock_db)
         result = await briefing_tool.try_execute("[BRIEFING_SET:unknown,value]", context)
         assert "알 수 없는" in result
 
@@ -379,17 +357,16 @@ class TestTryBriefingSet:
 
 class TestTryBriefingGet:
     @pytest.mark.asyncio
-    async def test_get_default_settings(self, briefing_tool, mock_db):
+    async def test_get_default_settings(self, briefing_tool, mock_db, context):
         mock_db.briefing = AsyncMock()
         mock_db.briefing.get_settings = AsyncMock(return_value=None)
-        context = make_context(mock_db)
         result = await briefing_tool.try_execute("[BRIEFING_GET]", context)
         assert "기본값" in result
         assert "08:00" in result
         assert "서울" in result
 
     @pytest.mark.asyncio
-    async def test_get_custom_settings(self, briefing_tool, mock_db):
+    async def test_get_custom_settings(self, briefing_tool, mock_db, context):
         mock_db.briefing = AsyncMock()
         mock_db.briefing.get_settings = AsyncMock(return_value={
             "enabled": True,
@@ -397,14 +374,13 @@ class TestTryBriefingGet:
             "city": "부산",
             "last_sent": "2026-02-14 07:00:00"
         })
-        context = make_context(mock_db)
         result = await briefing_tool.try_execute("[BRIEFING_GET]", context)
         assert "07:00" in result
         assert "부산" in result
         assert "활성화" in result
 
     @pytest.mark.asyncio
-    async def test_get_disabled_settings(self, briefing_tool, mock_db):
+    async def test_get_disabled_settings(self, briefing_tool, mock_db, context):
         mock_db.briefing = AsyncMock()
         mock_db.briefing.get_settings = AsyncMock(return_value={
             "enabled": False,
@@ -412,7 +388,6 @@ class TestTryBriefingGet:
             "city": "서울",
             "last_sent": None
         })
-        context = make_context(mock_db)
         result = await briefing_tool.try_execute("[BRIEFING_GET]", context)
         assert "비활성화" in result
 
@@ -421,16 +396,14 @@ class TestTryBriefingGet:
 
 class TestTryBriefingNoMatch:
     @pytest.mark.asyncio
-    async def test_no_briefing_pattern(self, briefing_tool, mock_db):
+    async def test_no_briefing_pattern(self, briefing_tool, mock_db, context):
         mock_db.briefing = AsyncMock()
-        context = make_context(mock_db)
         result = await briefing_tool.try_execute("일반 응답입니다.", context)
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_memo_pattern_not_detected(self, briefing_tool, mock_db):
+    async def test_memo_pattern_not_detected(self, briefing_tool, mock_db, context):
         mock_db.briefing = AsyncMock()
-        context = make_context(mock_db)
         result = await briefing_tool.try_execute("[MEMO_LIST]", context)
         assert result is None
 
@@ -452,9 +425,8 @@ class TestMaybeCompress:
     @pytest.mark.asyncio
     async def test_compress_triggered_above_threshold(self, chat_handler):
         """메시지 수가 임계값 초과 시 압축이 실행된다."""
-        messages = [{"role": "user", "content": f"메시지 {i}"} for i in range(22)]
         chat_handler.db.conversation.get_message_count = AsyncMock(return_value=22)
-        chat_handler.db.conversation.get_all_messages = AsyncMock(return_value=messages)
+        chat_handler.db.conversation.get_all_messages = AsyncMock(return_value=_DUMMY_MSGS)
         chat_handler.db.conversation.get_summary = AsyncMock(return_value=None)
         chat_handler.db.conversation.save_summary = AsyncMock()
         chat_handler.db.conversation.delete_old_messages = AsyncMock()
@@ -476,9 +448,8 @@ class TestMaybeCompress:
     @pytest.mark.asyncio
     async def test_compress_with_existing_summary(self, chat_handler):
         """기존 요약이 있을 때 통합 요약 프롬프트를 사용한다."""
-        messages = [{"role": "user", "content": f"메시지 {i}"} for i in range(22)]
         chat_handler.db.conversation.get_message_count = AsyncMock(return_value=22)
-        chat_handler.db.conversation.get_all_messages = AsyncMock(return_value=messages)
+        chat_handler.db.conversation.get_all_messages = AsyncMock(return_value=_DUMMY_MSGS)
         chat_handler.db.conversation.get_summary = AsyncMock(return_value="기존 요약 내용")
         chat_handler.db.conversation.save_summary = AsyncMock()
         chat_handler.db.conversation.delete_old_messages = AsyncMock()
@@ -499,9 +470,8 @@ class TestMaybeCompress:
     @pytest.mark.asyncio
     async def test_compress_failure_does_not_delete_messages(self, chat_handler):
         """요약 LLM 호출 실패 시 메시지를 삭제하지 않는다."""
-        messages = [{"role": "user", "content": f"메시지 {i}"} for i in range(22)]
         chat_handler.db.conversation.get_message_count = AsyncMock(return_value=22)
-        chat_handler.db.conversation.get_all_messages = AsyncMock(return_value=messages)
+        chat_handler.db.conversation.get_all_messages = AsyncMock(return_value=_DUMMY_MSGS)
         chat_handler.db.conversation.get_summary = AsyncMock(return_value=None)
         chat_handler.db.conversation.save_summary = AsyncMock()
         chat_handler.db.conversation.delete_old_messages = AsyncMock()
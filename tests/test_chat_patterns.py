@@ -9,6 +9,7 @@ from src.bot.tools.persona import PersonaTool
 from src.bot.tools.memo import MemoTool
 from src.bot.tools.search import SearchTool
 from src.bot.tools.briefing import BriefingTool
+from src.bot.handlers.chat import TOOL_CALL_PATTERN, find_tool_calls
 
 # Expose class-level PATTERN attributes as module-level names for test convenience
 WEATHER_PATTERN = WeatherTool.PATTERN
@@ -24,292 +25,185 @@ BRIEFING_SET_PATTERN = BriefingTool.BRIEFING_SET_PATTERN
 BRIEFING_GET_PATTERN = BriefingTool.BRIEFING_GET_PATTERN
 
 
-# ─── WEATHER_PATTERN ───
-
-class TestWeatherPattern:
-    def test_basic_city(self):
-        match = WEATHER_PATTERN.search("[WEATHER:서울]")
-        assert match is not None
-        assert match.group(1) == "서울"
-
-    def test_english_city(self):
-        match = WEATHER_PATTERN.search("[WEATHER:Tokyo]")
-        assert match is not None
-        assert match.group(1) == "Tokyo"
-
-    def test_embedded_in_text(self):
-        text = "날씨를 확인하겠습니다. [WEATHER:부산] 잠시만 기다려주세요."
-        match = WEATHER_PATTERN.search(text)
-        assert match is not None
-        assert match.group(1) == "부산"
-
-    def test_no_match(self):
-        assert WEATHER_PATTERN.search("날씨가 좋네요") is None
-
-    def test_empty_city(self):
-        """빈 도시명은 매칭하지 않아야 함"""
-        match = WEATHER_PATTERN.search("[WEATHER:]")
+# ─── 전체 패턴 테이블 ───
+
+ALL_PATTERNS = (
+    ("weather", WEATHER_PATTERN, "[WEATHER:서울]"),
+    ("exchange", EXCHANGE_PATTERN, "[EXCHANGE:100,USD,KRW]"),
+    ("reminder", REMINDER_PATTERN, "[REMINDER:30분,회의 참석]"),
+    ("persona", PERSONA_PATTERN, "[PERSONA:뽀삐,개인 비서,친근한 반말]"),
+    ("memo_save", MEMO_SAVE_PATTERN, "[MEMO_SAVE:우유 사기]"),
+    ("memo_list", MEMO_LIST_PATTERN, "[MEMO_LIST]"),
+    ("memo_search", MEMO_SEARCH_PATTERN, "[MEMO_SEARCH:우유]"),
+    ("memo_del", MEMO_DEL_PATTERN, "[MEMO_DEL:3]"),
+    ("search", SEARCH_PATTERN, "[SEARCH:비트코인 시세]"),
+    ("briefing_set", BRIEFING_SET_PATTERN, "[BRIEFING_SET:time,07:00]"),
+    ("briefing_get", BRIEFING_GET_PATTERN, "[BRIEFING_GET]"),
+)
+ALL_PATTERN_IDS = [name for name, _, _ in ALL_PATTERNS]
+PATTERNS = {name: pattern for name, pattern, _ in ALL_PATTERNS}
+
+
+# ─── 패턴별 매칭 케이스 ───
+# expected: 캡처 그룹 튜플, None이면 매칭되지 않아야 함
+
+PATTERN_CASES = [
+    # WEATHER
+    pytest.param("weather", "[WEATHER:서울]", ("서울",), id="weather-basic_city"),
+    pytest.param("weather", "[WEATHER:Tokyo]", ("Tokyo",), id="weather-english_city"),
+    pytest.param("weather", "날씨를 확인하겠습니다. [WEATHER:부산] 잠시만 기다려주세요.", ("부산",), id="weather-embedded_in_text"),
+    pytest.param("weather", "날씨가 좋네요", None, id="weather-no_match"),
+    pytest.param("weather", "[WEATHER:]", None, id="weather-empty_city"),  # 빈 도시명은 매칭하지 않아야 함
+    # 빈 태그 뒤에 다른 ']'가 있어도 도시명이 태그 경계를 넘어가면 안 됨
+    pytest.param("weather", "[WEATHER:] 확인했어요 [참고]", None, id="weather-empty_city_later_bracket"),
+    # EXCHANGE
+    pytest.param("exchange", "[EXCHANGE:100,USD,KRW]", ("100", "USD", "KRW"), id="exchange-basic"),
+    pytest.param("exchange", "[EXCHANGE:50.5,EUR,USD]", ("50.5", "EUR", "USD"), id="exchange-decimal_amount"),
+    pytest.param("exchange", "환율을 확인할게요. [EXCHANGE:1000,JPY,KRW]", ("1000", "JPY", "KRW"), id="exchange-embedded_in_text"),
+    pytest.param("exchange", "100달러를 원화로", None, id="exchange-no_match"),
+    # 통화 코드/금액은 ASCII 대문자·숫자로 제한하지 않음 (도구에서 strip().upper()/float 폴백 처리)
+    pytest.param("exchange", "[EXCHANGE:100, usd, krw]", ("100", " usd", " krw"), id="exchange-lowercase_spaced_codes"),
+    pytest.param("exchange", "[EXCHANGE:백,USD,KRW]", ("백", "USD", "KRW"), id="exchange-non_numeric_amount"),
+    # REMINDER
+    pytest.param("reminder", "[REMINDER:30분,회의 참석]", ("30분", "회의 참석"), id="reminder-basic"),
+    pytest.param("reminder", "[REMINDER:1시간,약 먹기! 중요함]", ("1시간", "약 먹기! 중요함"), id="reminder-special_chars"),
+    pytest.param("reminder", "알겠습니다! [REMINDER:14:00,점심 약속] 등록했어요.", ("14:00", "점심 약속"), id="reminder-embedded_in_text"),
+    pytest.param("reminder", "30분 후에 알려줘", None, id="reminder-no_match"),
+    # PERSONA
+    pytest.param("persona", "[PERSONA:뽀삐,개인 비서,친근한 반말]", ("뽀삐", "개인 비서", "친근한 반말"), id="persona-basic"),
+    pytest.param("persona", "페르소나를 변경합니다. [PERSONA:쿠키,친구,존댓말]", ("쿠키", "친구", "존댓말"), id="persona-embedded_in_text"),
+    pytest.param("persona", "이름을 바꿔줘", None, id="persona-no_match"),
+    # MEMO_SAVE
+    pytest.param("memo_save", "[MEMO_SAVE:우유 사기]", ("우유 사기",), id="memo_save-basic"),
+    pytest.param("memo_save", "[MEMO_SAVE:프로젝트 마감일 금요일 오후 5시까지]", ("프로젝트 마감일 금요일 오후 5시까지",), id="memo_save-long_content"),
+    pytest.param("memo_save", "메모를 저장할게요. [MEMO_SAVE:내일 회의 자료 준비]", ("내일 회의 자료 준비",), id="memo_save-embedded_in_text"),
+    pytest.param("memo_save", "메모해줘 우유 사기", None, id="memo_save-no_match"),
+    pytest.param("memo_save", "[MEMO_SAVE:]", None, id="memo_save-empty_content"),  # .+ 패턴이 최소 1글자를 요구
+    # MEMO_LIST
+    pytest.param("memo_list", "[MEMO_LIST]", (), id="memo_list-basic"),
+    pytest.param("memo_list", "메모 목록을 보여드릴게요. [MEMO_LIST]", (), id="memo_list-embedded_in_text"),
+    pytest.param("memo_list", "메모 목록 보여줘", None, id="memo_list-no_match"),
+    pytest.param("memo_list", "[MEMO_LIST]extra", (), id="memo_list-trailing_text"),  # 태그 자체는 매칭됨
+    # MEMO_SEARCH
+    pytest.param("memo_search", "[MEMO_SEARCH:우유]", ("우유",), id="memo_search-basic"),
+    pytest.param("memo_search", "[MEMO_SEARCH:회의 자료]", ("회의 자료",), id="memo_search-korean_query"),
+    pytest.param("memo_search", "검색해볼게요. [MEMO_SEARCH:마감일]", ("마감일",), id="memo_search-embedded"),
+    pytest.param("memo_search", "메모 찾아줘", None, id="memo_search-no_match"),
+    # MEMO_DEL
+    pytest.param("memo_del", "[MEMO_DEL:3]", ("3",), id="memo_del-basic"),
+    pytest.param("memo_del", "[MEMO_DEL:42]", ("42",), id="memo_del-multi_digit"),
+    pytest.param("memo_del", "삭제할게요. [MEMO_DEL:7]", ("7",), id="memo_del-embedded"),
+    pytest.param("memo_del", "[MEMO_DEL:abc]", None, id="memo_del-non_numeric"),  # 숫자가 아닌 ID는 매칭하지 않아야 함
+    pytest.param("memo_del", "메모 삭제해줘", None, id="memo_del-no_match"),
+    # SEARCH
+    pytest.param("search", "[SEARCH:비트코인 시세]", ("비트코인 시세",), id="search-basic"),
+    pytest.param("search", "[SEARCH:python 3.13 new features]", ("python 3.13 new features",), id="search-english_query"),
+    pytest.param("search", "검색해볼게요. [SEARCH:2026 아이폰 출시일]", ("2026 아이폰 출시일",), id="search-embedded"),
+    pytest.param("search", "검색해줘", None, id="search-no_match"),
+    pytest.param("search", "[SEARCH:]", None, id="search-empty_query"),  # .+ 패턴이 최소 1글자를 요구
+    # BRIEFING_SET
+    pytest.param("briefing_set", "[BRIEFING_SET:time,07:00]", ("time", "07:00"), id="briefing_set-time"),
+    pytest.param("briefing_set", "[BRIEFING_SET:city,부산]", ("city", "부산"), id="briefing_set-city"),
+    pytest.param("briefing_set", "[BRIEFING_SET:enabled,false]", ("enabled", "false"), id="briefing_set-enabled"),
+    pytest.param("briefing_set", "설정을 변경할게요. [BRIEFING_SET:time,08:30]", ("time", "08:30"), id="briefing_set-embedded_in_text"),
+    pytest.param("briefing_set", "브리핑 시간 변경", None, id="briefing_set-no_match"),
+    # key는 .+? (non-greedy)로 첫 번째 콤마에서 분리, value에 콤마 포함 가능
+    pytest.param("briefing_set", "[BRIEFING_SET:city,서울,강남구]", ("city", "서울,강남구"), id="briefing_set-non_greedy_key"),
+    # BRIEFING_GET
+    pytest.param("briefing_get", "[BRIEFING_GET]", (), id="briefing_get-basic"),
+    pytest.param("briefing_get", "현재 설정을 확인해볼게요. [BRIEFING_GET]", (), id="briefing_get-embedded_in_text"),
+    pytest.param("briefing_get", "브리핑 설정 보여줘", None, id="briefing_get-no_match"),
+]
+
+
+@pytest.mark.parametrize("name,text,expected", PATTERN_CASES)
+def test_pattern_case(name, text, expected):
+    match = PATTERNS[name].search(text)
+    if expected is None:
         assert match is None
-
-
-# ─── EXCHANGE_PATTERN ───
-
-class TestExchangePattern:
-    def test_basic(self):
-        match = EXCHANGE_PATTERN.search("[EXCHANGE:100,USD,KRW]")
-        assert match is not None
-        assert match.group(1) == "100"
-        assert match.group(2) == "USD"
-        assert match.group(3) == "KRW"
-
-    def test_decimal_amount(self):
-        match = EXCHANGE_PATTERN.search("[EXCHANGE:50.5,EUR,USD]")
-        assert match is not None
-        assert match.group(1) == "50.5"
-
-    def test_embedded_in_text(self):
-        text = "환율을 확인할게요. [EXCHANGE:1000,JPY,KRW]"
-        match = EXCHANGE_PATTERN.search(text)
-        assert match is not None
-        assert match.group(2) == "JPY"
-
-    def test_no_match(self):
-        assert EXCHANGE_PATTERN.search("100달러를 원화로") is None
-
-
-# ─── REMINDER_PATTERN ───
-
-class TestReminderPattern:
-    def test_basic(self):
-        match = REMINDER_PATTERN.search("[REMINDER:30분,회의 참석]")
-        assert match is not None
-        assert match.group(1) == "30분"
-        assert match.group(2) == "회의 참석"
-
-    def test_content_with_special_chars(self):
-        match = REMINDER_PATTERN.search("[REMINDER:1시간,약 먹기! 중요함]")
-        assert match is not None
-        assert "약 먹기" in match.group(2)
-
-    def test_embedded_in_text(self):
-        text = "알겠습니다! [REMINDER:14:00,점심 약속] 등록했어요."
-        match = REMINDER_PATTERN.search(text)
+    else:
         assert match is not None
-        assert match.group(1) == "14:00"
-
-    def test_no_match(self):
-        assert REMINDER_PATTERN.search("30분 후에 알려줘") is None
+        assert match.groups() == expected
 
 
-# ─── PERSONA_PATTERN ───
-
-class TestPersonaPattern:
-    def test_basic(self):
-        match = PERSONA_PATTERN.search("[PERSONA:뽀삐,개인 비서,친근한 반말]")
-        assert match is not None
-        assert match.group(1) == "뽀삐"
-        assert match.group(2) == "개인 비서"
-        assert match.group(3) == "친근한 반말"
-
-    def test_embedded_in_text(self):
-        text = "페르소나를 변경합니다. [PERSONA:쿠키,친구,존댓말]"
-        match = PERSONA_PATTERN.search(text)
-        assert match is not None
-
-    def test_no_match(self):
-        assert PERSONA_PATTERN.search("이름을 바꿔줘") is None
-
-
-# ─── MEMO_SAVE_PATTERN ───
-
-class TestMemoSavePattern:
-    def test_basic(self):
-        match = MEMO_SAVE_PATTERN.search("[MEMO_SAVE:우유 사기]")
-        assert match is not None
-        assert match.group(1) == "우유 사기"
-
-    def test_long_content(self):
-        match = MEMO_SAVE_PATTERN.search("[MEMO_SAVE:프로젝트 마감일 금요일 오후 5시까지]")
-        assert match is not None
-        assert "프로젝트 마감일" in match.group(1)
-
-    def test_embedded_in_text(self):
-        text = "메모를 저장할게요. [MEMO_SAVE:내일 회의 자료 준비]"
-        match = MEMO_SAVE_PATTERN.search(text)
-        assert match is not None
-
-    def test_no_match(self):
-        assert MEMO_SAVE_PATTERN.search("메모해줘 우유 사기") is None
-
-    def test_empty_content_rejected(self):
-        """빈 내용은 .+ 패턴이 최소 1글자를 요구하므로 정상적으로 거부됨"""
-        match = MEMO_SAVE_PATTERN.search("[MEMO_SAVE:]")
-        assert match is None
-
-
-# ─── MEMO_LIST_PATTERN ───
-
-class TestMemoListPattern:
-    def test_basic(self):
-        match = MEMO_LIST_PATTERN.search("[MEMO_LIST]")
-        assert match is not None
-
-    def test_embedded_in_text(self):
-        text = "메모 목록을 보여드릴게요. [MEMO_LIST]"
-        match = MEMO_LIST_PATTERN.search(text)
-        assert match is not None
-
-    def test_no_match(self):
-        assert MEMO_LIST_PATTERN.search("메모 목록 보여줘") is None
-
-    def test_with_content_should_not_match(self):
-        """[MEMO_LIST:something]은 별도 패턴이 아님"""
-        match = MEMO_LIST_PATTERN.search("[MEMO_LIST]extra")
-        assert match is not None  # 태그 자체는 매칭됨
-
-
-# ─── MEMO_SEARCH_PATTERN ───
-
-class TestMemoSearchPattern:
-    def test_basic(self):
-        match = MEMO_SEARCH_PATTERN.search("[MEMO_SEARCH:우유]")
-        assert match is not None
-        assert match.group(1) == "우유"
-
-    def test_korean_query(self):
-        match = MEMO_SEARCH_PATTERN.search("[MEMO_SEARCH:회의 자료]")
-        assert match is not None
-        assert match.group(1) == "회의 자료"
-
-    def test_embedded(self):
-        text = "검색해볼게요. [MEMO_SEARCH:마감일]"
-        match = MEMO_SEARCH_PATTERN.search(text)
-        assert match is not None
-
-    def test_no_match(self):
-        assert MEMO_SEARCH_PATTERN.search("메모 찾아줘") is None
-
-
-# ─── MEMO_DEL_PATTERN ───
-
-class TestMemoDelPattern:
-    def test_basic(self):
-        match = MEMO_DEL_PATTERN.search("[MEMO_DEL:3]")
-        assert match is not None
-        assert match.group(1) == "3"
-
-    def test_multi_digit(self):
-        match = MEMO_DEL_PATTERN.search("[MEMO_DEL:42]")
-        assert match is not None
-        assert match.group(1) == "42"
-
-    def test_embedded(self):
-        text = "삭제할게요. [MEMO_DEL:7]"
-        match = MEMO_DEL_PATTERN.search(text)
-        assert match is not None
-
-    def test_non_numeric_should_not_match(self):
-        """숫자가 아닌 ID는 매칭하지 않아야 함"""
-        match = MEMO_DEL_PATTERN.search("[MEMO_DEL:abc]")
-        assert match is None
-
-    def test_no_match(self):
-        assert MEMO_DEL_PATTERN.search("메모 삭제해줘") is None
-
-
-# ─── SEARCH_PATTERN ───
-
-class TestSearchPattern:
-    def test_basic(self):
-        match = SEARCH_PATTERN.search("[SEARCH:비트코인 시세]")
-        assert match is not None
-        assert match.group(1) == "비트코인 시세"
-
-    def test_english_query(self):
-        match = SEARCH_PATTERN.search("[SEARCH:python 3.13 new features]")
-        assert match is not None
+# ─── 복합 패턴 감지 테스트 ───
 
-    def test_embedded(self):
-        text = "검색해볼게요. [SEARCH:2026 아이폰 출시일]"
-        match = SEARCH_PATTERN.search(text)
-        assert match is not None
-        assert match.group(1) == "2026 아이폰 출시일"
+class TestMultiplePatterns:
+    def test_weather_and_reminder_in_same_text(self):
+        text = "[WEATHER:서울] 확인 후 [REMINDER:30분,우산 챙기기]"
+        assert WEATHER_PATTERN.search(text) is not None
+        assert REMINDER_PATTERN.search(text) is not None
 
-    def test_no_match(self):
-        assert SEARCH_PATTERN.search("검색해줘") is None
+    def test_all_patterns_findall(self):
+        """findall로 여러 매치 추출 가능"""
+        text = "먼저 [WEATHER:서울] 보고, [WEATHER:부산]도 확인해줘"
+        matches = WEATHER_PATTERN.findall(text)
+        assert len(matches) == 2
+        assert matches[0] == "서울"
+        assert matches[1] == "부산"
 
-    def test_empty_query_rejected(self):
-        """빈 쿼리는 .+ 패턴이 최소 1글자를 요구하므로 정상적으로 거부됨"""
-        match = SEARCH_PATTERN.search("[SEARCH:]")
-        assert match is None
 
+# ─── 통합 패턴(TOOL_CALL_PATTERN) 테스트 ───
 
-# ─── BRIEFING_SET_PATTERN ───
+FUSED_PATTERNS = tuple(p for p in ALL_PATTERNS if p[0] in TOOL_CALL_PATTERN.groupindex)
 
-class TestBriefingSetPattern:
-    def test_set_time(self):
-        match = BRIEFING_SET_PATTERN.search("[BRIEFING_SET:time,07:00]")
-        assert match is not None
-        assert match.group(1) == "time"
-        assert match.group(2) == "07:00"
 
-    def test_set_city(self):
-        match = BRIEFING_SET_PATTERN.search("[BRIEFING_SET:city,부산]")
+class TestToolCallPattern:
+    @pytest.mark.parametrize("name,pattern,sample", FUSED_PATTERNS, ids=[p[0] for p in FUSED_PATTERNS])
+    def test_lastgroup_identifies_tool(self, name, pattern, sample):
+        match = TOOL_CALL_PATTERN.search(f"잠시만요. {sample} 확인할게요.")
         assert match is not None
-        assert match.group(1) == "city"
-        assert match.group(2) == "부산"
+        assert match.lastgroup == name
+        assert match.group(name) == sample
 
-    def test_set_enabled(self):
-        match = BRIEFING_SET_PATTERN.search("[BRIEFING_SET:enabled,false]")
-        assert match is not None
-        assert match.group(1) == "enabled"
-        assert match.group(2) == "false"
+    def test_plain_text_no_match(self):
+        assert TOOL_CALL_PATTERN.search("오늘은 맑고 따뜻한 날씨예요.") is None
 
-    def test_embedded_in_text(self):
-        text = "설정을 변경할게요. [BRIEFING_SET:time,08:30]"
-        match = BRIEFING_SET_PATTERN.search(text)
-        assert match is not None
-        assert match.group(2) == "08:30"
+    def test_other_tool_tags_not_fused(self):
+        assert TOOL_CALL_PATTERN.search("[MEMO_SAVE:우유 사기] [SEARCH:비트코인]") is None
 
-    def test_no_match(self):
-        assert BRIEFING_SET_PATTERN.search("브리핑 시간 변경") is None
+    @pytest.mark.parametrize(
+        "name,text,expected",
+        [c for c in PATTERN_CASES if c.values[0] in TOOL_CALL_PATTERN.groupindex],
+    )
+    def test_find_tool_calls_agrees_with_pattern(self, name, text, expected):
+        """Hyperscan 유무와 관계없이 개별 패턴과 같은 판정을 내려야 함"""
+        assert (name in find_tool_calls(text)) is (expected is not None)
 
-    def test_non_greedy_key(self):
-        """key 부분은 .+? (non-greedy)로 첫 번째 콤마에서 분리"""
-        match = BRIEFING_SET_PATTERN.search("[BRIEFING_SET:city,서울,강남구]")
-        assert match is not None
-        assert match.group(1) == "city"
-        assert match.group(2) == "서울,강남구"  # value에 콤마 포함 가능
+    def test_find_tool_calls_reports_nested_tags(self):
+        """다른 태그 안에 들어간 태그도 누락되지 않아야 함"""
+        text = "[REMINDER:30분,[WEATHER:서울] 확인하기]"
+        assert find_tool_calls(text) == {"weather", "reminder"}
 
+    def test_find_tool_calls_plain_text(self):
+        assert find_tool_calls("오늘은 맑고 따뜻한 날씨예요.") == frozenset()
 
-# ─── BRIEFING_GET_PATTERN ───
 
-class TestBriefingGetPattern:
-    def test_basic(self):
-        match = BRIEFING_GET_PATTERN.search("[BRIEFING_GET]")
-        assert match is not None
+try:
+    import pytest_benchmark  # noqa: F401
+    HAS_BENCHMARK = True
+except ImportError:
+    HAS_BENCHMARK = False
 
-    def test_embedded_in_text(self):
-        text = "현재 설정을 확인해볼게요. [BRIEFING_GET]"
-        match = BRIEFING_GET_PATTERN.search(text)
-        assert match is not None
 
-    def test_no_match(self):
-        assert BRIEFING_GET_PATTERN.search("브리핑 설정 보여줘") is None
+class TestAllPatterns:
+    @pytest.mark.parametrize("name,pattern,sample", ALL_PATTERNS, ids=ALL_PATTERN_IDS)
+    def test_sample_matches(self, name, pattern, sample):
+        assert pattern.search(sample) is not None
 
+    @pytest.mark.parametrize("name,pattern,sample", ALL_PATTERNS, ids=ALL_PATTERN_IDS)
+    def test_sample_embedded_in_text(self, name, pattern, sample):
+        assert pattern.search(f"잠시만요. {sample} 확인할게요.") is not None
 
-# ─── 복합 패턴 감지 테스트 ───
+    @pytest.mark.benchmark(group="regex")
+    @pytest.mark.skipif(not HAS_BENCHMARK, reason="pytest-benchmark not installed")
+    @pytest.mark.parametrize("name,pattern,sample", ALL_PATTERNS, ids=ALL_PATTERN_IDS)
+    def test_search_benchmark(self, benchmark, name, pattern, sample):
+        """opt-in: pytest-benchmark 설치 시에만 실행 (10k회 search)"""
+        text = f"잠시만요. {sample} 확인할게요."
 
-class TestMultiplePatterns:
-    def test_weather_and_reminder_in_same_text(self):
-        text = "[WEATHER:서울] 확인 후 [REMINDER:30분,우산 챙기기]"
-        assert WEATHER_PATTERN.search(text) is not None
-        assert REMINDER_PATTERN.search(text) is not None
+        def run():
+            for _ in range(10_000):
+                pattern.search(text)
 
-    def test_all_patterns_findall(self):
-        """findall로 여러 매치 추출 가능"""
-        text = "먼저 [WEATHER:서울] 보고, [WEATHER:부산]도 확인해줘"
-        matches = WEATHER_PATTERN.findall(text)
-        assert len(matches) == 2
-        assert matches[0] == "서울"
-        assert matches[1] == "부산"
+        benchmark(run)
@@ -1,4 +1,5 @@
 """Tests for src/db/ - Database layer tests with temporary SQLite"""
+import asyncio
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
@@ -9,10 +10,97 @@ from src.db.memo import MemoDB
 from src.db.conversation import ConversationDB
 from src.db.persona import PersonaDB
 from src.db.reminder import ReminderDB
+from src.db.pool import AioSqlitePool
 
 
 USER_ID = "test_user_123"
 
+_FMT = "%Y-%m-%d %H:%M:%S"
+
+
+def _fmt(dt: datetime) -> str:
+    return dt.strftime(_FMT)
+
+
+_THREE_MEMOS = frozenset(("첫 번째", "두 번째", "세 번째"))
+
+
+# ─── AioSqlitePool ───
+
+class TestAioSqlitePool:
+    @pytest_asyncio.fixture
+    async def pool(self, tmp_db):
+        pool = AioSqlitePool(tmp_db, size=2)
+        yield pool
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_opens_at_most_size_connections(self, pool):
+        """동시에 size개를 넘게 빌리면 반환될 때까지 기다려야 함"""
+        async with pool.acquire() as first:
+            async with pool.acquire() as second:
+                assert first is not second
+                third = pool.acquire()
+                waiter = asyncio.create_task(third.__aenter__())
+                await asyncio.sleep(0)
+                assert not waiter.done()
+            assert await waiter is second
+            await third.__aexit__(None, None, None)
+
+        assert len(pool._connections) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_borrowers_respect_size(self, pool):
+        """처음 동시에 빌리는 여러 요청도 size개까지만 연결을 연다"""
+        async def borrow():
+            async with pool.acquire() as db:
+                await asyncio.sleep(0.01)
+                return db
+
+        borrowed = await asyncio.gather(*(borrow() for _ in range(6)))
+
+        assert len(pool._connections) == 2
+        assert len(set(borrowed)) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_open_releases_slot(self, pool):
+        """연결 열기에 실패하면 예약한 자리를 돌려준다"""
+        with patch.object(pool, "_open", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                async with pool.acquire():
+                    pass
+
+        async with pool.acquire() as first:
+            async with pool.acquire() as second:
+                assert first is not second
+        assert len(pool._connections) == 2
+
+    @pytest.mark.asyncio
+    async def test_close_leaves_borrowed_connection_open(self, pool):
+        """close()는 빌려 간 연결을 닫지 않고, 반환될 때 닫는다"""
+        async with pool.acquire():
+            pass
+        async with pool.acquire() as db:
+            await pool.close()
+            cursor = await db.execute("SELECT 1")
+            assert (await cursor.fetchone())[0] == 1
+
+        assert pool._connections == []
+        with pytest.raises(RuntimeError):
+            async with pool.acquire():
+                pass
+
+    @pytest.mark.asyncio
+    async def test_open_transaction_rolled_back_on_release(self, pool):
+        """커밋하지 않은 변경은 다음 사용자에게 넘어가지 않아야 함"""
+        async with pool.acquire() as db:
+            await db.execute("INSERT INTO memos (user_id, content) VALUES (?, ?)", (USER_ID, "미커밋"))
+
+        async with pool.acquire() as db:
+            assert not db.in_transaction
+            cursor = await db.execute("SELECT COUNT(*) FROM memos")
+            assert (await cursor.fetchone())[0] == 0
+
 
 # ─── MemoDB ───
 
@@ -21,7 +109,8 @@ class TestMemoDB:
     async def memo_db(self, tmp_db):
         db = MemoDB()
         db.db_path = tmp_db
-        return db
+        yield db
+        await db.close()
 
     @pytest.mark.asyncio
     async def test_add_and_get_all(self, memo_db):
@@ -37,14 +126,11 @@ class TestMemoDB:
     @pytest.mark.asyncio
     async def test_add_multiple_and_count(self, memo_db):
         """여러 메모를 추가하면 모두 반환되어야 함"""
-        await memo_db.add(USER_ID, "첫 번째")
-        await memo_db.add(USER_ID, "두 번째")
-        await memo_db.add(USER_ID, "세 번째")
+        await memo_db.add_many(USER_ID, list(_THREE_MEMOS))
 
         memos = await memo_db.get_all(USER_ID)
         assert len(memos) == 3
-        contents = {m["content"] for m in memos}
-        assert contents == {"첫 번째", "두 번째", "세 번째"}
+        assert frozenset(m["content"] for m in memos) == _THREE_MEMOS
 
     @pytest.mark.asyncio
     async def test_order_with_id_tiebreaker(self, memo_db):
@@ -63,12 +149,43 @@ class TestMemoDB:
 
     @pytest.mark.asyncio
     async def test_get_all_with_limit(self, memo_db):
-        for i in range(5):
-            await memo_db.add(USER_ID, f"메모 {i}")
+        await memo_db.add_many(USER_ID, [f"메모 {i}" for i in range(5)])
 
         memos = await memo_db.get_all(USER_ID, limit=3)
         assert len(memos) == 3
 
+    @pytest.mark.asyncio
+    async def test_connection_reused_across_calls(self, memo_db):
+        """메서드마다 새 연결을 열지 않고 풀의 연결을 재사용해야 함"""
+        await memo_db.add(USER_ID, "첫 번째")
+        await memo_db.get_all(USER_ID)
+        await memo_db.search(USER_ID, "첫 번째")
+
+        assert len(memo_db._pool._connections) == 1
+
+        await memo_db.close()
+        assert memo_db._pool is None
+
+    @pytest.mark.asyncio
+    async def test_get_all_uses_composite_index(self, memo_db):
+        """(user_id, created_at DESC, id DESC) 인덱스로 정렬 없이 조회해야 함"""
+        import aiosqlite
+        async with aiosqlite.connect(memo_db.db_path, uri=True) as db:
+            cursor = await db.execute(
+                """
+                EXPLAIN QUERY PLAN
+                SELECT id, content, created_at FROM memos
+                WHERE user_id = ?
+                ORDER BY created_at DESC, id DESC
+                LIMIT ?
+                """,
+                (USER_ID, 3)
+            )
+            plan = " ".join(row[3] for row in await cursor.fetchall())
+
+        assert "idx_memo_user_created" in plan
+        assert "TEMP B-TREE" not in plan
+
     @pytest.mark.asyncio
     async def test_delete(self, memo_db):
         memo_id = await memo_db.add(USER_ID, "삭제할 메모")
@@ -105,6 +222,33 @@ class TestMemoDB:
         results = await memo_db.search(USER_ID, "존재하지않는키워드")
         assert len(results) == 0
 
+    @pytest.mark.asyncio
+    async def test_search_fts_substring(self, memo_db):
+        """3글자 이상 검색어는 FTS(trigram)로 조사가 붙은 단어 중간도 찾아야 함"""
+        await memo_db.add(USER_ID, "주간회의록을 정리하기")
+        await memo_db.add(USER_ID, "회의 준비")
+
+        results = await memo_db.search(USER_ID, "회의록")
+        assert [r["content"] for r in results] == ["주간회의록을 정리하기"]
+
+    @pytest.mark.asyncio
+    async def test_search_fts_user_isolation_and_delete(self, memo_db):
+        memo_id = await memo_db.add(USER_ID, "프로젝트 마감일")
+        await memo_db.add("other_user", "프로젝트 회고")
+
+        assert len(await memo_db.search(USER_ID, "프로젝트")) == 1
+
+        await memo_db.delete(USER_ID, memo_id)
+        assert await memo_db.search(USER_ID, "프로젝트") == []
+
+    @pytest.mark.asyncio
+    async def test_search_fts_query_syntax_is_literal(self, memo_db):
+        """FTS 연산자/따옴표가 포함된 검색어도 오류 없이 문자 그대로 검색"""
+        await memo_db.add(USER_ID, 'say "hi" OR bye')
+
+        results = await memo_db.search(USER_ID, '"hi" OR')
+        assert len(results) == 1
+
     @pytest.mark.asyncio
     async def test_user_isolation(self, memo_db):
         """다른 유저의 메모는 보이지 않아야 함"""
@@ -123,7 +267,8 @@ class TestConversationDB:
     async def conv_db(self, tmp_db):
         db = ConversationDB()
         db.db_path = tmp_db
-        return db
+        yield db
+        await db.close()
 
     @pytest.mark.asyncio
     async def test_add_and_get_history(self, conv_db):
@@ -152,8 +297,7 @@ class TestConversationDB:
 
     @pytest.mark.asyncio
     async def test_history_limit(self, conv_db):
-        for i in range(10):
-            await conv_db.add_message(USER_ID, "user", f"메시지 {i}")
+        await conv_db.add_messages(USER_ID, [("user", f"메시지 {i}") for i in range(10)])
 
         history = await conv_db.get_history(USER_ID, limit=5)
         assert len(history) == 5
@@ -189,7 +333,8 @@ class TestConversationSummary:
     async def conv_db(self, tmp_db):
         db = ConversationDB()
         db.db_path = tmp_db
-        return db
+        yield db
+        await db.close()
 
     @pytest.mark.asyncio
     async def test_get_summary_empty(self, conv_db):
@@ -216,7 +361,7 @@ class TestConversationSummary:
         await conv_db.save_summary(USER_ID, "두 번째 요약", 8)
 
         import aiosqlite
-        async with aiosqlite.connect(conv_db.db_path) as db:
+        async with aiosqlite.connect(conv_db.db_path, uri=True) as db:
             cursor = await db.execute(
                 "SELECT message_count FROM conversation_summaries WHERE user_id = ?",
                 (USER_ID,)
@@ -263,8 +408,7 @@ class TestConversationSummary:
 
     @pytest.mark.asyncio
     async def test_delete_old_messages_keeps_recent(self, conv_db):
-        for i in range(1, 13):
-            await conv_db.add_message(USER_ID, "user", f"메시지 {i}")
+        await conv_db.add_messages(USER_ID, [("user", f"메시지 {i}") for i in range(1, 13)])
 
         await conv_db.delete_old_messages(USER_ID, keep_count=5)
 
@@ -336,6 +480,40 @@ class TestPersonaDB:
         persona = await persona_db.get(USER_ID)
         assert persona is None
 
+    @pytest.mark.asyncio
+    async def test_get_cached_after_first_read(self, persona_db):
+        """한 번 읽은 페르소나는 DB를 다시 조회하지 않아야 함"""
+        await persona_db.set(USER_ID, "뽀삐", "비서", "반말")
+        persona_db.invalidate(USER_ID)
+        await persona_db.get(USER_ID)
+
+        with patch("src.db.persona.aiosqlite.connect") as mock_connect:
+            persona = await persona_db.get(USER_ID)
+
+        mock_connect.assert_not_called()
+        assert persona["name"] == "뽀삐"
+
+    @pytest.mark.asyncio
+    async def test_get_returns_copy(self, persona_db):
+        """반환된 dict를 수정해도 캐시에 영향이 없어야 함"""
+        await persona_db.set(USER_ID, "뽀삐", "비서", "반말")
+        persona = await persona_db.get(USER_ID)
+        persona["name"] = "변경됨"
+
+        assert (await persona_db.get(USER_ID))["name"] == "뽀삐"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_rereads_database(self, persona_db):
+        """외부에서 DB를 바꾼 뒤 invalidate하면 새 값을 읽어야 함"""
+        await persona_db.set(USER_ID, "뽀삐", "비서", "반말")
+        other = PersonaDB()
+        other.db_path = persona_db.db_path
+        await other.set(USER_ID, "쿠키", "친구", "존댓말")
+
+        assert (await persona_db.get(USER_ID))["name"] == "뽀삐"
+        persona_db.invalidate(USER_ID)
+        assert (await persona_db.get(USER_ID))["name"] == "쿠키"
+
 
 # ─── ReminderDB ───
 
@@ -348,7 +526,7 @@ class TestReminderDB:
 
     @pytest.mark.asyncio
     async def test_add_and_get_all(self, reminder_db):
-        remind_at = (datetime.now() + timedelta(hours=1)).strftime("%Y-%m-%d %H:%M:%S")
+        remind_at = _fmt(datetime.now() + timedelta(hours=1))
         reminder_id = await reminder_db.add(USER_ID, "회의 참석", remind_at)
 
         assert isinstance(reminder_id, int)
@@ -359,7 +537,7 @@ class TestReminderDB:
 
     @pytest.mark.asyncio
     async def test_add_with_recurrence(self, reminder_db):
-        remind_at = (datetime.now() + timedelta(hours=1)).strftime("%Y-%m-%d %H:%M:%S")
+        remind_at = _fmt(datetime.now() + timedelta(hours=1))
         await reminder_db.add(USER_ID, "매일 운동", remind_at, recurrence="daily")
 
         reminders = await reminder_db.get_all(USER_ID)
@@ -367,7 +545,7 @@ class TestReminderDB:
 
     @pytest.mark.asyncio
     async def test_delete(self, reminder_db):
-        remind_at = (datetime.now() + timedelta(hours=1)).strftime("%Y-%m-%d %H:%M:%S")
+        remind_at = _fmt(datetime.now() + timedelta(hours=1))
         rid = await reminder_db.add(USER_ID, "삭제할 리마인더", remind_at)
 
         deleted = await reminder_db.delete(USER_ID, rid)
@@ -383,7 +561,7 @@ class TestReminderDB:
 
     @pytest.mark.asyncio
     async def test_delete_by_id(self, reminder_db):
-        remind_at = (datetime.now() + timedelta(hours=1)).strftime("%Y-%m-%d %H:%M:%S")
+        remind_at = _fmt(datetime.now() + timedelta(hours=1))
         rid = await reminder_db.add(USER_ID, "알림", remind_at)
 
         await reminder_db.delete_by_id(rid)
@@ -393,10 +571,10 @@ class TestReminderDB:
 
     @pytest.mark.asyncio
     async def test_reschedule(self, reminder_db):
-        remind_at = (datetime.now() + timedelta(hours=1)).strftime("%Y-%m-%d %H:%M:%S")
+        remind_at = _fmt(datetime.now() + timedelta(hours=1))
         rid = await reminder_db.add(USER_ID, "재스케줄링", remind_at, recurrence="daily")
 
-        new_time = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S")
+        new_time = _fmt(datetime.now() + timedelta(days=1))
         await reminder_db.reschedule(rid, new_time)
 
         reminders = await reminder_db.get_all(USER_ID)
@@ -405,8 +583,8 @@ class TestReminderDB:
     @pytest.mark.asyncio
     async def test_get_due(self, reminder_db):
         """만료된 리마인더만 get_due로 가져와야 함"""
-        past = (datetime.now() - timedelta(hours=1)).strftime("%Y-%m-%d %H:%M:%S")
-        future = (datetime.now() + timedelta(hours=1)).strftime("%Y-%m-%d %H:%M:%S")
+        past = _fmt(datetime.now() - timedelta(hours=1))
+        future = _fmt(datetime.now() + timedelta(hours=1))
 
         await reminder_db.add(USER_ID, "만료됨", past)
         await reminder_db.add(USER_ID, "아직 안됨", future)
@@ -433,6 +611,15 @@ class TestReminderDBStaticMethods:
         result = ReminderDB.calc_next("2026-02-16 09:00:00", "weekday")  # 월요일
         assert result == "2026-02-17 09:00:00"  # 화요일
 
+    @pytest.mark.parametrize("remind_at", ["2026-02-14 09:00:00", "2026-02-15 09:00:00"])
+    def test_calc_next_weekday_from_weekend(self, remind_at):
+        """토/일요일 -> 다음 월요일"""
+        assert ReminderDB.calc_next(remind_at, "weekday") == "2026-02-16 09:00:00"
+
+    def test_calc_next_daily_crosses_year(self):
+        result = ReminderDB.calc_next("2026-12-31 23:59:59", "daily")
+        assert result == "2027-01-01 23:59:59"
+
     def test_calc_next_weekly(self):
         result = ReminderDB.calc_next("2026-02-13 09:00:00", "weekly:4")
         assert result == "2026-02-20 09:00:00"
@@ -1,31 +1,49 @@
 """Tests for EmailTool and send_email utility."""
 import pytest
+from types import MappingProxyType
 from unittest.mock import AsyncMock, MagicMock, patch, call
 import smtplib
 
-from src.bot.tools.email import EmailTool
+from src.bot.tools.email import EmailDraft, EmailTool
 from src.bot.tools import ToolContext
 
 
 USER_ID = "test_user_123"
 OTHER_USER = "other_user_456"
+# EmailTool은 persona를 건드리지 않으므로 읽기 전용 빈 persona 하나를 공유
+_EMPTY_PERSONA = MappingProxyType({})
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tool():
     return EmailTool()
 
 
+@pytest.fixture(autouse=True)
+def _reset_drafts(tool):
+    """모듈 공용 tool이므로 테스트마다 초안 상태를 비운다."""
+    yield
+    tool._pending_drafts.clear()
+
+
+@pytest.fixture
+def mock_send():
+    """tools.email.send_email을 AsyncMock으로 대체 (기본값: 발송 성공)."""
+    with patch("src.bot.tools.email.send_email", new_callable=AsyncMock) as m:
+        m.return_value = {"success": True, "message": "ok"}
+        yield m
+
+
 @pytest.fixture
 def context():
     db = MagicMock()
-    return ToolContext(user_id=USER_ID, db=db, persona={})
+    return ToolContext(user_id=USER_ID, db=db, persona=_EMPTY_PERSONA)
 
 
 @pytest.fixture
 def other_context():
     db = MagicMock()
-    return ToolContext(user_id=OTHER_USER, db=db, persona={})
+    return ToolContext(user_id=OTHER_USER, db=db, persona=_EMPTY_PERSONA)
 
 
 # ─── ABC 속성 ───
@@ -71,10 +89,10 @@ class TestEmailSendPattern:
         )
         assert USER_ID in tool._pending_drafts
         draft = tool._pending_drafts[USER_ID]
-        assert draft["provider"] == "naver"
-        assert draft["to"] == "friend@naver.com"
-        assert draft["subject"] == "제목"
-        assert draft["body"] == "본문"
+        assert draft.provider == "naver"
+        assert draft.to == "friend@naver.com"
+        assert draft.subject == "제목"
+        assert draft.body == "본문"
 
     @pytest.mark.asyncio
     async def test_empty_provider_uses_default(self, tool, context):
@@ -84,7 +102,7 @@ class TestEmailSendPattern:
             await tool.try_execute(
                 "[EMAIL_SEND:|friend@naver.com|제목|본문]", context
             )
-        assert tool._pending_drafts[USER_ID]["provider"] == "naver"
+        assert tool._pending_drafts[USER_ID].provider == "naver"
 
     @pytest.mark.asyncio
     async def test_body_with_commas_parsed_correctly(self, tool, context):
@@ -94,7 +112,7 @@ class TestEmailSendPattern:
             context,
         )
         draft = tool._pending_drafts[USER_ID]
-        assert draft["body"] == "안녕하세요, 잘 지내시나요, 답장 부탁드립니다"
+        assert draft.body == "안녕하세요, 잘 지내시나요, 답장 부탁드립니다"
 
     @pytest.mark.asyncio
     async def test_body_with_pipe_parsed_correctly(self, tool, context):
@@ -104,7 +122,7 @@ class TestEmailSendPattern:
         )
         draft = tool._pending_drafts[USER_ID]
         # 4번째 split 이후 전체가 body
-        assert "항목1|항목2|항목3" == draft["body"]
+        assert "항목1|항목2|항목3" == draft.body
 
     @pytest.mark.asyncio
     async def test_whitespace_stripped_from_fields(self, tool, context):
@@ -113,10 +131,10 @@ class TestEmailSendPattern:
             "[EMAIL_SEND: naver | a@naver.com | 제목 | 본문 ]", context
         )
         draft = tool._pending_drafts[USER_ID]
-        assert draft["provider"] == "naver"
-        assert draft["to"] == "a@naver.com"
-        assert draft["subject"] == "제목"
-        assert draft["body"] == "본문"
+        assert draft.provider == "naver"
+        assert draft.to == "a@naver.com"
+        assert draft.subject == "제목"
+        assert draft.body == "본문"
 
     @pytest.mark.asyncio
     async def test_missing_body_returns_format_error(self, tool, context):
@@ -138,70 +156,68 @@ class TestEmailSendPattern:
         assert "발송할까요" in result.result or "응" in result.result
         assert result.stop_loop is True
 
+    @pytest.mark.asyncio
+    async def test_send_takes_priority_over_earlier_cancel(self, tool, context):
+        """태그 위치와 무관하게 SEND가 CONFIRM/CANCEL보다 먼저 처리된다."""
+        result = await tool.try_execute(
+            "[EMAIL_CANCEL] 다시 작성할게요. [EMAIL_SEND:naver|a@naver.com|제목|본문]", context
+        )
+        assert "초안" in result.result
+        assert USER_ID in tool._pending_drafts
+
 
 # ─── EMAIL_CONFIRM 패턴 ───
 
 class TestEmailConfirmPattern:
     @pytest.mark.asyncio
-    async def test_confirm_calls_send_email(self, tool, context):
+    async def test_confirm_calls_send_email(self, tool, context, mock_send):
         """초안이 있을 때 CONFIRM → send_email 호출."""
-        tool._pending_drafts[USER_ID] = {
-            "provider": "naver",
-            "to": "friend@naver.com",
-            "subject": "테스트",
-            "body": "본문",
-        }
-        with patch("src.bot.tools.email.send_email", new=AsyncMock(
-            return_value={"success": True, "message": "발송 완료"}
-        )) as mock_send:
-            result = await tool.try_execute("[EMAIL_CONFIRM]", context)
+        tool._pending_drafts[USER_ID] = EmailDraft(
+            provider="naver",
+            to="friend@naver.com",
+            subject="테스트",
+            body="본문",
+        )
+        mock_send.return_value = {"success": True, "message": "발송 완료"}
+        result = await tool.try_execute("[EMAIL_CONFIRM]", context)
 
         mock_send.assert_called_once_with("naver", "friend@naver.com", "테스트", "본문")
         assert "발송했습니다" in result
 
     @pytest.mark.asyncio
-    async def test_confirm_deletes_draft_after_send(self, tool, context):
+    async def test_confirm_deletes_draft_after_send(self, tool, context, mock_send):
         """CONFIRM 후 초안이 삭제된다 (재발송 방지)."""
-        tool._pending_drafts[USER_ID] = {
-            "provider": "naver", "to": "a@b.com", "subject": "s", "body": "b"
-        }
-        with patch("src.bot.tools.email.send_email", new=AsyncMock(
-            return_value={"success": True, "message": "ok"}
-        )):
-            await tool.try_execute("[EMAIL_CONFIRM]", context)
+        tool._pending_drafts[USER_ID] = EmailDraft(
+            provider="naver", to="a@b.com", subject="s", body="b"
+        )
+        await tool.try_execute("[EMAIL_CONFIRM]", context)
         assert USER_ID not in tool._pending_drafts
 
     @pytest.mark.asyncio
-    async def test_confirm_on_send_failure_returns_error(self, tool, context):
+    async def test_confirm_on_send_failure_returns_error(self, tool, context, mock_send):
         """send_email 실패 시 에러 메시지 반환."""
-        tool._pending_drafts[USER_ID] = {
-            "provider": "naver", "to": "a@b.com", "subject": "s", "body": "b"
-        }
-        with patch("src.bot.tools.email.send_email", new=AsyncMock(
-            return_value={"success": False, "message": "인증 실패"}
-        )):
-            result = await tool.try_execute("[EMAIL_CONFIRM]", context)
+        tool._pending_drafts[USER_ID] = EmailDraft(
+            provider="naver", to="a@b.com", subject="s", body="b"
+        )
+        mock_send.return_value = {"success": False, "message": "인증 실패"}
+        result = await tool.try_execute("[EMAIL_CONFIRM]", context)
         assert "실패" in result
         assert "인증 실패" in result
 
     @pytest.mark.asyncio
-    async def test_confirm_without_draft_returns_error(self, tool, context):
+    async def test_confirm_without_draft_returns_error(self, tool, context, mock_send):
         """초안 없이 CONFIRM → 에러 메시지, send_email 호출 없음."""
-        with patch("src.bot.tools.email.send_email", new=AsyncMock()) as mock_send:
-            result = await tool.try_execute("[EMAIL_CONFIRM]", context)
+        result = await tool.try_execute("[EMAIL_CONFIRM]", context)
         mock_send.assert_not_called()
         assert "초안이 없습니다" in result
 
     @pytest.mark.asyncio
-    async def test_confirm_includes_recipient_in_success(self, tool, context):
+    async def test_confirm_includes_recipient_in_success(self, tool, context, mock_send):
         """성공 메시지에 수신자 정보가 포함된다."""
-        tool._pending_drafts[USER_ID] = {
-            "provider": "gmail", "to": "boss@gmail.com", "subject": "보고서", "body": "..."
-        }
-        with patch("src.bot.tools.email.send_email", new=AsyncMock(
-            return_value={"success": True, "message": "ok"}
-        )):
-            result = await tool.try_execute("[EMAIL_CONFIRM]", context)
+        tool._pending_drafts[USER_ID] = EmailDraft(
+            provider="gmail", to="boss@gmail.com", subject="보고서", body="..."
+        )
+        result = await tool.try_execute("[EMAIL_CONFIRM]", context)
         assert "boss@gmail.com" in result
 
 
@@ -211,9 +227,9 @@ class TestEmailCancelPattern:
     @pytest.mark.asyncio
     async def test_cancel_with_draft_deletes_it(self, tool, context):
         """초안이 있을 때 CANCEL → 삭제."""
-        tool._pending_drafts[USER_ID] = {
-            "provider": "naver", "to": "a@b.com", "subject": "s", "body": "b"
-        }
+        tool._pending_drafts[USER_ID] = EmailDraft(
+            provider="naver", to="a@b.com", subject="s", body="b"
+        )
         result = await tool.try_execute("[EMAIL_CANCEL]", context)
         assert USER_ID not in tool._pending_drafts
         assert "취소" in result
@@ -248,22 +264,19 @@ class TestDraftStateManagement:
         await tool.try_execute(
             "[EMAIL_SEND:gmail|b@b.com|제목B|본문B]", other_context
         )
-        assert tool._pending_drafts[USER_ID]["subject"] == "제목A"
-        assert tool._pending_drafts[OTHER_USER]["subject"] == "제목B"
+        assert tool._pending_drafts[USER_ID].subject == "제목A"
+        assert tool._pending_drafts[OTHER_USER].subject == "제목B"
 
     @pytest.mark.asyncio
-    async def test_confirm_only_deletes_own_draft(self, tool, context, other_context):
+    async def test_confirm_only_deletes_own_draft(self, tool, context, other_context, mock_send):
         """CONFIRM은 자신의 초안만 삭제한다."""
-        tool._pending_drafts[USER_ID] = {
-            "provider": "naver", "to": "a@a.com", "subject": "A", "body": "a"
-        }
-        tool._pending_drafts[OTHER_USER] = {
-            "provider": "gmail", "to": "b@b.com", "subject": "B", "body": "b"
-        }
-        with patch("src.bot.tools.email.send_email", new=AsyncMock(
-            return_value={"success": True, "message": "ok"}
-        )):
-            await tool.try_execute("[EMAIL_CONFIRM]", context)
+        tool._pending_drafts[USER_ID] = EmailDraft(
+            provider="naver", to="a@a.com", subject="A", body="a"
+        )
+        tool._pending_drafts[OTHER_USER] = EmailDraft(
+            provider="gmail", to="b@b.com", subject="B", body="b"
+        )
+        await tool.try_execute("[EMAIL_CONFIRM]", context)
         assert USER_ID not in tool._pending_drafts
         assert OTHER_USER in tool._pending_drafts
 
@@ -273,15 +286,23 @@ class TestDraftStateManagement:
         await tool.try_execute("[EMAIL_SEND:naver|a@a.com|제목1|본문1]", context)
         await tool.try_execute("[EMAIL_SEND:gmail|b@b.com|제목2|본문2]", context)
         draft = tool._pending_drafts[USER_ID]
-        assert draft["subject"] == "제목2"
-        assert draft["to"] == "b@b.com"
+        assert draft.subject == "제목2"
+        assert draft.to == "b@b.com"
 
 
 # ─── SMTP 유틸리티 ───
-# send_email 내부에서 `import src.config as config`로 로컬 임포트하므로
+# src.utils.email은 `import src.config as config`로 모듈을 참조하므로
 # src.config 모듈의 속성을 직접 patch해야 함
 
 class TestSendEmailUtility:
+    @pytest.fixture(autouse=True)
+    def _clear_smtp_sessions(self):
+        """캐시된 SMTP 세션이 다음 테스트의 mock으로 새지 않도록 비운다."""
+        from src.utils import email as email_utils
+        email_utils._smtp_sessions.clear()
+        yield
+        email_utils._smtp_sessions.clear()
+
     @pytest.mark.asyncio
     async def test_unsupported_provider_returns_error(self):
         from src.utils.email import send_email
@@ -305,12 +326,42 @@ class TestSendEmailUtility:
         with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
              patch("src.config.EMAIL_NAVER_PASSWORD", "secret"), \
              patch("smtplib.SMTP", return_value=mock_smtp):
-            mock_smtp.__enter__ = MagicMock(return_value=mock_smtp)
-            mock_smtp.__exit__ = MagicMock(return_value=False)
             result = await send_email("naver", "friend@naver.com", "제목", "본문")
         assert result["success"] is True
         assert "발송했습니다" in result["message"]
 
+    @pytest.mark.asyncio
+    async def test_session_reused_across_sends(self):
+        """살아 있는 세션은 재사용되어 접속/로그인을 한 번만 한다."""
+        from src.utils.email import send_email
+        mock_smtp = MagicMock()
+        mock_smtp.noop.return_value = (250, b"OK")
+        with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
+             patch("src.config.EMAIL_NAVER_PASSWORD", "secret"), \
+             patch("smtplib.SMTP", return_value=mock_smtp) as mock_cls:
+            await send_email("naver", "a@naver.com", "제목1", "본문1")
+            result = await send_email("naver", "b@naver.com", "제목2", "본문2")
+        assert result["success"] is True
+        assert mock_cls.call_count == 1
+        assert mock_smtp.login.call_count == 1
+        assert mock_smtp.sendmail.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_dead_session_reconnects(self):
+        """NOOP에 실패한 세션은 버리고 새로 접속한다."""
+        from src.utils.email import send_email
+        stale, fresh = MagicMock(), MagicMock()
+        stale.noop.side_effect = smtplib.SMTPServerDisconnected("closed")
+        with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
+             patch("src.config.EMAIL_NAVER_PASSWORD", "secret"), \
+             patch("smtplib.SMTP", side_effect=[stale, fresh]) as mock_cls:
+            await send_email("naver", "a@naver.com", "제목1", "본문1")
+            result = await send_email("naver", "b@naver.com", "제목2", "본문2")
+        assert result["success"] is True
+        assert mock_cls.call_count == 2
+        stale.close.assert_called_once()
+        fresh.sendmail.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_smtp_auth_error(self):
         from src.utils.email import send_email
@@ -319,8 +370,6 @@ class TestSendEmailUtility:
         with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
              patch("src.config.EMAIL_NAVER_PASSWORD", "wrong"), \
              patch("smtplib.SMTP", return_value=mock_smtp):
-            mock_smtp.__enter__ = MagicMock(return_value=mock_smtp)
-            mock_smtp.__exit__ = MagicMock(return_value=False)
             result = await send_email("naver", "a@b.com", "제목", "본문")
         assert result["success"] is False
         assert "인증 실패" in result["message"]
@@ -333,8 +382,6 @@ class TestSendEmailUtility:
         with patch("src.config.EMAIL_GMAIL_USER", "me@gmail.com"), \
              patch("src.config.EMAIL_GMAIL_PASSWORD", "pw"), \
              patch("smtplib.SMTP", return_value=mock_smtp):
-            mock_smtp.__enter__ = MagicMock(return_value=mock_smtp)
-            mock_smtp.__exit__ = MagicMock(return_value=False)
             result = await send_email("gmail", "bad@x.com", "제목", "본문")
         assert result["success"] is False
         assert "수신자" in result["message"]
@@ -354,8 +401,6 @@ class TestSendEmailUtility:
         """비밀번호가 로그에 노출되지 않는다."""
         from src.utils.email import send_email
         mock_smtp = MagicMock()
-        mock_smtp.__enter__ = MagicMock(return_value=mock_smtp)
-        mock_smtp.__exit__ = MagicMock(return_value=False)
         with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
              patch("src.config.EMAIL_NAVER_PASSWORD", "super_secret_pw"), \
              patch("smtplib.SMTP", return_value=mock_smtp), \
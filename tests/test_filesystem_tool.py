@@ -1,5 +1,6 @@
 """Tests for FileSystemTool — pattern matching, security, and file operations."""
 import pytest
+from types import MappingProxyType
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -8,6 +9,8 @@ from src.bot.tools import ToolContext
 
 
 USER_ID = "test_user_123"
+# FileSystemTool은 persona를 건드리지 않으므로 읽기 전용 빈 persona 하나를 공유
+_EMPTY_PERSONA = MappingProxyType({})
 
 
 @pytest.fixture
@@ -18,7 +21,7 @@ def tool():
 @pytest.fixture
 def context():
     db = MagicMock()
-    return ToolContext(user_id=USER_ID, db=db, persona={})
+    return ToolContext(user_id=USER_ID, db=db, persona=_EMPTY_PERSONA)
 
 
 @pytest.fixture
@@ -131,6 +134,21 @@ class TestFileSystemToolPatternMatching:
             await tool.try_execute(f"[FS_LS:  {ALLOWED_ROOT}/workspace  ]", context)
         assert captured["arg"] == f"{ALLOWED_ROOT}/workspace"
 
+    @pytest.mark.asyncio
+    async def test_tag_embedded_in_text(self, tool, context):
+        """LLM 응답 중간에 있는 태그도 감지된다."""
+        with patch.object(tool, "_read_file", return_value="파일 내용"):
+            result = await tool.try_execute(f"확인해볼게요. [FS_READ:{ALLOWED_ROOT}/a.txt] 잠시만요.", context)
+        assert result == "파일 내용"
+
+    @pytest.mark.asyncio
+    async def test_ls_takes_priority_even_when_nested(self, tool, context):
+        """다른 태그 인자 안에 있어도 FS_LS가 FS_INFO보다 우선한다."""
+        with patch.object(tool, "_list_dir", return_value="목록") as mock_ls:
+            result = await tool.try_execute(f"[FS_INFO:[FS_LS:{ALLOWED_ROOT}]", context)
+        assert result == "목록"
+        mock_ls.assert_called_once_with(ALLOWED_ROOT)
+
 
 # ─── 보안: _validate_path ───
 
@@ -179,6 +197,12 @@ class TestValidatePath:
         # (it starts with ALLOWED_ROOT + "2")
         assert result is None or not str(result).startswith(ALLOWED_ROOT + "/") and str(result) != ALLOWED_ROOT
 
+    def test_sibling_with_shared_prefix_denied(self, tool, tmp_path, allowed_root):
+        """문자열 접두사만 같은 형제 디렉터리는 거부된다."""
+        with patch("src.bot.tools.filesystem.ALLOWED_ROOT", allowed_root):
+            assert tool._validate_path(allowed_root + "2/evil") is None
+            assert tool._validate_path(f"{allowed_root}/sub") is not None
+
 
 # ─── _list_dir 동작 ───
 
@@ -193,6 +217,19 @@ class TestListDir:
 
         assert "file.txt" in result or "subdir" in result
 
+    def test_entries_sorted_and_capped(self, tool, tmp_path, allowed_root):
+        """항목은 이름순으로 정렬되고 50개를 넘으면 나머지 개수만 표시한다."""
+        for i in range(55):
+            (tmp_path / f"f{i:02d}.txt").write_text("")
+        (tmp_path / "a_dir").mkdir()
+        with patch("src.bot.tools.filesystem.ALLOWED_ROOT", allowed_root):
+            result = tool._list_dir(allowed_root)
+        lines = result.splitlines()
+        assert lines[2] == "[DIR] a_dir"
+        assert lines[3] == "[FILE] f00.txt"
+        assert "f48.txt" in result and "f49.txt" not in result
+        assert lines[-1] == "...외 6개"
+
     def test_empty_dir_shows_empty_message(self, tool, tmp_path, allowed_root):
         with patch("src.bot.tools.filesystem.ALLOWED_ROOT", allowed_root):
             result = tool._list_dir(str(tmp_path))
@@ -271,18 +308,51 @@ class TestFindFile:
 
     def test_pattern_with_matches(self, tool, tmp_path, allowed_root):
         (tmp_path / "report.pdf").write_text("pdf content")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "nested.pdf").write_text("pdf content")
+        (tmp_path / "notes.txt").write_text("text")
 
         with patch("src.bot.tools.filesystem.ALLOWED_ROOT", allowed_root):
-            with patch("src.bot.tools.filesystem.Path") as MockPath:
-                mock_root = MagicMock()
-                mock_file = MagicMock()
-                mock_file.is_dir.return_value = False
-                mock_file.__str__ = lambda s: str(tmp_path / "report.pdf")
-                mock_root.rglob.return_value = [mock_file]
-                MockPath.return_value = mock_root
-                result = tool._find_file("*.pdf")
+            result = tool._find_file("*.pdf")
 
         assert "검색" in result
+        assert f"[FILE] {tmp_path / 'report.pdf'}" in result
+        assert f"[FILE] {tmp_path / 'sub' / 'nested.pdf'}" in result
+        assert "notes.txt" not in result
+
+    def test_matching_directory_marked_dir(self, tool, tmp_path, allowed_root):
+        """이름이 일치하는 디렉터리도 [DIR]로 표시된다."""
+        (tmp_path / "project").mkdir()
+        with patch("src.bot.tools.filesystem.ALLOWED_ROOT", allowed_root):
+            result = tool._find_file("proj*")
+        assert f"[DIR] {tmp_path / 'project'}" in result
+
+    def test_stops_at_twenty_matches(self, tool, tmp_path, allowed_root):
+        """결과는 20개까지만 모으고 나머지는 '외 다수'로 표시한다."""
+        for i in range(25):
+            (tmp_path / f"log{i}.txt").write_text("")
+        with patch("src.bot.tools.filesystem.ALLOWED_ROOT", allowed_root):
+            result = tool._find_file("*.txt")
+        assert result.count("[FILE]") == 20
+        assert result.endswith("...외 다수")
+
+    @pytest.mark.parametrize("pattern", ["src/*.py", "**/config.py"])
+    def test_pattern_with_path_segments(self, tool, tmp_path, allowed_root, pattern):
+        """'/'가 들어간 패턴도 rglob처럼 경로 단위로 일치시킨다."""
+        (tmp_path / "a" / "src").mkdir(parents=True)
+        (tmp_path / "a" / "src" / "config.py").write_text("")
+        (tmp_path / "a" / "other.py").write_text("")
+        with patch("src.bot.tools.filesystem.ALLOWED_ROOT", allowed_root):
+            result = tool._find_file(pattern)
+        assert f"[FILE] {tmp_path / 'a' / 'src' / 'config.py'}" in result
+        assert "other.py" not in result
+
+    def test_parent_segment_pattern_matches_nothing(self, tool, tmp_path, allowed_root):
+        """'..'로 허용 경로 밖을 찾는 패턴은 결과가 없다."""
+        (tmp_path / "a").mkdir()
+        with patch("src.bot.tools.filesystem.ALLOWED_ROOT", allowed_root):
+            result = tool._find_file("a/../*")
+        assert "검색 결과 없음" in result
 
     def test_no_matches(self, tool, tmp_path, allowed_root):
         with patch("src.bot.tools.filesystem.ALLOWED_ROOT", allowed_root):
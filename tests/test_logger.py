@@ -1,8 +1,10 @@
 """Tests for src/utils/logger.py"""
 import logging
+from logging.handlers import QueueHandler
 
 import pytest
 
+import src.utils.logger as logger_module
 from src.utils.logger import setup_logger
 
 
@@ -43,7 +45,21 @@ class TestSetupLogger:
                           and not isinstance(h, logging.FileHandler)]
         assert len(stream_handlers) >= 1
 
-    def test_file_handler_exists(self):
+    def test_file_handler_behind_queue(self):
+        """파일 기록은 QueueHandler로 넘기고 백그라운드 리스너가 파일에 쓴다."""
         logger = setup_logger("test_file")
-        file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
-        assert len(file_handlers) >= 1
+        queue_handlers = [h for h in logger.handlers if isinstance(h, QueueHandler)]
+        assert len(queue_handlers) == 1
+        assert queue_handlers[0].queue is logger_module._LOG_QUEUE
+
+        listener = logger_module._listener
+        assert listener is not None
+        file_handlers = [h for h in listener.handlers if isinstance(h, logging.FileHandler)]
+        assert len(file_handlers) == 1
+
+    def test_loggers_share_one_listener(self):
+        """로거가 여러 개여도 파일 핸들러와 리스너는 하나만 사용한다."""
+        setup_logger("test_shared_a")
+        listener = logger_module._listener
+        setup_logger("test_shared_b")
+        assert logger_module._listener is listener
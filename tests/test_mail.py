@@ -1,5 +1,9 @@
 """Tests for mail notification — IMAP utility, MailDB, MailHandler."""
+import asyncio
 import imaplib
+import socket
+import threading
+import time
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -12,14 +16,40 @@ USER_ID = "test_user_123"
 OTHER_USER = "other_user_456"
 
 
+RAW_HEADER = b"From: sender@example.com\r\nSubject: Test Subject\r\nDate: Thu, 20 Feb 2026\r\n"
+
+
+def _uid_calls(imap, command: str) -> list[tuple]:
+    """FakeIMAP에 전달된 특정 UID 명령의 인자 목록."""
+    return [c[2:] for c in imap.calls if c[:2] == ("uid", command)]
+
+
+def _calls(imap, name: str) -> int:
+    """FakeIMAP에 특정 명령이 호출된 횟수."""
+    return sum(1 for c in imap.calls if c[0] == name)
+
+
 # ─── MailDB ───
 
 class TestMailDB:
+    pytestmark = pytest.mark.xdist_group(name=__qualname__)
+
     @pytest_asyncio.fixture
     async def mail_db(self, tmp_db):
         db = MailDB()
         db.db_path = tmp_db
-        return db
+        yield db
+        await db.close()
+
+    @pytest.mark.asyncio
+    async def test_connection_reused_across_calls(self, mail_db):
+        """메서드마다 새 연결을 열지 않고 풀의 연결을 재사용해야 함"""
+        await mail_db.set_enabled(USER_ID, True)
+        await mail_db.update_last_checked(USER_ID, "2026-02-20 10:00:00")
+        await mail_db.get_settings(USER_ID)
+        await mail_db.get_all_enabled()
+
+        assert len(mail_db._pool._connections) == 1
 
     @pytest.mark.asyncio
     async def test_get_settings_nonexistent_returns_none(self, mail_db):
@@ -48,6 +78,22 @@ class TestMailDB:
         result = await mail_db.get_settings(USER_ID)
         assert result["enabled"] is False  # 마지막 값
 
+    @pytest.mark.asyncio
+    async def test_concurrent_set_enabled_one_row(self, tmp_file_db):
+        """동시에 여러 번 호출해도 단일 upsert라 행은 하나만 생긴다.
+
+        shared-cache 메모리 DB는 동시 쓰기 시 busy 대기 없이 table lock 오류를
+        내므로, 실제 운영과 같은 WAL 파일 DB로 검증한다.
+        """
+        mail_db = MailDB()
+        mail_db.db_path = tmp_file_db
+        try:
+            await asyncio.gather(*(mail_db.set_enabled(USER_ID, True) for _ in range(10)))
+            rows = await mail_db.get_all_enabled()
+        finally:
+            await mail_db.close()
+        assert [r["user_id"] for r in rows] == [USER_ID]
+
     @pytest.mark.asyncio
     async def test_update_last_checked(self, mail_db):
         await mail_db.update_last_checked(USER_ID, "2026-02-20 10:00:00")
@@ -84,6 +130,24 @@ class TestMailDB:
         rows = await mail_db.get_all_enabled()
         assert rows[0]["last_checked"] == "2026-02-20 08:00:00"
 
+    @pytest.mark.asyncio
+    async def test_get_all_enabled_returns_plain_dicts(self, mail_db):
+        """Row 객체가 아닌 일반 dict로 돌려줘서 스레드 경계를 넘겨도 안전하다."""
+        await mail_db.set_enabled(USER_ID, True)
+        rows = await mail_db.get_all_enabled()
+        assert type(rows[0]) is dict
+        assert rows[0] == {"user_id": USER_ID, "last_checked": None}
+
+    @pytest.mark.asyncio
+    async def test_uid_anchor_roundtrip(self, mail_db):
+        """메일함별 (UIDVALIDITY, UIDNEXT)를 저장하고 덮어쓴다."""
+        assert await mail_db.get_uid_anchor("naver", "me@naver.com") is None
+        await mail_db.set_uid_anchor("naver", "me@naver.com", 7, 42)
+        await mail_db.set_uid_anchor("naver", "me@naver.com", 7, 50)
+        await mail_db.set_uid_anchor("gmail", "me@gmail.com", 3, 9)
+        assert await mail_db.get_uid_anchor("naver", "me@naver.com") == (7, 50)
+        assert await mail_db.get_uid_anchor("gmail", "me@gmail.com") == (3, 9)
+
     @pytest.mark.asyncio
     async def test_multiple_users_independent(self, mail_db):
         """여러 사용자 설정이 독립적으로 저장된다."""
@@ -96,6 +160,8 @@ class TestMailDB:
 # ─── MailHandler 명령어 파싱 ───
 
 class TestMailHandlerCommands:
+    pytestmark = pytest.mark.xdist_group(name=__qualname__)
+
     @pytest.fixture
     def mock_db(self):
         db = MagicMock()
@@ -168,10 +234,45 @@ class TestMailHandlerCommands:
         assert "boss@gmail.com" in reply_text
         assert "보고서" in reply_text
 
+    @pytest.mark.asyncio
+    async def test_check_and_reply_runs_providers_concurrently(self, handler, message):
+        """gmail/naver 확인이 순차가 아니라 동시에 진행된다."""
+        in_flight = peak = 0
+
+        async def fake_check(provider):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return []
+
+        with patch("src.bot.handlers.mail.check_new_mail", new=fake_check):
+            await handler._check_and_reply(message, USER_ID)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_check_and_reply_one_provider_fails(self, handler, message):
+        """한 provider가 예외를 내도 다른 provider 결과는 응답한다."""
+        mails = [{"from": "b@naver.com", "subject": "안녕", "date": "Tue"}]
+
+        async def fake_check(provider):
+            if provider == "gmail":
+                raise RuntimeError("boom")
+            return mails
+
+        with patch("src.bot.handlers.mail.check_new_mail", new=fake_check):
+            await handler._check_and_reply(message, USER_ID)
+        reply_text = message.reply.call_args[0][0]
+        assert "[NAVER]" in reply_text
+        assert "[GMAIL]" not in reply_text
+
 
 # ─── format_mail_notification ───
 
 class TestFormatMailNotification:
+    pytestmark = pytest.mark.xdist_group(name=__qualname__)
+
     def test_gmail_only(self):
         gmail = [{"from": "a@gmail.com", "subject": "Hello", "date": "Mon"}]
         result = MailHandler.format_mail_notification(gmail, [])
@@ -193,6 +294,17 @@ class TestFormatMailNotification:
         assert "[Gmail]" in result
         assert "[Naver]" in result
 
+    def test_many_mails_numbered_in_order(self):
+        """메일이 많아도 번호가 순서대로 이어지고 provider 블록이 분리된다."""
+        gmail = [{"from": f"g{i}@gmail.com", "subject": "S", "date": "D"} for i in range(1000)]
+        naver = [{"from": "n@naver.com", "subject": "N", "date": "D"}]
+        result = MailHandler.format_mail_notification(gmail, naver)
+        lines = result.splitlines()
+        assert lines[2] == "[Gmail]"
+        assert lines[3] == "1. g0@gmail.com - S (D)"
+        assert lines[1002] == "1000. g999@gmail.com - S (D)"
+        assert lines[1003:] == ["", "[Naver]", "1. n@naver.com - N (D)"]
+
     def test_notification_header(self):
         gmail = [{"from": "a@gmail.com", "subject": "S", "date": "D"}]
         result = MailHandler.format_mail_notification(gmail, [])
@@ -211,6 +323,18 @@ class TestFormatMailNotification:
 # ─── IMAP check_new_mail mock 테스트 ───
 
 class TestCheckNewMail:
+    pytestmark = pytest.mark.xdist_group(name=__qualname__)
+
+    @pytest.fixture(autouse=True)
+    def _clear_imap_sessions(self):
+        """캐시된 IMAP 세션이 다음 테스트의 mock으로 새지 않도록 비운다."""
+        from src.utils import email as email_utils
+        email_utils._imap_sessions.clear()
+        email_utils._uid_anchors.clear()
+        yield
+        email_utils._imap_sessions.clear()
+        email_utils._uid_anchors.clear()
+
     @pytest.mark.asyncio
     async def test_unsupported_provider_returns_empty(self):
         from src.utils.email import check_new_mail
@@ -226,37 +350,225 @@ class TestCheckNewMail:
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_successful_check_returns_mail_list(self):
+    async def test_successful_check_returns_mail_list(self, fake_imap):
         from src.utils.email import check_new_mail
-        mock_imap = MagicMock()
-        mock_imap.search.return_value = (None, [b"1 2 3"])
-        raw_header = b"From: sender@example.com\r\nSubject: Test Subject\r\nDate: Thu, 20 Feb 2026\r\n"
-        mock_imap.fetch.return_value = (None, [(None, raw_header)])
+        mock_imap = fake_imap({1: RAW_HEADER, 2: RAW_HEADER, 3: RAW_HEADER})
 
         with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
              patch("src.config.EMAIL_NAVER_PASSWORD", "pw"), \
              patch("imaplib.IMAP4_SSL", return_value=mock_imap):
-            mock_imap.__enter__ = MagicMock(return_value=mock_imap)
-            mock_imap.__exit__ = MagicMock(return_value=False)
             result = await check_new_mail("naver")
 
-        assert isinstance(result, list)
+        # 메일 ID를 한 번의 FETCH로 묶어서 요청한다
+        assert _uid_calls(mock_imap, "FETCH") == [
+            (b"1,2,3", "(BODY.PEEK[HEADER.FIELDS (FROM SUBJECT DATE)])")
+        ]
+        # 필요한 헤더 필드만, 읽음 표시 없이(PEEK) 가져온다
+        fetch_spec = _uid_calls(mock_imap, "FETCH")[0][1]
+        assert "BODY.PEEK[" in fetch_spec
+        assert "RFC822" not in fetch_spec
+        assert len(result) == 3
+        assert result[0] == {"from": "sender@example.com", "subject": "Test Subject", "date": "Thu, 20 Feb 2026"}
 
     @pytest.mark.asyncio
-    async def test_empty_inbox_returns_empty_list(self):
+    async def test_fetch_limited_to_latest_ten(self, fake_imap):
+        """미확인 메일이 많아도 최근 10개만 한 번에 조회한다."""
         from src.utils.email import check_new_mail
-        mock_imap = MagicMock()
-        mock_imap.search.return_value = (None, [b""])
+        mock_imap = fake_imap({i: RAW_HEADER for i in range(1, 16)})
+
+        with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
+             patch("src.config.EMAIL_NAVER_PASSWORD", "pw"), \
+             patch("imaplib.IMAP4_SSL", return_value=mock_imap):
+            await check_new_mail("naver")
+
+        id_set = _uid_calls(mock_imap, "FETCH")[0][0]
+        assert id_set == b"6,7,8,9,10,11,12,13,14,15"
+
+    @pytest.mark.asyncio
+    async def test_new_only_searches_past_last_reported_uid(self, fake_imap):
+        """new_only 조회는 직전에 알린 UID 이후의 메일만 서버에 요청한다."""
+        from src.utils import email as email_utils
+        mock_imap = fake_imap({40: RAW_HEADER, 41: RAW_HEADER})
+
+        with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
+             patch("src.config.EMAIL_NAVER_PASSWORD", "pw"), \
+             patch("imaplib.IMAP4_SSL", return_value=mock_imap):
+            await email_utils.check_new_mail("naver", new_only=True)
+            assert email_utils._uid_anchors[("naver", "me@naver.com")] == (1, 42)
+            await email_utils.check_new_mail("naver", new_only=True)
+
+        assert _uid_calls(mock_imap, "SEARCH") == [(None, "UNSEEN"), (None, "UID 42:* UNSEEN")]
+
+    @pytest.mark.asyncio
+    async def test_uid_search_skips_old_messages(self, fake_imap):
+        """UID N:* 범위가 돌려준 N 미만의 최신 메일은 새 메일로 보지 않는다."""
+        from src.utils import email as email_utils
+        email_utils._uid_anchors[("naver", "me@naver.com")] = (1, 42)
+        # 42 이상 UID가 없으면 서버는 가장 최근 메일(41)을 돌려준다
+        mock_imap = fake_imap({41: RAW_HEADER})
+
+        with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
+             patch("src.config.EMAIL_NAVER_PASSWORD", "pw"), \
+             patch("imaplib.IMAP4_SSL", return_value=mock_imap):
+            result = await email_utils.check_new_mail("naver", new_only=True)
+
+        assert result == []
+        assert _uid_calls(mock_imap, "FETCH") == []
+        assert email_utils._uid_anchors[("naver", "me@naver.com")] == (1, 42)
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_keeps_anchor(self, fake_imap):
+        """FETCH가 실패하면 기준 UID를 옮기지 않아 다음 확인에서 다시 알린다."""
+        from src.utils import email as email_utils
+        email_utils._uid_anchors[("naver", "me@naver.com")] = (1, 42)
+        mock_imap = fake_imap({42: RAW_HEADER, 43: RAW_HEADER})
+        search_and_fetch = mock_imap.uid
+
+        def failing_fetch(command, *args):
+            if command == "FETCH":
+                raise imaplib.IMAP4.abort("connection reset")
+            return search_and_fetch(command, *args)
+
+        mock_imap.uid = failing_fetch
+        with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
+             patch("src.config.EMAIL_NAVER_PASSWORD", "pw"), \
+             patch("imaplib.IMAP4_SSL", return_value=mock_imap):
+            result = await email_utils.check_new_mail("naver", new_only=True)
+
+        assert result == []
+        assert email_utils._uid_anchors[("naver", "me@naver.com")] == (1, 42)
+
+    @pytest.mark.asyncio
+    async def test_changed_uidvalidity_resets_anchor(self, fake_imap):
+        """UIDVALIDITY가 바뀌면 이전 기준 UID를 버리고 미확인 메일 전체를 본다."""
+        from src.utils import email as email_utils
+        email_utils._uid_anchors[("naver", "me@naver.com")] = (1, 42)
+        mock_imap = fake_imap({5: RAW_HEADER}, uidvalidity=2)
+
+        with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
+             patch("src.config.EMAIL_NAVER_PASSWORD", "pw"), \
+             patch("imaplib.IMAP4_SSL", return_value=mock_imap):
+            result = await email_utils.check_new_mail("naver", new_only=True)
+
+        assert len(result) == 1
+        assert _uid_calls(mock_imap, "SEARCH") == [(None, "UNSEEN")]
+        assert email_utils._uid_anchors[("naver", "me@naver.com")] == (2, 6)
+
+    @pytest.mark.asyncio
+    async def test_anchor_persisted_across_restart(self, fake_imap, tmp_db):
+        """store로 MailDB를 넘기면 기준 UID가 저장돼 재시작 후에도 이어서 확인한다."""
+        from src.utils import email as email_utils
+        store = MailDB()
+        store.db_path = tmp_db
+        mock_imap = fake_imap({40: RAW_HEADER, 41: RAW_HEADER})
+
+        try:
+            with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
+                 patch("src.config.EMAIL_NAVER_PASSWORD", "pw"), \
+                 patch("imaplib.IMAP4_SSL", return_value=mock_imap):
+                await email_utils.check_new_mail("naver", new_only=True, store=store)
+                # 재시작: 메모리의 기준 UID는 사라진다
+                email_utils._uid_anchors.clear()
+                result = await email_utils.check_new_mail("naver", new_only=True, store=store)
+            saved = await store.get_uid_anchor("naver", "me@naver.com")
+        finally:
+            await store.close()
+
+        assert result == []
+        assert _uid_calls(mock_imap, "SEARCH") == [(None, "UNSEEN"), (None, "UID 42:* UNSEEN")]
+        assert saved == (1, 42)
+
+    @pytest.mark.asyncio
+    async def test_default_check_lists_all_unseen(self, fake_imap):
+        """/mail 조회(new_only 아님)는 기준 UID와 무관하게 모든 미확인 메일을 본다."""
+        from src.utils import email as email_utils
+        email_utils._uid_anchors[("naver", "me@naver.com")] = (1, 42)
+        mock_imap = fake_imap({})
+
+        with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
+             patch("src.config.EMAIL_NAVER_PASSWORD", "pw"), \
+             patch("imaplib.IMAP4_SSL", return_value=mock_imap):
+            await email_utils.check_new_mail("naver")
+
+        assert _uid_calls(mock_imap, "SEARCH") == [(None, "UNSEEN")]
+
+    @pytest.mark.asyncio
+    async def test_empty_inbox_returns_empty_list(self, fake_imap):
+        from src.utils.email import check_new_mail
+        mock_imap = fake_imap({})
 
         with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
              patch("src.config.EMAIL_NAVER_PASSWORD", "pw"), \
              patch("imaplib.IMAP4_SSL", return_value=mock_imap):
-            mock_imap.__enter__ = MagicMock(return_value=mock_imap)
-            mock_imap.__exit__ = MagicMock(return_value=False)
             result = await check_new_mail("naver")
 
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_whole_poll_runs_in_one_thread_hop(self, fake_imap):
+        """IMAP 명령마다가 아니라 한 번의 to_thread로 전체 조회를 수행한다."""
+        from src.utils import email as email_utils
+        mock_imap = fake_imap({1: b"Subject: A\r\n"})
+
+        with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
+             patch("src.config.EMAIL_NAVER_PASSWORD", "pw"), \
+             patch("imaplib.IMAP4_SSL", return_value=mock_imap), \
+             patch.object(email_utils.asyncio, "to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+            result = await email_utils.check_new_mail("naver")
+
+        mock_to_thread.assert_called_once()
+        assert mock_to_thread.call_args[0][0] is email_utils._sync_check_new_mail
+        assert result[0]["subject"] == "A"
+
+    @pytest.mark.asyncio
+    async def test_second_call_reuses_connection(self, fake_imap):
+        """연속 호출 시 로그인된 IMAP 세션을 재사용한다."""
+        from src.utils.email import check_new_mail
+        mock_imap = fake_imap({})
+
+        with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
+             patch("src.config.EMAIL_NAVER_PASSWORD", "pw"), \
+             patch("imaplib.IMAP4_SSL", return_value=mock_imap) as mock_cls:
+            await check_new_mail("naver")
+            await check_new_mail("naver")
+
+        assert mock_cls.call_count == 1
+        assert _calls(mock_imap, "login") == 1
+        assert _calls(mock_imap, "select") == 2
+
+    @pytest.mark.asyncio
+    async def test_idle_session_reconnects(self, fake_imap):
+        """유휴 시간이 TTL을 넘은 세션은 버리고 새로 접속한다."""
+        from src.utils import email as email_utils
+        stale = MagicMock()
+        fresh = fake_imap({})
+        key = ("naver", "me@naver.com")
+        email_utils._imap_sessions[key] = (stale, time.monotonic() - email_utils.IMAP_IDLE_TTL - 1)
+
+        with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
+             patch("src.config.EMAIL_NAVER_PASSWORD", "pw"), \
+             patch("imaplib.IMAP4_SSL", return_value=fresh):
+            await email_utils.check_new_mail("naver")
+
+        stale.noop.assert_not_called()
+        stale.logout.assert_called_once()
+        assert email_utils._imap_sessions[key][0] is fresh
+
+    @pytest.mark.asyncio
+    async def test_error_drops_cached_session(self):
+        """IMAP 오류가 나면 캐시된 세션을 버린다."""
+        from src.utils import email as email_utils
+        mock_imap = MagicMock()
+        mock_imap.select.side_effect = imaplib.IMAP4.abort("socket closed")
+
+        with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
+             patch("src.config.EMAIL_NAVER_PASSWORD", "pw"), \
+             patch("imaplib.IMAP4_SSL", return_value=mock_imap):
+            result = await email_utils.check_new_mail("naver")
+
+        assert result == []
+        assert email_utils._imap_sessions == {}
+
     @pytest.mark.asyncio
     async def test_imap_error_returns_empty_list(self):
         """IMAP 오류 발생 시 빈 리스트 반환 (예외 전파 없음)."""
@@ -304,6 +616,34 @@ class TestCheckNewMail:
         assert result == []  # 자격증명 없음 → 빈 리스트
 
 
+# ─── _parse_header_fields ───
+
+class TestParseHeaderFields:
+    def test_three_fields(self):
+        from src.utils.email import _parse_header_fields
+        result = _parse_header_fields(RAW_HEADER + b"\r\n")
+        assert result == {"from": "sender@example.com", "subject": "Test Subject", "date": "Thu, 20 Feb 2026"}
+
+    def test_folded_subject_unfolded(self):
+        """여러 줄로 접힌 인코딩 제목도 한 줄로 펼쳐 디코딩한다."""
+        from src.utils.email import _parse_header_fields
+        raw = (
+            b"Subject: =?UTF-8?B?7ZqM7J2YIOyekOujjA==?=\r\n"
+            b" =?UTF-8?B?IOqzteycoA==?=\r\n"
+            b"From: boss@example.com\r\n"
+            b"Date: Fri, 21 Feb 2026\r\n\r\n"
+        )
+        result = _parse_header_fields(raw)
+        assert result["subject"] == "회의 자료 공유"
+        assert result["from"] == "boss@example.com"
+        assert result["date"] == "Fri, 21 Feb 2026"
+
+    def test_missing_fields_default_empty(self):
+        from src.utils.email import _parse_header_fields
+        result = _parse_header_fields(b"subject: lower case\r\n")
+        assert result == {"from": "", "subject": "lower case", "date": ""}
+
+
 # ─── _decode_header_value ───
 
 class TestDecodeHeaderValue:
@@ -326,12 +666,27 @@ class TestDecodeHeaderValue:
         result = _decode_header_value("Test Subject")
         assert "Test Subject" in result
 
+    def test_plain_value_skips_decode_header(self):
+        """encoded-word가 없으면 decode_header를 거치지 않고 그대로 반환한다."""
+        from src.utils.email import _decode_header_value
+        with patch("src.utils.email.decode_header") as mock_decode:
+            result = _decode_header_value("보고서 제출 <boss@example.com>")
+        mock_decode.assert_not_called()
+        assert result == "보고서 제출 <boss@example.com>"
+
+    def test_mixed_plain_and_encoded(self):
+        """일반 텍스트와 encoded-word가 섞여 있어도 디코딩한다."""
+        from src.utils.email import _decode_header_value
+        result = _decode_header_value("=?UTF-8?B?7JWI64WV?= <a@b.com>")
+        assert result.startswith("안녕")
+        assert "a@b.com" in result
+
 
 # ─── check_mail 루프 패턴 코드 리뷰 ───
 
 class TestCheckMailLoopPattern:
     def test_check_mail_loop_interval_is_30_minutes(self):
-        """check_mail 루프는 30분 간격으로 설정되어야 한다."""
+        """IDLE 미지원 provider용 폴백 check_mail 루프는 30분 간격으로 설정되어야 한다."""
         import inspect
         from src.bot.client import PersonalAssistantBot
         # tasks.loop decorator의 minutes 인자 확인
@@ -347,3 +702,216 @@ class TestCheckMailLoopPattern:
         src = inspect.getsource(PersonalAssistantBot.__init__)
         assert "mail_handler" in src
         assert "MailHandler" in src
+
+    def test_setup_hook_starts_idle_watchers(self):
+        """setup_hook은 폴링 루프 대신 provider별 IDLE 감시 태스크를 시작한다."""
+        import inspect
+        from src.bot.client import PersonalAssistantBot
+        src = inspect.getsource(PersonalAssistantBot.setup_hook)
+        assert "_watch_mail" in src
+        assert "check_mail.start" not in src
+
+
+class TestNotifyNewMail:
+    @pytest.fixture(autouse=True)
+    def _clear_imap_state(self):
+        from src.utils import email as email_utils
+        email_utils._imap_sessions.clear()
+        email_utils._uid_anchors.clear()
+        yield
+        email_utils._imap_sessions.clear()
+        email_utils._uid_anchors.clear()
+
+    @pytest.mark.asyncio
+    async def test_one_connection_per_provider_for_many_users(self, fake_imap):
+        """알림 대상 사용자가 많아도 provider마다 IMAP 연결은 하나만 연다."""
+        from types import SimpleNamespace
+        from src.bot.client import PersonalAssistantBot
+
+        users = [{"user_id": str(i), "last_checked": None} for i in range(5)]
+        db = MagicMock()
+        db.mail = AsyncMock()
+        db.mail.get_all_enabled.return_value = users
+        db.mail.get_uid_anchor.return_value = None
+        discord_user = AsyncMock()
+        bot = SimpleNamespace(db=db, fetch_user=AsyncMock(return_value=discord_user))
+
+        with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
+             patch("src.config.EMAIL_NAVER_PASSWORD", "pw"), \
+             patch("src.config.EMAIL_GMAIL_USER", "me@gmail.com"), \
+             patch("src.config.EMAIL_GMAIL_PASSWORD", "pw"), \
+             patch("imaplib.IMAP4_SSL", side_effect=lambda *a, **k: fake_imap({1: RAW_HEADER})) as mock_cls:
+            await PersonalAssistantBot._notify_new_mail(bot, ("gmail", "naver"))
+
+        assert mock_cls.call_count == 2
+        assert discord_user.send.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_unconfigured_provider_not_polled(self):
+        """자격 증명이 없는 provider는 IDLE 감시도, 폴링 대상 등록도 하지 않는다."""
+        from types import SimpleNamespace
+        from src.bot.client import PersonalAssistantBot
+
+        bot = SimpleNamespace(
+            wait_until_ready=AsyncMock(),
+            _poll_providers=set(),
+            check_mail=MagicMock(),
+        )
+        with patch("src.config.EMAIL_NAVER_USER", ""), \
+             patch("src.config.EMAIL_NAVER_PASSWORD", ""), \
+             patch("src.bot.client.watch_new_mail") as mock_watch:
+            await PersonalAssistantBot._watch_mail(bot, "naver")
+
+        mock_watch.assert_not_called()
+        assert bot._poll_providers == set()
+        bot.check_mail.start.assert_not_called()
+
+
+# ─── IMAP IDLE ───
+
+class TestImapIdle:
+    @pytest.fixture(autouse=True)
+    def _clear_idle_sessions(self):
+        from src.utils import email as email_utils
+        email_utils._idle_sessions.clear()
+        yield
+        email_utils._idle_sessions.clear()
+
+    @pytest.fixture
+    def idle_conn(self):
+        """소켓쌍 위의 _IdleIMAP4_SSL과, IDLE/DONE에 정해진 응답을 보내는 서버 스레드.
+
+        on_idle의 각 조각은 따로 전송되고, 한 조각 안의 여러 줄은 한 번에 도착한다.
+        """
+        from src.utils.email import _IdleIMAP4_SSL
+        sockets = []
+
+        def make(on_idle: list[bytes], on_done: bytes = b"A1 OK IDLE terminated\r\n"):
+            client, server = socket.socketpair()
+            sockets.extend((client, server))
+            imap = _IdleIMAP4_SSL.__new__(_IdleIMAP4_SSL)
+            imap.sock = client
+            imap.file = client.makefile("rb")
+            imap._new_tag = lambda: b"A1"
+
+            def serve():
+                for line in server.makefile("rb"):
+                    if line == b"A1 IDLE\r\n":
+                        for chunk in on_idle:
+                            server.sendall(chunk)
+                            time.sleep(0.02)
+                    elif line == b"DONE\r\n":
+                        server.sendall(on_done)
+                        return
+
+            threading.Thread(target=serve, daemon=True).start()
+            return imap
+
+        yield make
+        for sock in sockets:
+            sock.close()
+
+    def test_exists_during_idle_reports_new_mail(self, idle_conn):
+        """IDLE 중 EXISTS 응답이 오면 select가 깨어나 DONE 후 True를 반환한다."""
+        imap = idle_conn([b"+ idling\r\n", b"* 5 EXISTS\r\n"])
+        assert imap.idle(5) is True
+
+    def test_timeout_without_activity_returns_false(self, idle_conn):
+        """아무 응답 없이 타임아웃되면 False를 반환한다."""
+        imap = idle_conn([b"+ idling\r\n"])
+        assert imap.idle(0.05) is False
+
+    def test_response_buffered_with_continuation_skips_select(self, idle_conn):
+        """'+ idling'과 같은 레코드로 온 EXISTS가 readline 버퍼에 있으면 select로 기다리지 않는다."""
+        imap = idle_conn([b"+ idling\r\n* 7 EXISTS\r\n"])
+        with patch("select.select", side_effect=AssertionError("select on buffered data")):
+            assert imap.idle(60) is True
+
+    def test_wake_socket_ends_idle(self, idle_conn):
+        """wake 소켓에 데이터가 오면 타임아웃 전에 IDLE을 끝낸다."""
+        imap = idle_conn([b"+ idling\r\n"])
+        wake_r, wake_w = socket.socketpair()
+        with wake_r, wake_w:
+            wake_w.send(b"\0")
+            started = time.monotonic()
+            assert imap.idle(60, wake_r) is False
+        assert time.monotonic() - started < 5
+
+    def test_rejected_idle_raises(self, idle_conn):
+        """서버가 IDLE을 거부하면 IMAP4.error를 발생시킨다."""
+        imap = idle_conn([b"A1 BAD unknown command\r\n"])
+        with pytest.raises(imaplib.IMAP4.error):
+            imap.idle(60)
+
+    @pytest.mark.asyncio
+    async def test_watch_returns_without_credentials(self):
+        from src.utils.email import watch_new_mail
+        on_new = AsyncMock()
+        with patch("src.config.EMAIL_NAVER_USER", ""), \
+             patch("src.config.EMAIL_NAVER_PASSWORD", ""), \
+             patch("src.utils.email._IdleIMAP4_SSL") as mock_cls:
+            await watch_new_mail("naver", on_new)
+        mock_cls.assert_not_called()
+        on_new.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_watch_returns_when_idle_unsupported(self):
+        """서버 CAPABILITY에 IDLE이 없으면 로그아웃 후 바로 반환한다 (폴링으로 폴백)."""
+        from src.utils.email import watch_new_mail
+        mock_imap = MagicMock()
+        mock_imap.capability.return_value = ("OK", [b"IMAP4rev1 UNSELECT NAMESPACE"])
+        on_new = AsyncMock()
+        with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
+             patch("src.config.EMAIL_NAVER_PASSWORD", "pw"), \
+             patch("src.utils.email._IdleIMAP4_SSL", return_value=mock_imap):
+            await watch_new_mail("naver", on_new)
+        mock_imap.logout.assert_called_once()
+        on_new.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_watch_calls_back_on_new_mail(self):
+        """IDLE이 새 메일을 알리면 콜백을 호출하고, 종료 시 연결을 정리한다."""
+        from src.utils import email as email_utils
+        mock_imap = MagicMock()
+        mock_imap.capability.return_value = ("OK", [b"IMAP4rev1 IDLE"])
+        mock_imap.idle.return_value = True
+        # 콜백이 예외를 내면 감시 루프가 끝나므로 한 번만 돌고 멈춘다
+        on_new = AsyncMock(side_effect=RuntimeError("stop"))
+        with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
+             patch("src.config.EMAIL_NAVER_PASSWORD", "pw"), \
+             patch.object(email_utils, "_IdleIMAP4_SSL", return_value=mock_imap):
+            with pytest.raises(RuntimeError):
+                await email_utils.watch_new_mail("naver", on_new)
+        on_new.assert_awaited_once()
+        mock_imap.select.assert_called_once_with("INBOX")
+        mock_imap.logout.assert_called_once()
+        assert email_utils._idle_sessions == {}
+
+    @pytest.mark.asyncio
+    async def test_cancel_wakes_idle_and_logs_out(self):
+        """감시 태스크를 취소하면 IDLE 대기를 깨워 끝낸 뒤 로그아웃한다."""
+        from src.utils import email as email_utils
+        mock_imap = MagicMock()
+        mock_imap.capability.return_value = ("OK", [b"IMAP4rev1 IDLE"])
+        finished = []
+
+        def fake_idle(timeout, wake):
+            # 실제 IDLE처럼 wake 소켓이 읽힐 때까지 스레드에서 기다린다
+            wake.recv(1)
+            finished.append(True)
+            return False
+
+        mock_imap.idle.side_effect = fake_idle
+        with patch("src.config.EMAIL_NAVER_USER", "me@naver.com"), \
+             patch("src.config.EMAIL_NAVER_PASSWORD", "pw"), \
+             patch.object(email_utils, "_IdleIMAP4_SSL", return_value=mock_imap):
+            task = asyncio.create_task(email_utils.watch_new_mail("naver", AsyncMock()))
+            while "naver" not in email_utils._idle_sessions:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert finished == [True]
+        mock_imap.logout.assert_called_once()
+        assert email_utils._idle_sessions == {}
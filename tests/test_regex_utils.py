@@ -0,0 +1,24 @@
+"""Tests for src/utils/regex.py - regex engine selection"""
+import re
+
+import pytest
+
+from src.utils.regex import WHITESPACE, engine
+
+
+class TestWhitespace:
+    @pytest.mark.parametrize("char", [
+        " ", "\t", "\n", "\u00a0", "\u2003", "\u200b", "\u3000", "\ufeff",
+    ], ids=["space", "tab", "newline", "nbsp", "em_space", "zero_width", "fullwidth", "bom"])
+    def test_matches_unicode_space(self, char):
+        """설치된 엔진(re2든 re든)에서 ASCII 공백과 유니코드 공백 모두 일치"""
+        assert engine.fullmatch(f"[{WHITESPACE}]", char)
+
+    @pytest.mark.parametrize("char", ["a", "가", ".", "/"])
+    def test_does_not_match_text(self, char):
+        assert engine.fullmatch(f"[{WHITESPACE}]", char) is None
+
+    def test_same_split_as_stdlib_re(self):
+        """엔진과 무관하게 표준 re와 같은 위치에서 나눈다"""
+        text = "a\u3000b\xa0c d\u2003e\tf"
+        assert engine.split(f"[{WHITESPACE}]+", text) == re.split(f"[{WHITESPACE}]+", text)
@@ -9,15 +9,12 @@ from src.bot.tools.persona import PersonaTool
 from src.bot.tools.reminder import ReminderTool
 from src.bot.tools.search import SearchTool
 from src.bot.tools.weather import WeatherTool
-from src.llm.ollama_client import OllamaClient
 
 
-@pytest.fixture
-def client():
-    return OllamaClient()
+# 도구 안내 문자열은 항상 같으므로 모듈 단위로 한 번만 만든다
+# (OllamaClient는 conftest의 세션 공용 ollama_client 픽스처 사용)
 
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tool_instructions():
     """Build tool instructions from the full registry (all 7 tools)."""
     registry = ToolRegistry()
@@ -31,129 +28,123 @@ def tool_instructions():
     return registry.build_tool_instructions()
 
 
-class TestSystemPromptToolInstructions:
-    """시스템 프롬프트에 모든 도구 안내가 포함되는지 확인"""
-
-    def test_contains_weather_instructions(self, client, tool_instructions):
-        prompt = client.build_system_prompt(tool_instructions=tool_instructions)
-        assert "[WEATHER:" in prompt
-
-    def test_contains_exchange_instructions(self, client, tool_instructions):
-        prompt = client.build_system_prompt(tool_instructions=tool_instructions)
-        assert "[EXCHANGE:" in prompt
-
-    def test_contains_reminder_instructions(self, client, tool_instructions):
-        prompt = client.build_system_prompt(tool_instructions=tool_instructions)
-        assert "[REMINDER:" in prompt
-
-    def test_contains_persona_instructions(self, client, tool_instructions):
-        prompt = client.build_system_prompt(tool_instructions=tool_instructions)
-        assert "[PERSONA:" in prompt
-
-    def test_contains_memo_save_instructions(self, client, tool_instructions):
-        prompt = client.build_system_prompt(tool_instructions=tool_instructions)
-        assert "[MEMO_SAVE:" in prompt
+@pytest.fixture(scope="module")
+def prompt(ollama_client, tool_instructions):
+    """Default (persona-less) system prompt with every tool's instructions."""
+    return ollama_client.build_system_prompt(tool_instructions=tool_instructions)
 
-    def test_contains_memo_list_instructions(self, client, tool_instructions):
-        prompt = client.build_system_prompt(tool_instructions=tool_instructions)
-        assert "[MEMO_LIST]" in prompt
 
-    def test_contains_memo_search_instructions(self, client, tool_instructions):
-        prompt = client.build_system_prompt(tool_instructions=tool_instructions)
-        assert "[MEMO_SEARCH:" in prompt
-
-    def test_contains_memo_del_instructions(self, client, tool_instructions):
-        prompt = client.build_system_prompt(tool_instructions=tool_instructions)
-        assert "[MEMO_DEL:" in prompt
-
-    def test_contains_search_instructions(self, client, tool_instructions):
-        prompt = client.build_system_prompt(tool_instructions=tool_instructions)
-        assert "[SEARCH:" in prompt
+class TestSystemPromptToolInstructions:
+    """시스템 프롬프트에 모든 도구 안내가 포함되는지 확인"""
 
-    def test_contains_memo_usage_rules(self, client, tool_instructions):
+    @pytest.mark.parametrize("tag", [
+        "[WEATHER:",
+        "[EXCHANGE:",
+        "[REMINDER:",
+        "[PERSONA:",
+        "[MEMO_SAVE:",
+        "[MEMO_LIST]",
+        "[MEMO_SEARCH:",
+        "[MEMO_DEL:",
+        "[SEARCH:",
+    ])
+    def test_contains_tool_tag(self, prompt, tag):
+        assert tag in prompt
+
+    def test_contains_memo_usage_rules(self, prompt):
         """메모 사용 규칙이 포함되는지"""
-        prompt = client.build_system_prompt(tool_instructions=tool_instructions)
         assert "메모해줘" in prompt or "memo" in prompt.lower()
 
-    def test_contains_search_usage_rules(self, client, tool_instructions):
+    def test_contains_search_usage_rules(self, prompt):
         """검색 사용 규칙이 포함되는지"""
-        prompt = client.build_system_prompt(tool_instructions=tool_instructions)
         assert "검색" in prompt or "search" in prompt.lower()
 
-    def test_contains_translation_rule(self, client, tool_instructions):
+    def test_contains_translation_rule(self, prompt):
         """번역 관련 규칙이 포함되는지 (번역은 도구 태그 없이 직접)"""
-        prompt = client.build_system_prompt(tool_instructions=tool_instructions)
         assert "번역" in prompt or "translat" in prompt.lower()
 
-    def test_memo_del_uses_position_not_id(self, client, tool_instructions):
+    def test_memo_del_uses_position_not_id(self, prompt):
         """MEMO_DEL 안내가 position 기반으로 변경되었는지"""
-        prompt = client.build_system_prompt(tool_instructions=tool_instructions)
         assert "position" in prompt.lower()
 
 
 class TestSystemPromptWithPersona:
-    def test_persona_included(self, client):
+    def test_persona_included(self, ollama_client):
         persona = {"name": "뽀삐", "role": "개인 비서", "tone": "친근한 반말"}
-        prompt = client.build_system_prompt(persona)
+        prompt = ollama_client.build_system_prompt(persona)
         assert "뽀삐" in prompt
         assert "개인 비서" in prompt
         assert "친근한 반말" in prompt
 
-    def test_persona_includes_tool_instructions(self, client, tool_instructions):
+    def test_persona_includes_tool_instructions(self, ollama_client, tool_instructions):
         """페르소나가 있어도 도구 안내는 포함되어야 함"""
         persona = {"name": "뽀삐", "role": "비서", "tone": "반말"}
-        prompt = client.build_system_prompt(persona, tool_instructions=tool_instructions)
+        prompt = ollama_client.build_system_prompt(persona, tool_instructions=tool_instructions)
         assert "[MEMO_SAVE:" in prompt
         assert "[SEARCH:" in prompt
 
-    def test_no_persona(self, client):
-        prompt = client.build_system_prompt(None)
+    def test_no_persona(self, ollama_client):
+        prompt = ollama_client.build_system_prompt(None)
         assert "personal AI assistant" in prompt
 
+    def test_build_system_prompt_is_cached(self, ollama_client, tool_instructions):
+        """같은 페르소나/요약/도구 안내면 캐시된 같은 문자열을 돌려준다."""
+        first = ollama_client.build_system_prompt({"name": "뽀삐", "role": "비서", "tone": "반말"}, tool_instructions=tool_instructions)
+        second = ollama_client.build_system_prompt({"name": "뽀삐", "role": "비서", "tone": "반말"}, tool_instructions=tool_instructions)
+        assert first is second
+
+    def test_default_prompt_returned_as_same_object(self, ollama_client):
+        """인자 없는 기본 프롬프트는 매번 다시 만들지 않고 같은 객체를 돌려준다."""
+        assert ollama_client.build_system_prompt() is ollama_client.build_system_prompt()
+
+    def test_changed_persona_not_served_from_cache(self, ollama_client):
+        """페르소나가 바뀌면 새 프롬프트를 만든다."""
+        before = ollama_client.build_system_prompt({"name": "뽀삐", "role": "비서", "tone": "반말"})
+        after = ollama_client.build_system_prompt({"name": "뽀삐", "role": "비서", "tone": "존댓말"})
+        assert "존댓말" in after
+        assert "존댓말" not in before
+
 
 class TestSystemPromptBriefingInstructions:
     """시스템 프롬프트에 브리핑 도구 안내가 포함되는지 확인"""
 
-    def test_contains_briefing_set_tag(self, client, tool_instructions):
-        prompt = client.build_system_prompt(tool_instructions=tool_instructions)
+    def test_contains_briefing_set_tag(self, prompt):
         assert "[BRIEFING_SET:" in prompt
 
-    def test_contains_briefing_get_tag(self, client, tool_instructions):
-        prompt = client.build_system_prompt(tool_instructions=tool_instructions)
+    def test_contains_briefing_get_tag(self, prompt):
         assert "[BRIEFING_GET]" in prompt
 
-    def test_contains_briefing_usage_rules(self, client, tool_instructions):
+    def test_contains_briefing_usage_rules(self, prompt):
         """브리핑 사용 규칙이 포함되는지"""
-        prompt = client.build_system_prompt(tool_instructions=tool_instructions)
         assert "브리핑" in prompt or "briefing" in prompt.lower()
 
 
 class TestSystemPromptSummaryInjection:
     """대화 요약이 시스템 프롬프트에 올바르게 주입되는지 확인"""
 
-    def test_summary_injected_when_provided(self, client):
+    def test_summary_injected_when_provided(self, ollama_client):
         summary = "사용자 이름은 김철수이고 파이썬 프로젝트를 진행 중이다."
-        prompt = client.build_system_prompt(summary=summary)
+        prompt = ollama_client.build_system_prompt(summary=summary)
         assert "[이전 대화 요약]" in prompt
         assert summary in prompt
 
-    def test_no_summary_section_when_none(self, client):
-        prompt = client.build_system_prompt(summary=None)
+    def test_no_summary_section_when_none(self, ollama_client):
+        prompt = ollama_client.build_system_prompt(summary=None)
         assert "[이전 대화 요약]" not in prompt
 
-    def test_summary_injected_with_persona(self, client):
+    def test_summary_injected_with_persona(self, ollama_client):
         persona = {"name": "제이", "role": "비서", "tone": "존댓말"}
         summary = "사용자는 매일 아침 브리핑을 선호한다."
-        prompt = client.build_system_prompt(persona=persona, summary=summary)
+        prompt = ollama_client.build_system_prompt(persona=persona, summary=summary)
         assert "[이전 대화 요약]" in prompt
         assert summary in prompt
         assert "제이" in prompt
 
-    def test_summary_context_instruction_included(self, client):
-        prompt = client.build_system_prompt(summary="테스트 요약")
+    def test_summary_context_instruction_included(self, ollama_client):
+        prompt = ollama_client.build_system_prompt(summary="테스트 요약")
         assert "이 맥락을 참고하여" in prompt
 
-    def test_empty_summary_not_injected(self, client):
+    def test_empty_summary_not_injected(self, ollama_client):
         """빈 문자열 summary는 주입되지 않는다."""
-        prompt = client.build_system_prompt(summary="")
+        prompt = ollama_client.build_system_prompt(summary="")
         assert "[이전 대화 요약]" not in prompt
@@ -1,79 +1,31 @@
 """Tests for src/utils/time_parser.py"""
 from datetime import datetime, timedelta
-from unittest.mock import patch
 
 import pytest
 
 from src.utils.time_parser import parse_time, format_datetime, validate_time_format
 
 
+NOW = datetime(2026, 2, 13, 10, 0, 0)
+
+
 # ─── parse_time: 상대 시간 ───
 
 class TestParseTimeRelative:
     """상대 시간 표현 파싱 테스트"""
 
-    @patch("src.utils.time_parser.datetime")
-    def test_minutes(self, mock_dt):
-        now = datetime(2026, 2, 13, 10, 0, 0)
-        mock_dt.now.return_value = now
-        mock_dt.side_effect = lambda *a, **k: datetime(*a, **k)
-
-        result = parse_time("30분")
-        assert result == now + timedelta(minutes=30)
-
-    @patch("src.utils.time_parser.datetime")
-    def test_minutes_with_suffix(self, mock_dt):
-        now = datetime(2026, 2, 13, 10, 0, 0)
-        mock_dt.now.return_value = now
-        mock_dt.side_effect = lambda *a, **k: datetime(*a, **k)
-
-        result = parse_time("30분 후")
-        assert result == now + timedelta(minutes=30)
-
-    @patch("src.utils.time_parser.datetime")
-    def test_hours(self, mock_dt):
-        now = datetime(2026, 2, 13, 10, 0, 0)
-        mock_dt.now.return_value = now
-        mock_dt.side_effect = lambda *a, **k: datetime(*a, **k)
-
-        result = parse_time("2시간")
-        assert result == now + timedelta(hours=2)
-
-    @patch("src.utils.time_parser.datetime")
-    def test_hours_with_suffix(self, mock_dt):
-        now = datetime(2026, 2, 13, 10, 0, 0)
-        mock_dt.now.return_value = now
-        mock_dt.side_effect = lambda *a, **k: datetime(*a, **k)
-
-        result = parse_time("1시간 후")
-        assert result == now + timedelta(hours=1)
-
-    @patch("src.utils.time_parser.datetime")
-    def test_hours_and_minutes(self, mock_dt):
-        now = datetime(2026, 2, 13, 10, 0, 0)
-        mock_dt.now.return_value = now
-        mock_dt.side_effect = lambda *a, **k: datetime(*a, **k)
-
-        result = parse_time("1시간 30분")
-        assert result == now + timedelta(hours=1, minutes=30)
-
-    @patch("src.utils.time_parser.datetime")
-    def test_days(self, mock_dt):
-        now = datetime(2026, 2, 13, 10, 0, 0)
-        mock_dt.now.return_value = now
-        mock_dt.side_effect = lambda *a, **k: datetime(*a, **k)
-
-        result = parse_time("3일")
-        assert result == now + timedelta(days=3)
-
-    @patch("src.utils.time_parser.datetime")
-    def test_days_with_suffix(self, mock_dt):
-        now = datetime(2026, 2, 13, 10, 0, 0)
-        mock_dt.now.return_value = now
-        mock_dt.side_effect = lambda *a, **k: datetime(*a, **k)
-
-        result = parse_time("1일 후")
-        assert result == now + timedelta(days=1)
+    @pytest.mark.parametrize("text, delta", [
+        ("30분", timedelta(minutes=30)),
+        ("30분 후", timedelta(minutes=30)),
+        ("2시간", timedelta(hours=2)),
+        ("1시간 후", timedelta(hours=1)),
+        ("1시간 30분", timedelta(hours=1, minutes=30)),
+        ("2시간30분 후", timedelta(hours=2, minutes=30)),
+        ("3일", timedelta(days=3)),
+        ("1일 후", timedelta(days=1)),
+    ])
+    def test_relative(self, text, delta):
+        assert parse_time(text, now=NOW) == NOW + delta
 
 
 # ─── parse_time: 절대 시간 ───
@@ -81,96 +33,24 @@ class TestParseTimeRelative:
 class TestParseTimeAbsolute:
     """절대 시간 표현 파싱 테스트"""
 
-    @patch("src.utils.time_parser.datetime")
-    def test_colon_format_future(self, mock_dt):
-        """14:00 형식 - 미래 시간"""
-        now = datetime(2026, 2, 13, 10, 0, 0)
-        mock_dt.now.return_value = now
-        mock_dt.side_effect = lambda *a, **k: datetime(*a, **k)
-
-        result = parse_time("14:00")
-        assert result == datetime(2026, 2, 13, 14, 0, 0)
-
-    @patch("src.utils.time_parser.datetime")
-    def test_colon_format_past_wraps_to_next_day(self, mock_dt):
-        """과거 시간이면 다음 날로"""
-        now = datetime(2026, 2, 13, 15, 0, 0)
-        mock_dt.now.return_value = now
-        mock_dt.side_effect = lambda *a, **k: datetime(*a, **k)
-
-        result = parse_time("14:00")
-        assert result == datetime(2026, 2, 14, 14, 0, 0)
-
-    @patch("src.utils.time_parser.datetime")
-    def test_korean_hour_only(self, mock_dt):
-        """14시 형식"""
-        now = datetime(2026, 2, 13, 10, 0, 0)
-        mock_dt.now.return_value = now
-        mock_dt.side_effect = lambda *a, **k: datetime(*a, **k)
-
-        result = parse_time("14시")
-        assert result == datetime(2026, 2, 13, 14, 0, 0)
-
-    @patch("src.utils.time_parser.datetime")
-    def test_korean_hour_minute(self, mock_dt):
-        """14시 30분 형식"""
-        now = datetime(2026, 2, 13, 10, 0, 0)
-        mock_dt.now.return_value = now
-        mock_dt.side_effect = lambda *a, **k: datetime(*a, **k)
-
-        result = parse_time("14시 30분")
-        assert result == datetime(2026, 2, 13, 14, 30, 0)
-
-    @patch("src.utils.time_parser.datetime")
-    def test_am_pm_afternoon(self, mock_dt):
-        """오후 2시 -> 14시"""
-        now = datetime(2026, 2, 13, 10, 0, 0)
-        mock_dt.now.return_value = now
-        mock_dt.side_effect = lambda *a, **k: datetime(*a, **k)
-
-        result = parse_time("오후 2시")
-        assert result == datetime(2026, 2, 13, 14, 0, 0)
-
-    @patch("src.utils.time_parser.datetime")
-    def test_am_pm_morning(self, mock_dt):
-        """오전 9시"""
-        now = datetime(2026, 2, 13, 8, 0, 0)
-        mock_dt.now.return_value = now
-        mock_dt.side_effect = lambda *a, **k: datetime(*a, **k)
-
-        result = parse_time("오전 9시")
-        assert result == datetime(2026, 2, 13, 9, 0, 0)
-
-    @patch("src.utils.time_parser.datetime")
-    def test_am_12_is_midnight(self, mock_dt):
-        """오전 12시 = 0시 (자정)"""
-        now = datetime(2026, 2, 13, 10, 0, 0)
-        mock_dt.now.return_value = now
-        mock_dt.side_effect = lambda *a, **k: datetime(*a, **k)
-
-        result = parse_time("오전 12시")
-        # 오전 12시 = 0시, 현재 10시이므로 다음 날 0시
-        assert result == datetime(2026, 2, 14, 0, 0, 0)
-
-    @patch("src.utils.time_parser.datetime")
-    def test_pm_12_is_noon(self, mock_dt):
-        """오후 12시 = 12시 (정오)"""
-        now = datetime(2026, 2, 13, 10, 0, 0)
-        mock_dt.now.return_value = now
-        mock_dt.side_effect = lambda *a, **k: datetime(*a, **k)
-
-        result = parse_time("오후 12시")
-        assert result == datetime(2026, 2, 13, 12, 0, 0)
-
-    @patch("src.utils.time_parser.datetime")
-    def test_pm_with_minutes(self, mock_dt):
-        """오후 2시 30분"""
-        now = datetime(2026, 2, 13, 10, 0, 0)
-        mock_dt.now.return_value = now
-        mock_dt.side_effect = lambda *a, **k: datetime(*a, **k)
-
-        result = parse_time("오후 2시 30분")
-        assert result == datetime(2026, 2, 13, 14, 30, 0)
+    @pytest.mark.parametrize("text, now, expected", [
+        # 14:00 형식 - 미래 시간
+        ("14:00", NOW, datetime(2026, 2, 13, 14, 0, 0)),
+        # 과거 시간이면 다음 날로
+        ("14:00", datetime(2026, 2, 13, 15, 0, 0), datetime(2026, 2, 14, 14, 0, 0)),
+        ("14시", NOW, datetime(2026, 2, 13, 14, 0, 0)),
+        ("14시 30분", NOW, datetime(2026, 2, 13, 14, 30, 0)),
+        # 오후 2시 -> 14시
+        ("오후 2시", NOW, datetime(2026, 2, 13, 14, 0, 0)),
+        ("오전 9시", datetime(2026, 2, 13, 8, 0, 0), datetime(2026, 2, 13, 9, 0, 0)),
+        # 오전 12시 = 0시 (자정), 현재 10시이므로 다음 날 0시
+        ("오전 12시", NOW, datetime(2026, 2, 14, 0, 0, 0)),
+        # 오후 12시 = 12시 (정오)
+        ("오후 12시", NOW, datetime(2026, 2, 13, 12, 0, 0)),
+        ("오후 2시 30분", NOW, datetime(2026, 2, 13, 14, 30, 0)),
+    ])
+    def test_absolute(self, text, now, expected):
+        assert parse_time(text, now=now) == expected
 
 
 # ─── parse_time: 엣지 케이스 ───
@@ -190,6 +70,52 @@ class TestParseTimeEdgeCases:
     def test_random_text_returns_none(self):
         assert parse_time("hello world") is None
 
+    def test_suffix_in_middle_returns_none(self):
+        """'후'는 맨 끝에만 올 수 있다."""
+        assert parse_time("1시간 후 30분") is None
+
+    def test_unit_without_number_returns_none(self):
+        assert parse_time("시간 후") is None
+
+    def test_free_text_not_cached(self):
+        """숫자/오전/오후로 시작하지 않는 입력은 정규식과 캐시를 거치지 않는다"""
+        from src.utils.time_parser import _parse_time_spec
+        _parse_time_spec.cache_clear()
+        for text in ("", "   ", "내일 아침", "hello world"):
+            assert parse_time(text) is None
+        assert _parse_time_spec.cache_info().currsize == 0
+
+
+# ─── parse_time: 캐시 ───
+
+class TestParseTimeCache:
+    """문구 파싱만 캐시하고 현재 시각은 호출마다 반영한다"""
+
+    def test_defaults_to_current_time(self):
+        before = datetime.now()
+        result = parse_time("30분")
+        after = datetime.now()
+        assert before + timedelta(minutes=30) <= result <= after + timedelta(minutes=30)
+
+    def test_cached_phrase_uses_current_now(self):
+        first = parse_time("30분", now=NOW)
+        second = parse_time("30분", now=datetime(2026, 2, 13, 10, 7, 42))
+
+        assert first == datetime(2026, 2, 13, 10, 30, 0)
+        assert second == datetime(2026, 2, 13, 10, 37, 42)
+
+    def test_cached_clock_time_still_wraps(self):
+        assert parse_time("오후 2시", now=NOW) == datetime(2026, 2, 13, 14, 0, 0)
+        assert parse_time("오후 2시", now=datetime(2026, 2, 13, 15, 0, 0)) == datetime(2026, 2, 14, 14, 0, 0)
+
+    def test_phrase_parsed_once(self):
+        from src.utils.time_parser import _parse_time_spec
+        _parse_time_spec.cache_clear()
+        parse_time("2시간 30분")
+        parse_time("  2시간 30분 ")
+        info = _parse_time_spec.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
 
 # ─── format_datetime ───
 
@@ -205,6 +131,14 @@ class TestFormatDatetime:
         dt = datetime(2026, 1, 1, 0, 0, 0)
         assert format_datetime(dt) == "01/01 00:00"
 
+    def test_with_db_timestamp_string(self):
+        """DB에 저장된 공백 구분 타임스탬프도 처리"""
+        assert format_datetime("2026-12-31 23:59:59") == "12/31 23:59"
+
+    def test_matches_strftime(self):
+        dt = datetime(2026, 7, 4, 9, 5, 0)
+        assert format_datetime(dt) == dt.strftime("%m/%d %H:%M")
+
 
 # ─── validate_time_format ───
 
@@ -271,6 +205,20 @@ class TestValidateTimeFormat:
         is_valid, err = validate_time_format("-1:00")
         assert is_valid is False
 
+    def test_single_digit_hour_valid(self):
+        """기존처럼 한 자리 시도 허용한다."""
+        is_valid, err = validate_time_format("8:00")
+        assert is_valid is True
+
+    def test_surrounding_whitespace_invalid(self):
+        is_valid, err = validate_time_format(" 8:00")
+        assert is_valid is False
+
+    def test_non_ascii_digits_invalid(self):
+        """int()가 받아들이는 전각/아라비아 숫자도 거부한다."""
+        is_valid, err = validate_time_format("１２:３０")
+        assert is_valid is False
+
     def test_returns_tuple(self):
         """반환 타입이 항상 (bool, str|None) 튜플"""
         result = validate_time_format("08:00")
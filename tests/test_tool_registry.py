@@ -15,6 +15,12 @@ from src.bot.tools.weather import WeatherTool
 ALL_TOOLS = [WeatherTool, ExchangeTool, ReminderTool, PersonaTool, MemoTool, SearchTool, BriefingTool, FileSystemTool, EmailTool]
 
 
+@pytest.fixture(scope="module")
+def tool_instances():
+    """도구 클래스마다 인스턴스 하나 — 읽기 전용 검사에서 재사용"""
+    return {cls: cls() for cls in ALL_TOOLS}
+
+
 # ─── Registration ───
 
 class TestToolRegistryRegistration:
@@ -37,10 +43,32 @@ class TestToolRegistryRegistration:
         tools1 = registry.tools
         tools2 = registry.tools
         assert tools1 is not tools2  # 별도 복사본
+        assert isinstance(tools1, tuple)  # 호출자가 수정할 수 없음
 
     def test_empty_registry(self):
         registry = ToolRegistry()
-        assert registry.tools == []
+        assert registry.tools == ()
+
+    def test_get_by_name(self):
+        registry = ToolRegistry()
+        weather = WeatherTool()
+        registry.register(weather)
+        registry.register(EmailTool())
+        assert registry.get("weather") is weather
+        assert registry.get("email").name == "email"
+
+    def test_get_unknown_returns_none(self):
+        registry = ToolRegistry()
+        registry.register(WeatherTool())
+        assert registry.get("nope") is None
+
+    def test_get_returns_first_registered(self):
+        """같은 이름이 두 번 등록되면 tools 순회와 마찬가지로 먼저 등록된 도구"""
+        registry = ToolRegistry()
+        first = WeatherTool()
+        registry.register(first)
+        registry.register(WeatherTool())
+        assert registry.get("weather") is first
 
     def test_all_seven_tools(self):
         """7개 도구 모두 등록 가능"""
@@ -165,6 +193,18 @@ class TestToolRegistryBuildInstructions:
         assert "Weather" in instructions
         assert "Search" in instructions
 
+    def test_instructions_cached_until_register(self):
+        """같은 레지스트리에서는 캐시된 문자열을 재사용하고, 도구 등록 시 다시 만든다."""
+        registry = ToolRegistry()
+        registry.register(WeatherTool())
+        first = registry.build_tool_instructions()
+        assert registry.build_tool_instructions() is first
+
+        registry.register(SearchTool())
+        rebuilt = registry.build_tool_instructions()
+        assert rebuilt is not first
+        assert "[SEARCH:" in rebuilt
+
 
 # ─── Iteration and ordering ───
 
@@ -202,18 +242,25 @@ class TestToolAbcCompliance:
     """각 Tool 클래스가 ABC 계약을 올바르게 구현하는지 확인"""
 
     @pytest.mark.parametrize("tool_cls", ALL_TOOLS)
-    def test_name_property_is_string(self, tool_cls):
-        tool = tool_cls()
+    def test_name_property_is_string(self, tool_instances, tool_cls):
+        tool = tool_instances[tool_cls]
         assert isinstance(tool.name, str)
         assert len(tool.name) > 0
 
     @pytest.mark.parametrize("tool_cls", ALL_TOOLS)
-    def test_description_property_is_string(self, tool_cls):
-        tool = tool_cls()
+    def test_description_property_is_string(self, tool_instances, tool_cls):
+        tool = tool_instances[tool_cls]
         assert isinstance(tool.description, str)
         assert len(tool.description) > 0
 
     @pytest.mark.parametrize("tool_cls", ALL_TOOLS)
-    def test_usage_rules_property_is_string(self, tool_cls):
-        tool = tool_cls()
+    def test_usage_rules_property_is_string(self, tool_instances, tool_cls):
+        tool = tool_instances[tool_cls]
         assert isinstance(tool.usage_rules, str)  # may be empty string
+
+    @pytest.mark.parametrize("tool_cls", ALL_TOOLS)
+    def test_prompt_text_not_rebuilt_per_access(self, tool_instances, tool_cls):
+        """description/usage_rules는 상수 문자열이라 접근할 때마다 새로 만들지 않는다"""
+        first, second = tool_instances[tool_cls], tool_cls()
+        assert first.description is second.description
+        assert first.usage_rules is second.usage_rules
@@ -1,4 +1,6 @@
 """Tests for src/utils/weather.py - pure function tests"""
+from types import MappingProxyType
+
 import pytest
 
 from src.utils.weather import _parse_weather, format_weather, _get_uvi_level, CITY_MAP, WMO_CODES
@@ -7,57 +9,50 @@ from src.utils.weather import _parse_weather, format_weather, _get_uvi_level, CI
 # ─── _get_uvi_level ───
 
 class TestGetUviLevel:
-    def test_low(self):
-        assert _get_uvi_level(0) == "낮음"
-        assert _get_uvi_level(2) == "낮음"
-
-    def test_moderate(self):
-        assert _get_uvi_level(3) == "보통"
-        assert _get_uvi_level(5) == "보통"
-
-    def test_high(self):
-        assert _get_uvi_level(6) == "높음"
-        assert _get_uvi_level(7) == "높음"
+    @pytest.mark.parametrize("uvi, expected", [
+        (0, "낮음"), (2, "낮음"),
+        (3, "보통"), (5, "보통"),
+        (6, "높음"), (7, "높음"),
+        (8, "매우 높음"), (10, "매우 높음"),
+        (11, "위험"), (15, "위험"),
+        # 음수 UVI도 '낮음'으로 처리되어야 함
+        (-1, "낮음"),
+        # 소수점 UVI는 경계값을 넘으면 다음 단계
+        (2.5, "보통"), (5.1, "높음"), (7.9, "매우 높음"), (10.1, "위험"),
+    ])
+    def test_uvi_level(self, uvi, expected):
+        assert _get_uvi_level(uvi) == expected
 
-    def test_very_high(self):
-        assert _get_uvi_level(8) == "매우 높음"
-        assert _get_uvi_level(10) == "매우 높음"
 
-    def test_extreme(self):
-        assert _get_uvi_level(11) == "위험"
-        assert _get_uvi_level(15) == "위험"
-
-    def test_negative_is_low(self):
-        """음수 UVI도 '낮음'으로 처리되어야 함"""
-        assert _get_uvi_level(-1) == "낮음"
+# ─── _parse_weather ───
 
+# Open-Meteo API 응답 형태 — 읽기 전용으로 공유하고, 바꿀 부분만 복사한다
+_BASE_API_RESPONSE = MappingProxyType({
+    "current": MappingProxyType({
+        "temperature_2m": 3.2,
+        "apparent_temperature": -1.0,
+        "relative_humidity_2m": 45,
+        "wind_speed_10m": 5.3,
+        "weather_code": 0,
+    }),
+    "daily": MappingProxyType({
+        "temperature_2m_min": (0.5,),
+        "temperature_2m_max": (7.8,),
+        "uv_index_max": (3.5,),
+        "precipitation_probability_max": (10,),
+    }),
+})
 
-# ─── _parse_weather ───
 
 class TestParseWeather:
     def _make_api_response(self, **overrides):
-        """Open-Meteo API 응답 형태의 테스트 데이터 생성"""
-        data = {
-            "current": {
-                "temperature_2m": 3.2,
-                "apparent_temperature": -1.0,
-                "relative_humidity_2m": 45,
-                "wind_speed_10m": 5.3,
-                "weather_code": 0,
-            },
-            "daily": {
-                "temperature_2m_min": [0.5],
-                "temperature_2m_max": [7.8],
-                "uv_index_max": [3.5],
-                "precipitation_probability_max": [10],
-            },
-        }
+        """수정 가능한 테스트 데이터 — current만 복사하고 daily는 공유"""
+        data = {"current": dict(_BASE_API_RESPONSE["current"]), "daily": _BASE_API_RESPONSE["daily"]}
         data.update(overrides)
         return data
 
     def test_basic_parsing(self):
-        data = self._make_api_response()
-        result = _parse_weather(data, "서울")
+        result = _parse_weather(_BASE_API_RESPONSE, "서울")
 
         assert result["city"] == "서울"
         assert result["temp"] == 3.2
@@ -76,6 +71,26 @@ class TestParseWeather:
         result = _parse_weather(data, "서울")
         assert "알 수 없음" in result["description"]
 
+    def test_unassigned_code_in_range(self):
+        """0-99 범위지만 정의되지 않은 코드도 코드와 함께 알 수 없음으로 표시"""
+        data = self._make_api_response()
+        data["current"]["weather_code"] = 50
+        result = _parse_weather(data, "서울")
+        assert result["description"] == "알 수 없음 (50)"
+
+    def test_negative_code(self):
+        data = self._make_api_response()
+        data["current"]["weather_code"] = -1
+        result = _parse_weather(data, "서울")
+        assert result["description"] == "알 수 없음 (-1)"
+
+    def test_float_weather_code(self):
+        """정수값인 float 코드(3.0)도 같은 날씨로 표시"""
+        data = self._make_api_response()
+        data["current"]["weather_code"] = 3.0
+        result = _parse_weather(data, "서울")
+        assert result["description"] == "흐림 ☁️"
+
     def test_missing_daily_data(self):
         """daily 데이터가 없는 경우"""
         data = self._make_api_response()
@@ -185,3 +200,8 @@ class TestWmoCodes:
         assert 71 in WMO_CODES  # 약한 눈
         assert 73 in WMO_CODES  # 눈
         assert 75 in WMO_CODES  # 강한 눈
+
+    def test_lookup_table_matches_dict(self):
+        from src.utils.weather import _WMO_BY_CODE
+        for code, description in WMO_CODES.items():
+            assert _WMO_BY_CODE[code] == description
@@ -1,68 +1,130 @@
 """Tests for src/utils/web.py - URL extraction tests"""
 import re
+from itertools import islice
+from unittest.mock import patch
+
 import pytest
 
-from src.utils.web import extract_urls, URL_PATTERN
+from src.utils.web import extract_urls, extract_urls_iter, URL_PATTERN
 
 
 class TestExtractUrls:
-    def test_single_http_url(self):
-        text = "Visit http://example.com for more info"
-        urls = extract_urls(text)
-        assert urls == ["http://example.com"]
-
-    def test_single_https_url(self):
-        text = "Visit https://example.com for more info"
-        urls = extract_urls(text)
-        assert urls == ["https://example.com"]
-
-    def test_url_with_path(self):
-        text = "Go to https://example.com/path/to/page"
-        urls = extract_urls(text)
-        assert urls == ["https://example.com/path/to/page"]
-
-    def test_url_with_query_params(self):
-        text = "Search https://example.com/search?q=test&lang=ko"
-        urls = extract_urls(text)
-        assert len(urls) == 1
-        assert "q=test" in urls[0]
-
-    def test_multiple_urls(self):
-        text = "Check https://a.com and https://b.com"
-        urls = extract_urls(text)
-        assert len(urls) == 2
-
-    def test_no_urls(self):
-        text = "This is just plain text without URLs"
-        urls = extract_urls(text)
-        assert urls == []
-
-    def test_empty_string(self):
-        urls = extract_urls("")
-        assert urls == []
-
-    def test_url_with_fragment(self):
-        text = "See https://example.com/page#section"
-        urls = extract_urls(text)
-        assert len(urls) == 1
-
-    def test_korean_text_with_url(self):
-        text = "이 링크를 확인해봐: https://naver.com/news/12345"
-        urls = extract_urls(text)
-        assert len(urls) == 1
-        assert "naver.com" in urls[0]
+    @pytest.mark.parametrize("text, expected", [
+        ("Visit http://example.com for more info", ["http://example.com"]),
+        ("Visit https://example.com for more info", ["https://example.com"]),
+        ("Go to https://example.com/path/to/page", ["https://example.com/path/to/page"]),
+        ("Search https://example.com/search?q=test&lang=ko", ["https://example.com/search?q=test&lang=ko"]),
+        ("Check https://a.com and https://b.com", ["https://a.com", "https://b.com"]),
+        ("This is just plain text without URLs", []),
+        ("", []),
+        ("See https://example.com/page#section", ["https://example.com/page#section"]),
+        ("이 링크를 확인해봐: https://naver.com/news/12345", ["https://naver.com/news/12345"]),
+        ("see https://a.com.", ["https://a.com"]),
+        ("https://a.com/x?y=1, 그리고", ["https://a.com/x?y=1"]),
+        ("진짜? https://a.com/c...!", ["https://a.com/c"]),
+        ("'https://a.com'", ["https://a.com"]),
+        ("https://en.wikipedia.org/wiki/Foo_(bar)", ["https://en.wikipedia.org/wiki/Foo_(bar)"]),
+        ("https://ko.wikipedia.org/wiki/서울 참고", ["https://ko.wikipedia.org/wiki/서울"]),
+        ("(https://a.com)", ["https://a.com"]),
+        ("(참고: https://a.com/x.)", ["https://a.com/x"]),
+        ("(https://en.wikipedia.org/wiki/Foo_(bar))", ["https://en.wikipedia.org/wiki/Foo_(bar)"]),
+        ("https://a.com\u3000다음 문장", ["https://a.com"]),
+        ("https://a.com\xa0next", ["https://a.com"]),
+        ("https://a.com\u2003https://b.com", ["https://a.com", "https://b.com"]),
+    ], ids=[
+        "http", "https", "path", "query_params", "multiple",
+        "no_urls", "empty", "fragment", "korean_text",
+        "trailing_period", "trailing_comma", "trailing_punctuation_run",
+        "single_quoted", "parentheses_kept", "korean_path_kept",
+        "wrapped_in_parentheses", "wrapped_with_period", "wrapped_balanced_parentheses",
+        "fullwidth_space", "nbsp", "em_space",
+    ])
+    def test_extract(self, text, expected):
+        assert extract_urls(text) == expected
+
+    def test_iter_matches_list(self):
+        text = "https://b.com https://a.com. https://b.com 그리고 https://c.com/서울"
+        assert list(extract_urls_iter(text)) == extract_urls(text)
+
+    def test_iter_short_circuit(self):
+        """앞의 몇 개만 필요하면 나머지 매칭은 하지 않는다"""
+        text = " ".join(f"https://site{i}.com" for i in range(1000))
+        consumed = []
+
+        def counting_finditer(t):
+            for match in URL_PATTERN.finditer(t):
+                consumed.append(match)
+                yield match
+
+        with patch("src.utils.web.URL_PATTERN") as mock_pattern:
+            mock_pattern.finditer.side_effect = counting_finditer
+            first = list(islice(extract_urls_iter(text), 3))
+
+        assert first == ["https://site0.com", "https://site1.com", "https://site2.com"]
+        assert len(consumed) == 3
+
+    def test_no_scheme_separator_skips_regex(self):
+        """'://'가 없으면 정규식을 실행하지 않는다"""
+        with patch("src.utils.web.URL_PATTERN") as mock_pattern:
+            assert extract_urls("링크 없는 평범한 메시지 http: 도 아님") == []
+        mock_pattern.finditer.assert_not_called()
+
+    def test_duplicate_urls_deduplicated(self):
+        """같은 URL은 한 번만, 처음 나온 순서대로"""
+        text = "https://b.com 그리고 https://a.com 다시 https://b.com"
+        assert extract_urls(text) == ["https://b.com", "https://a.com"]
+
+    def test_case_preserved(self):
+        """경로는 대소문자를 구분하므로 소문자로 바꾸지 않는다"""
+        assert extract_urls("https://a.com/Doc https://a.com/doc") == ["https://a.com/Doc", "https://a.com/doc"]
+
+    def test_very_long_url(self):
+        """아주 긴 입력도 한 번에 끝까지 매칭"""
+        url = "https://" + "a" * 100_000
+        assert extract_urls(f"{url} 끝") == [url]
+
+    def test_many_scheme_fragments(self):
+        """매칭에 실패하는 접두사가 반복돼도 결과가 정확해야 함"""
+        text = "http:/" * 20_000 + " https://ok.com"
+        assert extract_urls(text) == ["https://ok.com"]
 
 
 class TestUrlPattern:
-    def test_matches_http(self):
-        assert URL_PATTERN.search("http://example.com")
-
-    def test_matches_https(self):
-        assert URL_PATTERN.search("https://example.com")
-
-    def test_no_match_ftp(self):
-        """ftp:// 는 매칭하지 않아야 함"""
-        assert URL_PATTERN.search("ftp://example.com") is None
-
-    def test_no_match_plain_text(self):
-        assert URL_PATTERN.search("just some text") is None
+    @pytest.mark.parametrize("text, expected", [
+        ("http://example.com", True),
+        ("https://example.com", True),
+        # ftp:// 는 매칭하지 않아야 함
+        ("ftp://example.com", False),
+        ("just some text", False),
+    ], ids=["http", "https", "no_ftp", "no_plain_text"])
+    def test_url_pattern(self, text, expected):
+        assert (URL_PATTERN.search(text) is not None) is expected
+
+    def test_same_matches_as_stdlib_re(self):
+        """re2가 설치돼 있어도 표준 re와 같은 URL을 찾는다 (유니코드 공백 포함)"""
+        text = "a https://a.com\u3000b https://b.com\xa0c https://c.com/서울\u2003d"
+        assert URL_PATTERN.findall(text) == re.findall(URL_PATTERN.pattern, text)
+
+
+try:
+    import pytest_benchmark  # noqa: F401
+    HAS_BENCHMARK = True
+except ImportError:
+    HAS_BENCHMARK = False
+
+
+class TestExtractUrlsLargeText:
+    # URL이 없는 약 1MB 한글/영문 텍스트
+    BLOB = "오늘 회의록 정리 meeting notes without links. " * 25_000
+
+    def test_large_text_without_urls(self):
+        assert extract_urls(self.BLOB) == []
+
+    def test_url_at_end_of_large_text(self):
+        assert extract_urls(self.BLOB + "https://example.com/end") == ["https://example.com/end"]
+
+    @pytest.mark.benchmark(group="url", warmup=True, warmup_iterations=200)
+    @pytest.mark.skipif(not HAS_BENCHMARK, reason="pytest-benchmark not installed")
+    def test_extract_benchmark(self, benchmark):
+        """opt-in: pytest-benchmark 설치 시에만 실행 (1MB 텍스트에서 URL 추출)"""
+        benchmark(extract_urls, self.BLOB)